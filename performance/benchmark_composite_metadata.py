@@ -0,0 +1,82 @@
+import sys
+from time import perf_counter
+
+from rsocket.extensions.authentication import AuthenticationSimple
+from rsocket.extensions.authentication_content import AuthenticationContent
+from rsocket.extensions.composite_metadata import CompositeMetadata, ImmutableCompositeMetadata
+from rsocket.extensions.mimetypes import WellKnownMimeTypes
+from rsocket.extensions.routing import RoutingMetadata
+from rsocket.extensions.stream_data_mimetype import StreamDataMimetype
+
+
+def build_composite_metadata() -> CompositeMetadata:
+    return CompositeMetadata([
+        RoutingMetadata([b'orders.create']),
+        StreamDataMimetype(WellKnownMimeTypes.APPLICATION_JSON),
+        AuthenticationContent(AuthenticationSimple('user', 'password')),
+    ])
+
+
+def measure_serialize_per_second(operation_count: int) -> float:
+    composite_metadata = build_composite_metadata()
+
+    start = perf_counter()
+    for _ in range(operation_count):
+        composite_metadata.serialize()
+    elapsed = perf_counter() - start
+
+    return operation_count / elapsed
+
+
+def measure_template_serialize_per_second(operation_count: int) -> float:
+    template = ImmutableCompositeMetadata(
+        StreamDataMimetype(WellKnownMimeTypes.APPLICATION_JSON),
+        AuthenticationContent(AuthenticationSimple('user', 'password')))
+    route = RoutingMetadata([b'orders.create'])
+
+    start = perf_counter()
+    for _ in range(operation_count):
+        template.serialize_with(route)
+    elapsed = perf_counter() - start
+
+    return operation_count / elapsed
+
+
+def measure_parse_per_second(operation_count: int) -> float:
+    serialized = build_composite_metadata().serialize()
+
+    start = perf_counter()
+    for _ in range(operation_count):
+        CompositeMetadata().parse(serialized)
+    elapsed = perf_counter() - start
+
+    return operation_count / elapsed
+
+
+def measure_lazy_parse_find_route_per_second(operation_count: int) -> float:
+    serialized = build_composite_metadata().serialize()
+
+    start = perf_counter()
+    for _ in range(operation_count):
+        composite_metadata = CompositeMetadata()
+        composite_metadata.parse(serialized, lazy=True)
+        composite_metadata.find_first(WellKnownMimeTypes.MESSAGE_RSOCKET_ROUTING)
+    elapsed = perf_counter() - start
+
+    return operation_count / elapsed
+
+
+def main(operation_counts):
+    for operation_count in operation_counts:
+        print('%d operations: serialize %.0f ops/sec, template + route serialize %.0f ops/sec, '
+              'parse %.0f ops/sec, lazy parse and find route %.0f ops/sec' % (
+                  operation_count,
+                  measure_serialize_per_second(operation_count),
+                  measure_template_serialize_per_second(operation_count),
+                  measure_parse_per_second(operation_count),
+                  measure_lazy_parse_find_route_per_second(operation_count)))
+
+
+if __name__ == '__main__':
+    counts = [int(count) for count in sys.argv[1:]] or [10000, 100000]
+    main(counts)
@@ -0,0 +1,45 @@
+import sys
+from time import perf_counter
+
+from rsocket.frame import PayloadFrame
+from rsocket.frame_fragment_cache import FrameFragmentCache
+
+
+def build_fragments(payload_size: int, fragment_size: int):
+    fragment_data = b'x' * fragment_size
+    fragments = []
+
+    for offset in range(0, payload_size, fragment_size):
+        frame = PayloadFrame()
+        frame.stream_id = 1
+        frame.data = fragment_data
+        frame.flags_next = True
+        frame.flags_follows = offset + fragment_size < payload_size
+        frame.flags_complete = not frame.flags_follows
+        fragments.append(frame)
+
+    return fragments
+
+
+def measure(payload_size: int, fragment_size: int) -> float:
+    fragments = build_fragments(payload_size, fragment_size)
+    cache = FrameFragmentCache()
+
+    start = perf_counter()
+    for fragment in fragments:
+        frame = cache.append(fragment)
+    elapsed = perf_counter() - start
+
+    assert len(frame.data) == payload_size
+    return elapsed
+
+
+def main(payload_size_mib: int, fragment_size_kib: int):
+    elapsed = measure(payload_size_mib * 1024 * 1024, fragment_size_kib * 1024)
+    print('%d MiB from %d KiB fragments: %.3f s (%.1f MiB/s)' % (
+        payload_size_mib, fragment_size_kib, elapsed, payload_size_mib / elapsed))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 64,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 16)
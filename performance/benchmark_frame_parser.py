@@ -0,0 +1,38 @@
+import asyncio
+import sys
+from time import perf_counter
+
+from rsocket.frame import serialize_with_frame_size_header
+from rsocket.frame_builders import to_payload_frame
+from rsocket.frame_parser import FrameParser
+from rsocket.payload import Payload
+
+
+def build_buffer(frame_count: int) -> bytes:
+    frame = to_payload_frame(1, Payload(b'data', b'metadata'))
+    return serialize_with_frame_size_header(frame) * frame_count
+
+
+async def measure_frames_per_second(frame_count: int) -> float:
+    data = build_buffer(frame_count)
+    parser = FrameParser()
+
+    start = perf_counter()
+    received = 0
+    async for _ in parser.receive_data(data):
+        received += 1
+    elapsed = perf_counter() - start
+
+    assert received == frame_count
+    return frame_count / elapsed
+
+
+async def main(frame_counts):
+    for frame_count in frame_counts:
+        frames_per_second = await measure_frames_per_second(frame_count)
+        print('%d frames in one buffer: %.0f frames/sec' % (frame_count, frames_per_second))
+
+
+if __name__ == '__main__':
+    counts = [int(count) for count in sys.argv[1:]] or [1000, 10000, 100000]
+    asyncio.run(main(counts))
@@ -0,0 +1,78 @@
+import asyncio
+import sys
+import tracemalloc
+from time import process_time
+
+from rsocket.timer import TimerQueue
+
+
+class TaskConnection:
+    """Keepalive send and liveness check as sleeping tasks, one of each per connection."""
+
+    def __init__(self, period: float):
+        self.period = period
+        self.sent = 0
+        self.tasks = [asyncio.create_task(self.send_keepalive()), asyncio.create_task(self.check_liveness())]
+
+    async def send_keepalive(self):
+        while True:
+            await asyncio.sleep(self.period)
+            self.sent += 1
+
+    async def check_liveness(self):
+        while True:
+            await asyncio.sleep(self.period * 10)
+
+    def close(self):
+        for task in self.tasks:
+            task.cancel()
+
+
+class TimerConnection:
+    """Keepalive send and liveness check as timers of the connection's TimerQueue."""
+
+    def __init__(self, period: float):
+        self.period = period
+        self.sent = 0
+        self.timers = TimerQueue()
+        self.timers.call_later(period, self.send_keepalive)
+        self.timers.call_later(period * 10, self.check_liveness)
+
+    def send_keepalive(self):
+        self.sent += 1
+        self.timers.call_later(self.period, self.send_keepalive)
+
+    def check_liveness(self):
+        self.timers.call_later(self.period * 10, self.check_liveness)
+
+    def close(self):
+        self.timers.cancel_all()
+
+
+async def measure(connection_type, connection_count: int, period: float, duration: float):
+    tracemalloc.start()
+    start = process_time()
+
+    connections = [connection_type(period) for _ in range(connection_count)]
+    await asyncio.sleep(duration)
+
+    elapsed = process_time() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    for connection in connections:
+        connection.close()
+
+    await asyncio.sleep(0)
+    return elapsed, peak, sum(connection.sent for connection in connections)
+
+
+async def main(connection_count: int):
+    for connection_type in (TaskConnection, TimerConnection):
+        elapsed, peak, sent = await measure(connection_type, connection_count, 0.1, 2)
+        print('%-16s %6d connections: %.2f s cpu, %6.1f MiB peak, %d keepalives' % (
+            connection_type.__name__, connection_count, elapsed, peak / 1024 / 1024, sent))
+
+
+if __name__ == '__main__':
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000))
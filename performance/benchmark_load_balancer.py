@@ -0,0 +1,82 @@
+import asyncio
+import statistics
+import sys
+from asyncio import Future
+from contextlib import AsyncExitStack, asynccontextmanager
+from time import perf_counter
+
+from rsocket.helpers import create_future, single_transport_provider
+from rsocket.load_balancer.least_loaded import LoadBalancerLeastLoaded
+from rsocket.load_balancer.load_balancer_rsocket import LoadBalancerRSocket
+from rsocket.load_balancer.power_of_two_choices import LoadBalancerPowerOfTwoChoices
+from rsocket.load_balancer.round_robin import LoadBalancerRoundRobin
+from rsocket.load_balancer.weighted import LoadBalancerWeighted
+from rsocket.payload import Payload
+from rsocket.request_handler import BaseRequestHandler
+from rsocket.rsocket_client import RSocketClient
+from rsocket.rsocket_server import RSocketServer
+from rsocket.transports.tcp import TransportTCP
+
+
+def handler_factory(delay: float):
+    class Handler(BaseRequestHandler):
+        async def request_response(self, payload: Payload) -> Future:
+            await asyncio.sleep(delay)
+            return create_future(Payload(b'pong'))
+
+    return Handler
+
+
+@asynccontextmanager
+async def tcp_client(port: int, delay: float):
+    servers = []
+
+    def session(*connection):
+        servers.append(RSocketServer(TransportTCP(*connection), handler_factory=handler_factory(delay)))
+
+    service = await asyncio.start_server(session, 'localhost', port)
+    connection = await asyncio.open_connection('localhost', port)
+
+    yield RSocketClient(single_transport_provider(TransportTCP(*connection)))
+
+    await servers[0].close()
+    service.close()
+
+
+async def measure(strategy, concurrency: int, repeat: int):
+    latencies = []
+
+    async def request():
+        request_start = perf_counter()
+        await load_balancer.request_response(Payload(b'ping'))
+        latencies.append(perf_counter() - request_start)
+
+    async with LoadBalancerRSocket(strategy) as load_balancer:
+        for _ in range(repeat):
+            await asyncio.gather(*[request() for _ in range(concurrency)])
+
+    latencies.sort()
+    return statistics.median(latencies) * 1000, latencies[int(len(latencies) * 0.99)] * 1000
+
+
+async def main(port: int):
+    delays = [0.05] + [0.001] * 7
+    strategies = {
+        'round robin': LoadBalancerRoundRobin,
+        'least loaded': LoadBalancerLeastLoaded,
+        'power of two choices': LoadBalancerPowerOfTwoChoices,
+        'weighted': LoadBalancerWeighted,
+    }
+
+    for name, strategy_type in strategies.items():
+        async with AsyncExitStack() as stack:
+            clients = [await stack.enter_async_context(tcp_client(port + index, delay))
+                       for index, delay in enumerate(delays)]
+
+            median, p99 = await measure(strategy_type(clients), 4, 200)
+
+            print('%-22s p50 %8.2f ms  p99 %8.2f ms' % (name, median, p99))
+
+
+if __name__ == '__main__':
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 6565))
@@ -0,0 +1,67 @@
+import asyncio
+import sys
+from asyncio import Future
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from time import process_time
+
+from rsocket.helpers import create_future, single_transport_provider
+from rsocket.payload import Payload
+from rsocket.request_handler import BaseRequestHandler
+from rsocket.rsocket_client import RSocketClient
+from rsocket.rsocket_server import RSocketServer
+from rsocket.transports.tcp import TransportTCP
+
+timeout = timedelta(seconds=30)
+
+
+class Handler(BaseRequestHandler):
+    async def request_response(self, payload: Payload) -> Future:
+        return create_future(Payload(b'pong'))
+
+
+@asynccontextmanager
+async def tcp_client(port: int):
+    servers = []
+
+    def session(*connection):
+        servers.append(RSocketServer(TransportTCP(*connection), handler_factory=Handler))
+
+    service = await asyncio.start_server(session, 'localhost', port)
+    connection = await asyncio.open_connection('localhost', port)
+
+    async with RSocketClient(single_transport_provider(TransportTCP(*connection))) as client:
+        yield client
+
+    await servers[0].close()
+    service.close()
+
+
+def with_wait_for(client: RSocketClient):
+    return asyncio.wait_for(client.request_response(Payload(b'ping')), timeout.total_seconds())
+
+
+def with_timeout_option(client: RSocketClient):
+    return client.request_response(Payload(b'ping'), timeout=timeout)
+
+
+async def measure(client: RSocketClient, request, concurrency: int, repeat: int) -> float:
+    start = process_time()
+
+    for _ in range(repeat):
+        await asyncio.gather(*[request(client) for _ in range(concurrency)])
+
+    return process_time() - start
+
+
+async def main(port: int, concurrency: int, repeat: int):
+    async with tcp_client(port) as client:
+        for request in (with_wait_for, with_timeout_option):
+            elapsed = await measure(client, request, concurrency, repeat)
+            print('%-20s %d requests: %.2f s cpu, %.1f us per request' % (
+                request.__name__, concurrency * repeat, elapsed, elapsed / (concurrency * repeat) * 1e6))
+
+
+if __name__ == '__main__':
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 6565
+    asyncio.run(main(port, concurrency=100, repeat=int(sys.argv[2]) if len(sys.argv) > 2 else 200))
@@ -0,0 +1,42 @@
+import sys
+from time import perf_counter
+
+from rsocket.routing.route_table import RouteTable
+
+
+def build_route_table(route_count: int) -> RouteTable:
+    route_table = RouteTable()
+
+    for index in range(route_count):
+        route_table.add('service%d.method' % index, index)
+        route_table.add('tenant%d.user.{user_id}.orders' % index, index)
+        route_table.add('tenant%d.metrics.*' % index, index)
+
+    return route_table
+
+
+def measure_lookups_per_second(route_table: RouteTable, route: str, lookup_count: int) -> float:
+    start = perf_counter()
+    for _ in range(lookup_count):
+        route_table.find(route)
+    elapsed = perf_counter() - start
+
+    return lookup_count / elapsed
+
+
+def main(route_counts, lookup_count: int = 100000):
+    for route_count in route_counts:
+        route_table = build_route_table(route_count)
+        middle = route_count // 2
+
+        print('%d routes of each kind: exact %.0f, template %.0f, wildcard %.0f, miss %.0f lookups/sec' % (
+            route_count,
+            measure_lookups_per_second(route_table, 'service%d.method' % middle, lookup_count),
+            measure_lookups_per_second(route_table, 'tenant%d.user.42.orders' % middle, lookup_count),
+            measure_lookups_per_second(route_table, 'tenant%d.metrics.cpu' % middle, lookup_count),
+            measure_lookups_per_second(route_table, 'tenant%d.unknown.route' % middle, lookup_count)))
+
+
+if __name__ == '__main__':
+    counts = [int(count) for count in sys.argv[1:]] or [100, 1000, 10000]
+    main(counts)
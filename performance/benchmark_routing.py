@@ -0,0 +1,47 @@
+import asyncio
+import sys
+from time import perf_counter
+
+from rsocket.extensions.composite_metadata import CompositeMetadata
+from rsocket.extensions.helpers import composite, route, data_mime_type, authenticate_bearer
+from rsocket.extensions.mimetypes import WellKnownMimeTypes
+from rsocket.helpers import create_future
+from rsocket.payload import Payload
+from rsocket.routing.request_router import RequestRouter
+from rsocket.routing.routing_request_handler import RoutingRequestHandler
+
+
+def build_handler(route_count: int) -> RoutingRequestHandler:
+    router = RequestRouter()
+
+    for index in range(route_count):
+        @router.response('service.method%d' % index)
+        async def response(payload: Payload, composite_metadata: CompositeMetadata):
+            return create_future(payload)
+
+    return RoutingRequestHandler(None, router)
+
+
+async def measure_request_latency(request_count: int, route_count: int = 100) -> float:
+    handler = build_handler(route_count)
+    payload = Payload(b'request', composite(route('service.method%d' % (route_count // 2)),
+                                            data_mime_type(WellKnownMimeTypes.APPLICATION_JSON),
+                                            authenticate_bearer('token')))
+
+    start = perf_counter()
+    for _ in range(request_count):
+        await handler.request_response(payload)
+    elapsed = perf_counter() - start
+
+    return elapsed / request_count
+
+
+async def main(request_counts):
+    for request_count in request_counts:
+        latency = await measure_request_latency(request_count)
+        print('%d routed requests: %.2f us/request' % (request_count, latency * 1e6))
+
+
+if __name__ == '__main__':
+    counts = [int(count) for count in sys.argv[1:]] or [10000, 100000]
+    asyncio.run(main(counts))
@@ -0,0 +1,107 @@
+import asyncio
+import statistics
+import sys
+from asyncio import Future
+from contextlib import asynccontextmanager
+from time import perf_counter
+
+from reactivestreams.subscriber import DefaultSubscriber
+from rsocket.helpers import create_future, single_transport_provider
+from rsocket.payload import Payload
+from rsocket.request_handler import BaseRequestHandler
+from rsocket.rsocket_client import RSocketClient
+from rsocket.rsocket_server import RSocketServer
+from rsocket.streams.stream_from_generator import StreamFromGenerator
+from rsocket.transports.tcp import TransportTCP
+
+bulk_payload = Payload(b'x' * 16 * 1024)
+bulk_request_n = 256
+
+
+class Handler(BaseRequestHandler):
+    async def request_response(self, payload: Payload) -> Future:
+        return create_future(Payload(b'pong'))
+
+    async def request_stream(self, payload: Payload):
+        def generator():
+            while True:
+                yield bulk_payload, False
+
+        return StreamFromGenerator(generator)
+
+
+class BulkSubscriber(DefaultSubscriber):
+    def __init__(self):
+        super().__init__()
+        self.received_bytes = 0
+        self.received_count = 0
+
+    def on_next(self, value, is_complete=False):
+        self.received_bytes += len(value.data)
+        self.received_count += 1
+
+        if self.received_count % bulk_request_n == 0:
+            self.subscription.request(bulk_request_n)
+
+
+@asynccontextmanager
+async def tcp_client(port: int, fair_send_scheduling: bool):
+    servers = []
+
+    def session(*connection):
+        servers.append(RSocketServer(TransportTCP(*connection),
+                                     handler_factory=Handler,
+                                     fair_send_scheduling=fair_send_scheduling))
+
+    service = await asyncio.start_server(session, 'localhost', port)
+    connection = await asyncio.open_connection('localhost', port)
+
+    async with RSocketClient(single_transport_provider(TransportTCP(*connection))) as client:
+        yield client
+
+    await servers[0].close()
+    service.close()
+
+
+async def measure(client: RSocketClient, bulk_stream_count: int, repeat: int):
+    bulk_subscribers = [BulkSubscriber() for _ in range(bulk_stream_count)]
+
+    for subscriber in bulk_subscribers:
+        client.request_stream(Payload(b'bulk')).initial_request_n(bulk_request_n).subscribe(subscriber)
+
+    await asyncio.sleep(0.5)
+
+    latencies = []
+    received_before = sum(subscriber.received_bytes for subscriber in bulk_subscribers)
+    start = perf_counter()
+
+    for _ in range(repeat):
+        request_start = perf_counter()
+        await client.request_response(Payload(b'ping'))
+        latencies.append(perf_counter() - request_start)
+
+    elapsed = perf_counter() - start
+    received = sum(subscriber.received_bytes for subscriber in bulk_subscribers) - received_before
+    bulk_throughput = received / elapsed
+
+    for subscriber in bulk_subscribers:
+        subscriber.subscription.cancel()
+
+    latencies.sort()
+    return (statistics.median(latencies) * 1000,
+            latencies[int(len(latencies) * 0.99)] * 1000,
+            bulk_throughput / (1024 * 1024))
+
+
+async def main(port: int):
+    for fair_send_scheduling in (False, True):
+        for bulk_stream_count in (0, 1, 4):
+            async with tcp_client(port, fair_send_scheduling) as client:
+                median, p99, bulk_throughput = await measure(client, bulk_stream_count, 200)
+
+                print('fair_send_scheduling=%-5s bulk streams: %d  request_response p50 %8.2f ms  p99 %8.2f ms  '
+                      'bulk %8.1f MiB/s' % (fair_send_scheduling, bulk_stream_count, median, p99, bulk_throughput))
+
+
+if __name__ == '__main__':
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 6565))
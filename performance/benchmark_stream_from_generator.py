@@ -0,0 +1,70 @@
+import asyncio
+import sys
+from time import perf_counter
+
+from reactivestreams.subscriber import DefaultSubscriber
+from rsocket.frame import MAX_REQUEST_N
+from rsocket.payload import Payload
+from rsocket.streams.stream_from_async_generator import StreamFromAsyncGenerator
+from rsocket.streams.stream_from_generator import StreamFromGenerator
+
+
+class CountingSubscriber(DefaultSubscriber):
+    def __init__(self, request_n: int):
+        super().__init__()
+        self._request_n = request_n
+        self.count = 0
+        self.completed = asyncio.Event()
+
+    def on_subscribe(self, subscription):
+        super().on_subscribe(subscription)
+        subscription.request(self._request_n)
+
+    def on_next(self, value, is_complete=False):
+        self.count += 1
+
+        if self._request_n != MAX_REQUEST_N and self.count % self._request_n == 0:
+            self.subscription.request(self._request_n)
+
+        if is_complete:
+            self.completed.set()
+
+    def on_complete(self):
+        self.completed.set()
+
+
+async def measure(stream_factory, item_count: int, request_n: int) -> float:
+    payload = Payload(b'item')
+
+    def generator():
+        for index in range(item_count):
+            yield payload, index == item_count - 1
+
+    async def async_generator():
+        for index in range(item_count):
+            yield payload, index == item_count - 1
+
+    subscriber = CountingSubscriber(request_n)
+    start = perf_counter()
+    stream_factory(generator, async_generator).subscribe(subscriber)
+    await subscriber.completed.wait()
+    elapsed = perf_counter() - start
+
+    assert subscriber.count == item_count
+    return item_count / elapsed
+
+
+async def main(item_count: int):
+    streams = {
+        'StreamFromGenerator': lambda generator, async_generator: StreamFromGenerator(generator),
+        'StreamFromAsyncGenerator': lambda generator, async_generator: StreamFromAsyncGenerator(async_generator),
+    }
+
+    for name, stream_factory in streams.items():
+        for request_n in (MAX_REQUEST_N, 64):
+            items_per_second = await measure(stream_factory, item_count, request_n)
+            print('%s, request_n %d: %d items/s' % (name, request_n, items_per_second))
+
+
+if __name__ == '__main__':
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000))
@@ -0,0 +1,87 @@
+import asyncio
+import sys
+from asyncio import Future
+from contextlib import asynccontextmanager
+from time import perf_counter
+
+from rsocket.helpers import create_future, single_transport_provider
+from rsocket.payload import Payload
+from rsocket.request_handler import BaseRequestHandler
+from rsocket.rsocket_client import RSocketClient
+from rsocket.rsocket_server import RSocketServer
+from rsocket.transports import tcp_buffered
+from rsocket.transports.tcp import TransportTCP
+
+MAX_FRAME_PAYLOAD_SIZE = 0xFFFFFF - 6
+
+payload_sizes = [64 * 1024, 256 * 1024, 1024 * 1024, 4 * 1024 * 1024, 16 * 1024 * 1024]
+
+
+class Handler(BaseRequestHandler):
+    async def request_response(self, payload: Payload) -> Future:
+        size = int(payload.data)
+        return create_future(Payload(b'x' * size))
+
+
+@asynccontextmanager
+async def tcp_client(port: int, read_buffer_size: int):
+    servers = []
+
+    def session(*connection):
+        servers.append(RSocketServer(TransportTCP(*connection), handler_factory=Handler))
+
+    service = await asyncio.start_server(session, 'localhost', port)
+    connection = await asyncio.open_connection('localhost', port)
+
+    async with RSocketClient(single_transport_provider(TransportTCP(*connection, read_buffer_size))) as client:
+        yield client
+
+    await servers[0].close()
+    service.close()
+
+
+@asynccontextmanager
+async def tcp_buffered_client(port: int):
+    servers = []
+    service = await tcp_buffered.rsocket_serve('localhost', port,
+                                               on_server_create=servers.append,
+                                               handler_factory=Handler)
+
+    async with tcp_buffered.rsocket_connect('localhost', port) as transport:
+        async with RSocketClient(single_transport_provider(transport)) as client:
+            yield client
+
+    await servers[0].close()
+    service.close()
+
+
+async def measure(client: RSocketClient, payload_size: int, repeat: int) -> float:
+    request = Payload(str(payload_size).encode())
+    await client.request_response(request)
+
+    start = perf_counter()
+    for _ in range(repeat):
+        await client.request_response(request)
+    elapsed = perf_counter() - start
+
+    return payload_size * repeat / elapsed / (1024 * 1024)
+
+
+async def main(port: int):
+    clients = {
+        'tcp (1 KiB reads)': lambda: tcp_client(port, 1024),
+        'tcp (adaptive reads)': lambda: tcp_client(port, 64 * 1024),
+        'tcp (buffered protocol)': lambda: tcp_buffered_client(port),
+    }
+
+    for name, client_factory in clients.items():
+        async with client_factory() as client:
+            for payload_size in payload_sizes:
+                payload_size = min(payload_size, MAX_FRAME_PAYLOAD_SIZE)
+                repeat = max(1, 32 * 1024 * 1024 // payload_size)
+                throughput = await measure(client, payload_size, repeat)
+                print('%s: %d KiB payloads: %.1f MiB/sec' % (name, payload_size // 1024, throughput))
+
+
+if __name__ == '__main__':
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 6565))
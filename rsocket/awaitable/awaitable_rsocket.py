@@ -1,8 +1,10 @@
+from datetime import timedelta
 from typing import List, Optional
 
 from reactivestreams.publisher import Publisher
 from rsocket.awaitable.collector_subscriber import CollectorSubscriber
 from rsocket.frame import MAX_REQUEST_N
+from rsocket.helpers import timeout_arguments
 from rsocket.payload import Payload
 from rsocket.rsocket import RSocket
 
@@ -18,25 +20,29 @@ class AwaitableRSocket:
     def metadata_push(self, metadata: bytes):
         self._rsocket.metadata_push(metadata)
 
-    async def request_response(self, payload: Payload) -> Payload:
-        return await self._rsocket.request_response(payload)
+    async def request_response(self, payload: Payload, timeout: Optional[timedelta] = None) -> Payload:
+        return await self._rsocket.request_response(payload, **timeout_arguments(timeout))
 
     async def request_stream(self,
                              payload: Payload,
-                             initial_request_n=MAX_REQUEST_N) -> List[Payload]:
+                             initial_request_n=MAX_REQUEST_N,
+                             timeout: Optional[timedelta] = None) -> List[Payload]:
         subscriber = CollectorSubscriber()
 
-        self._rsocket.request_stream(payload).initial_request_n(initial_request_n).subscribe(subscriber)
+        self._rsocket.request_stream(payload, **timeout_arguments(timeout)).initial_request_n(
+            initial_request_n).subscribe(subscriber)
 
         return await subscriber.run()
 
     async def request_channel(self,
                               payload: Payload,
                               publisher: Optional[Publisher] = None,
-                              initial_request_n=MAX_REQUEST_N) -> List[Payload]:
+                              initial_request_n=MAX_REQUEST_N,
+                              timeout: Optional[timedelta] = None) -> List[Payload]:
         subscriber = CollectorSubscriber()
 
-        self._rsocket.request_channel(payload, publisher).initial_request_n(initial_request_n).subscribe(subscriber)
+        self._rsocket.request_channel(payload, publisher, **timeout_arguments(timeout)).initial_request_n(
+            initial_request_n).subscribe(subscriber)
 
         return await subscriber.run()
 
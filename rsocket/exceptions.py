@@ -1,3 +1,4 @@
+import asyncio
 from typing import Optional
 
 from rsocket.error_codes import ErrorCode
@@ -38,6 +39,10 @@ class RSocketValueError(RSocketError):
     pass
 
 
+class RSocketRequestTimeout(RSocketError, asyncio.TimeoutError):
+    """The response to a request was not received within its timeout. The request was canceled."""
+
+
 class RSocketProtocolError(RSocketError):
     def __init__(self, error_code: ErrorCode, data: Optional[str] = None):
         self.error_code = error_code
@@ -58,6 +63,13 @@ class RSocketFrameFragmentDifferentType(RSocketError):
     pass
 
 
+class RSocketFrameFragmentLimitExceeded(RSocketProtocolError):
+
+    def __init__(self, stream_id: int, limit: int):
+        super().__init__(ErrorCode.REJECTED, 'Fragmented frame exceeds %d bytes' % limit)
+        self.stream_id = stream_id
+
+
 class RSocketTransportError(RSocketError):
     pass
 
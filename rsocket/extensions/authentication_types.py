@@ -1,7 +1,7 @@
 from enum import unique, Enum
 from typing import Optional
 
-from rsocket.helpers import WellKnownType
+from rsocket.helpers import WellKnownType, WellKnownTypeIndex
 
 
 class WellKnownAuthenticationType(WellKnownType):
@@ -15,16 +15,16 @@ class WellKnownAuthenticationTypes(Enum):
 
     @classmethod
     def require_by_id(cls, metadata_numeric_id: int) -> WellKnownAuthenticationType:
-        for value in cls:
-            if value.value.id == metadata_numeric_id:
-                return value.value
+        authentication_type = _authentication_type_index.get_by_id(metadata_numeric_id)
 
-        raise Exception('Unknown authentication type id')
+        if authentication_type is None:
+            raise Exception('Unknown authentication type id')
+
+        return authentication_type
 
     @classmethod
     def get_by_name(cls, metadata_name: str) -> Optional[WellKnownAuthenticationType]:
-        for value in cls:
-            if value.value.name == metadata_name:
-                return value.value
+        return _authentication_type_index.get_by_name(metadata_name)
+
 
-        return None
+_authentication_type_index = WellKnownTypeIndex(value.value for value in WellKnownAuthenticationTypes)
@@ -1,8 +1,9 @@
-from typing import List, Type
+from typing import List, Type, Union, Optional, Iterable, Tuple
 
 from rsocket.extensions.authentication_content import AuthenticationContent
 from rsocket.extensions.composite_metadata_item import CompositeMetadataItem
-from rsocket.extensions.mimetypes import WellKnownMimeTypes
+from rsocket.extensions.mimetypes import WellKnownMimeTypes, WellKnownMimeType, ensure_encoding_name
+from rsocket.extensions.request_timeout import RequestTimeoutMetadata, REQUEST_TIMEOUT_MIMETYPE
 from rsocket.extensions.routing import RoutingMetadata
 from rsocket.extensions.stream_data_mimetype import StreamDataMimetype
 from rsocket.extensions.stream_data_mimetype import StreamDataMimetypes
@@ -18,69 +19,173 @@ def default_or_value(value, default=None):
     return value
 
 
+_metadata_item_factory_by_type = {
+    WellKnownMimeTypes.MESSAGE_RSOCKET_ROUTING.value.name: RoutingMetadata,
+    WellKnownMimeTypes.MESSAGE_RSOCKET_MIMETYPE.value.name: StreamDataMimetype,
+    WellKnownMimeTypes.MESSAGE_RSOCKET_ACCEPT_MIMETYPES.value.name: StreamDataMimetypes,
+    WellKnownMimeTypes.MESSAGE_RSOCKET_AUTHENTICATION.value.name: AuthenticationContent,
+    REQUEST_TIMEOUT_MIMETYPE: RequestTimeoutMetadata
+}
+
+
 def metadata_item_factory(metadata_encoding: bytes) -> Type[CompositeMetadataItem]:
-    metadata_item_factory_by_type = {
-        WellKnownMimeTypes.MESSAGE_RSOCKET_ROUTING.value.name: RoutingMetadata,
-        WellKnownMimeTypes.MESSAGE_RSOCKET_MIMETYPE.value.name: StreamDataMimetype,
-        WellKnownMimeTypes.MESSAGE_RSOCKET_ACCEPT_MIMETYPES.value.name: StreamDataMimetypes,
-        WellKnownMimeTypes.MESSAGE_RSOCKET_AUTHENTICATION.value.name: AuthenticationContent
-    }
+    return _metadata_item_factory_by_type.get(metadata_encoding, CompositeMetadataItem)
+
+
+def serialize_composite_metadata_items(items: Iterable[CompositeMetadataItem]) -> bytes:
+    serialized = []
+
+    for item in items:
+        item_metadata = item.serialize()
 
-    return metadata_item_factory_by_type.get(metadata_encoding, CompositeMetadataItem)
+        serialized.append(serialize_well_known_encoding(item.encoding, WellKnownMimeTypes.get_by_name))
+        serialized.append(pack_24bit_length(item_metadata))
+        serialized.append(item_metadata)
+
+    return b''.join(serialized)
+
+
+class _UnparsedItem:
+    __slots__ = (
+        'encoding',
+        'metadata',
+        'start',
+        'end'
+    )
+
+    def __init__(self, encoding: bytes, metadata: bytes, start: int, end: int):
+        self.encoding = encoding
+        self.metadata = metadata
+        self.start = start
+        self.end = end
+
+    def serialize(self) -> bytes:
+        return bytes(self.metadata[self.start:self.end])
+
+    def parse(self) -> CompositeMetadataItem:
+        item = metadata_item_factory(self.encoding)()
+        item.encoding = self.encoding
+        item.parse(self.metadata[self.start:self.end])
+        return item
 
 
 class CompositeMetadata:
     __slots__ = (
-        'items',
-        'metadata_item_factory_by_type'
+        '_items',
+        '_has_unparsed_items'
     )
 
     def __init__(self, items: List[CompositeMetadataItem] = _default):
+        self._items: List[Union[CompositeMetadataItem, _UnparsedItem]] = default_or_value(items, [])
+        self._has_unparsed_items = False
+
+    @property
+    def items(self) -> List[CompositeMetadataItem]:
+        if self._has_unparsed_items:
+            self._items = [self._parsed_item(item) for item in self._items]
+            self._has_unparsed_items = False
 
-        self.items: List[CompositeMetadataItem] = default_or_value(items, [])
+        return self._items
+
+    @items.setter
+    def items(self, items: List[CompositeMetadataItem]):
+        self._items = items
+        self._has_unparsed_items = False
 
     def append(self, item: CompositeMetadataItem) -> 'CompositeMetadata':
-        self.items.append(item)
+        self._items.append(item)
         return self
 
     def extend(self, *items: CompositeMetadataItem) -> 'CompositeMetadata':
-        self.items.extend(items)
+        self._items.extend(items)
         return self
 
-    def parse(self, metadata: bytes):
+    def parse(self, metadata: bytes, lazy: bool = False):
+        """
+        If lazy is set, only the item boundaries are indexed, and each item is parsed when first accessed,
+        either through items or find_first.
+        """
+
+        unparsed_items = self._index_items(metadata)
+
+        if lazy:
+            self._items.extend(unparsed_items)
+            self._has_unparsed_items = self._has_unparsed_items or len(unparsed_items) > 0
+        else:
+            self._items.extend(item.parse() for item in unparsed_items)
+
+    def find_first(self,
+                   encoding: Union[bytes, str, WellKnownMimeType, WellKnownMimeTypes]
+                   ) -> Optional[CompositeMetadataItem]:
+        if isinstance(encoding, WellKnownMimeType):
+            encoding = encoding.name
+        else:
+            encoding = ensure_encoding_name(encoding)
+
+        for index, item in enumerate(self._items):
+            if item.encoding == encoding:
+                if isinstance(item, _UnparsedItem):
+                    item = self._items[index] = item.parse()
+
+                return item
+
+        return None
+
+    def serialize(self) -> bytes:
+        return serialize_composite_metadata_items(self._items)
+
+    @staticmethod
+    def _parsed_item(item: Union[CompositeMetadataItem, _UnparsedItem]) -> CompositeMetadataItem:
+        if isinstance(item, _UnparsedItem):
+            return item.parse()
+
+        return item
+
+    @staticmethod
+    def _index_items(metadata: bytes) -> List[_UnparsedItem]:
+        unparsed_items = []
         composite_length = len(metadata)
         offset = 0
 
-        while offset < composite_length:
-            metadata_encoding, relative_offset = parse_well_known_encoding(metadata[offset:],
-                                                                           WellKnownMimeTypes.require_by_id)
-            offset += relative_offset
+        with memoryview(metadata) as metadata_view:
+            while offset < composite_length:
+                metadata_encoding, relative_offset = parse_well_known_encoding(metadata_view[offset:],
+                                                                               WellKnownMimeTypes.require_by_id)
+                offset += relative_offset
 
-            length = unpack_24bit(metadata, offset)
-            offset += 3
+                length = unpack_24bit(metadata, offset)
+                offset += 3
 
-            item = metadata_item_factory(metadata_encoding)()
-            item.encoding = metadata_encoding
+                end = min(offset + length, composite_length)
+                unparsed_items.append(_UnparsedItem(metadata_encoding, metadata, offset, end))
+                offset = end
 
-            item_metadata = metadata[offset:offset + length]
-            metadata_length = len(item_metadata)
-            item.parse(item_metadata)
+        return unparsed_items
 
-            self.append(item)
-            offset += metadata_length
 
-    def serialize(self) -> bytes:
-        serialized = b''
+class ImmutableCompositeMetadata:
+    """
+    Composite metadata which is serialized once, when created. The items must not be modified afterwards.
+
+    Use serialize_with to append items which vary per request (e.g. the route) to the prebuilt metadata,
+    without serializing it again.
+    """
 
-        for item in self.items:
-            metadata_header = serialize_well_known_encoding(item.encoding, WellKnownMimeTypes.get_by_name)
-            item_metadata = item.serialize()
+    __slots__ = (
+        '_items',
+        '_serialized'
+    )
 
-            item_serialized = b''
-            item_serialized += metadata_header
-            item_serialized += pack_24bit_length(item_metadata)
-            item_serialized += item_metadata
+    def __init__(self, *items: CompositeMetadataItem):
+        self._items = items
+        self._serialized = serialize_composite_metadata_items(items)
 
-            serialized += item_serialized
+    @property
+    def items(self) -> Tuple[CompositeMetadataItem, ...]:
+        return self._items
+
+    def serialize(self) -> bytes:
+        return self._serialized
 
-        return serialized
+    def serialize_with(self, *items: CompositeMetadataItem) -> bytes:
+        return self._serialized + serialize_composite_metadata_items(items)
@@ -1,9 +1,11 @@
-from typing import Union
+from datetime import timedelta
+from typing import Optional, Union
 
 from rsocket.extensions.authentication import AuthenticationBearer, AuthenticationSimple
 from rsocket.extensions.authentication_content import AuthenticationContent
 from rsocket.extensions.composite_metadata import CompositeMetadata, CompositeMetadataItem
-from rsocket.extensions.mimetypes import WellKnownMimeType
+from rsocket.extensions.mimetypes import WellKnownMimeType, WellKnownMimeTypes
+from rsocket.extensions.request_timeout import RequestTimeoutMetadata, REQUEST_TIMEOUT_MIMETYPE
 from rsocket.extensions.routing import RoutingMetadata
 from rsocket.extensions.stream_data_mimetype import StreamDataMimetype, StreamDataMimetypes
 
@@ -34,9 +36,23 @@ def data_mime_types(*metadata_mime_types: Union[bytes, WellKnownMimeType]) -> Co
     return StreamDataMimetypes(list(metadata_mime_types))
 
 
+def request_timeout(timeout: timedelta) -> CompositeMetadataItem:
+    return RequestTimeoutMetadata(timeout)
+
+
+def find_request_timeout(composite_metadata: CompositeMetadata) -> Optional[timedelta]:
+    item = composite_metadata.find_first(REQUEST_TIMEOUT_MIMETYPE)
+
+    if isinstance(item, RequestTimeoutMetadata):
+        return item.timeout
+
+    return None
+
+
 def require_route(composite_metadata: CompositeMetadata) -> str:
-    for item in composite_metadata.items:
-        if isinstance(item, RoutingMetadata):
-            return item.tags[0].decode()
+    routing = composite_metadata.find_first(WellKnownMimeTypes.MESSAGE_RSOCKET_ROUTING)
+
+    if isinstance(routing, RoutingMetadata):
+        return routing.tags[0].decode()
 
     raise Exception('No route found in request')
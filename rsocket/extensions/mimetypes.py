@@ -3,7 +3,7 @@ from typing import Optional
 
 from rsocket.exceptions import RSocketUnknownMimetype
 from rsocket.frame_helpers import ensure_bytes
-from rsocket.helpers import WellKnownType
+from rsocket.helpers import WellKnownType, WellKnownTypeIndex
 
 
 class WellKnownMimeType(WellKnownType):
@@ -73,19 +73,19 @@ class WellKnownMimeTypes(Enum):
 
     @classmethod
     def require_by_id(cls, metadata_numeric_id: int) -> WellKnownMimeType:
-        for value in cls:
-            if value.value.id == metadata_numeric_id:
-                return value.value
+        mime_type = _mime_type_index.get_by_id(metadata_numeric_id)
 
-        raise RSocketUnknownMimetype(metadata_numeric_id)
+        if mime_type is None:
+            raise RSocketUnknownMimetype(metadata_numeric_id)
+
+        return mime_type
 
     @classmethod
     def get_by_name(cls, metadata_name: str) -> Optional[WellKnownMimeType]:
-        for value in cls:
-            if value.value.name == metadata_name:
-                return value.value
+        return _mime_type_index.get_by_name(metadata_name)
+
 
-        return None
+_mime_type_index = WellKnownTypeIndex(value.value for value in WellKnownMimeTypes)
 
 
 def ensure_encoding_name(encoding) -> bytes:
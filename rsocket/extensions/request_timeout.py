@@ -0,0 +1,26 @@
+import struct
+from datetime import timedelta
+from typing import Optional
+
+from rsocket.extensions.composite_metadata_item import CompositeMetadataItem
+
+REQUEST_TIMEOUT_MIMETYPE = b'message/x.rsocket.request-timeout.v0'
+
+
+class RequestTimeoutMetadata(CompositeMetadataItem):
+    """
+    The time the requester waits for the response, in milliseconds, counted from when the request was sent.
+    Lets the responder drop the work of a request whose requester has already given up.
+    """
+
+    __slots__ = 'timeout'
+
+    def __init__(self, timeout: Optional[timedelta] = None):
+        super().__init__(REQUEST_TIMEOUT_MIMETYPE, None)
+        self.timeout = timeout
+
+    def parse(self, buffer: bytes):
+        self.timeout = timedelta(milliseconds=struct.unpack('>I', buffer[:4])[0])
+
+    def serialize(self) -> bytes:
+        return struct.pack('>I', min(max(0, int(self.timeout.total_seconds() * 1000)), 0xFFFFFFFF))
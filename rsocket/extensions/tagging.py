@@ -1,4 +1,3 @@
-import struct
 from typing import Union, List, Optional
 
 from rsocket.exceptions import RSocketError
@@ -22,23 +21,25 @@ class TaggingMetadata(CompositeMetadataItem):
         return super().serialize()
 
     def _serialize_tags(self) -> bytes:
-        serialized = b''
+        serialized = []
 
-        for tag in list(map(ensure_bytes, self.tags)):
-            if len(tag) > 256:
-                raise RSocketError('Tag length longer than 256 characters: "%s"' % tag)
+        for tag in self.tags:
+            tag = ensure_bytes(tag)
 
-            serialized += struct.pack('>b', len(tag))
-            serialized += tag
+            if len(tag) > 255:
+                raise RSocketError('Tag length longer than 255 characters: "%s"' % tag)
 
-        return serialized
+            serialized.append(len(tag).to_bytes(1, 'big'))
+            serialized.append(tag)
+
+        return b''.join(serialized)
 
     def parse(self, buffer: bytes):
         self.tags = []
         offset = 0
 
         while offset < len(buffer):
-            tag_length = struct.unpack('>b', buffer[offset:offset + 1])[0]
+            tag_length = buffer[offset]
             offset += 1
             self.tags.append(buffer[offset:offset + tag_length])
             offset += tag_length
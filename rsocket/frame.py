@@ -86,7 +86,8 @@ class Frame(Header, metaclass=ABCMeta):
         'data',
         'flags_follows',
         'flags_complete',
-        'metadata_only'
+        'metadata_only',
+        'lazy_data'
     )
 
     def __init__(self, frame_type: FrameType):
@@ -102,6 +103,7 @@ class Frame(Header, metaclass=ABCMeta):
         self.flags_complete = False
 
         self.metadata_only = False
+        self.lazy_data = False
 
     def parse_metadata(self, buffer: bytes, offset: int) -> int:
         if not self.flags_metadata:
@@ -113,13 +115,18 @@ class Frame(Header, metaclass=ABCMeta):
         else:
             length = self.length - offset + 3
 
-        self.metadata = buffer[offset:offset + length]
+        self.metadata = bytes(buffer[offset:offset + length])
 
         return length + (0 if self.metadata_only else 3)
 
     def parse_data(self, buffer: bytes, offset: int) -> int:
         length = self.length - offset + 3
-        self.data = buffer[offset:offset + length]
+
+        if self.lazy_data:
+            self.data = buffer[offset:offset + length]
+        else:
+            self.data = bytes(buffer[offset:offset + length])
+
         return length
 
     @abc.abstractmethod
@@ -127,6 +134,57 @@ class Frame(Header, metaclass=ABCMeta):
         ...
 
     def serialize(self, middle=b'', flags: int = 0) -> bytes:
+        """
+        Frame types add their fields by overriding _serialize_fields. Subclasses written before it existed
+        override serialize instead, and pass their fields to it as middle and flags, which is still supported.
+        """
+
+        if middle or flags:
+            middle, flags = Frame._serialize_fields(self, middle, flags)
+        else:
+            middle, flags = self._serialize_fields()
+
+        self.length = self._compute_frame_length(middle)
+
+        buffer = bytearray(self.length)
+        self._write_frame(buffer, 0, middle, flags)
+
+        return bytes(buffer)
+
+    def serialize_into(self, buffer: bytearray, offset: int = 0) -> int:
+        """
+        Writes the frame, prefixed by its 24bit length, into buffer at offset, growing the buffer if required.
+        Returns the offset following the written frame.
+        """
+
+        if type(self).serialize is not Frame.serialize:
+            return self._serialize_into_with_overridden_serialize(buffer, offset)
+
+        middle, flags = self._serialize_fields()
+        self.length = self._compute_frame_length(middle)
+        end = offset + 3 + self.length
+
+        if len(buffer) < end:
+            buffer.extend(bytes(end - len(buffer)))
+
+        buffer[offset:offset + 3] = pack_24bit(self.length)
+        self._write_frame(buffer, offset + 3, middle, flags)
+
+        return end
+
+    def _serialize_into_with_overridden_serialize(self, buffer: bytearray, offset: int) -> int:
+        serialized = self.serialize()
+        end = offset + 3 + len(serialized)
+
+        if len(buffer) < end:
+            buffer.extend(bytes(end - len(buffer)))
+
+        buffer[offset:offset + 3] = pack_24bit(len(serialized))
+        buffer[offset + 3:end] = serialized
+
+        return end
+
+    def _serialize_fields(self, middle=b'', flags: int = 0) -> Tuple[bytes, int]:
         flags &= ~(_FLAG_IGNORE_BIT | _FLAG_METADATA_BIT)
         if self.flags_ignore:
             flags |= _FLAG_IGNORE_BIT
@@ -134,20 +192,16 @@ class Frame(Header, metaclass=ABCMeta):
             self.flags_metadata = True
             flags |= _FLAG_METADATA_BIT
 
-        self.length = self._compute_frame_length(middle)
-
-        offset = 0
-        buffer = bytearray(self.length)
-
-        struct.pack_into('>I', buffer, offset, self.stream_id)
-        offset += 4
+        return middle, flags
 
-        buffer[offset] = (self.frame_type << 2) | (flags >> 8)
-        offset += 1
-        buffer[offset] = flags & 0xff
-        offset += 1
+    def _write_frame(self, buffer: bytearray, offset: int, middle: bytes, flags: int):
+        struct.pack_into('>IBB', buffer, offset,
+                         self.stream_id,
+                         (self.frame_type << 2) | (flags >> 8),
+                         flags & 0xff)
+        offset += HEADER_LENGTH
 
-        buffer[offset:offset + len(middle)] = middle[:]
+        buffer[offset:offset + len(middle)] = middle
         offset += len(middle)
 
         if self.flags_metadata and self.metadata:
@@ -155,14 +209,11 @@ class Frame(Header, metaclass=ABCMeta):
             if not self.metadata_only:
                 buffer[offset:offset + 3] = pack_24bit(length)
                 offset += 3
-            buffer[offset:offset + length] = self.metadata[:]
+            buffer[offset:offset + length] = self.metadata
             offset += length
 
         if not self.metadata_only and self.data:
-            buffer[offset:offset + len(self.data)] = self.data[:]
-            offset += len(self.data)
-
-        return bytes(buffer)
+            buffer[offset:offset + len(self.data)] = self.data
 
     def _compute_frame_length(self, middle: bytes) -> int:
         header_length = HEADER_LENGTH
@@ -216,7 +267,7 @@ class SetupFrame(Frame):
         if self.flags_resume:
             self.token_length = struct.unpack_from('>H', buffer, offset)[0]
             offset += 2
-            self.resume_identification_token = (
+            self.resume_identification_token = bytes(
                 buffer[offset:offset + self.token_length])
             offset += self.token_length
 
@@ -228,7 +279,7 @@ class SetupFrame(Frame):
         offset += self.parse_metadata(buffer, offset)
         offset += self.parse_data(buffer, offset)
 
-    def serialize(self, middle=b'', flags=0) -> bytes:
+    def _serialize_fields(self, middle=b'', flags: int = 0) -> Tuple[bytes, int]:
         flags &= ~(_FLAG_LEASE_BIT | _FLAG_RESUME_BIT)
         if self.flags_lease:
             flags |= _FLAG_LEASE_BIT
@@ -244,7 +295,7 @@ class SetupFrame(Frame):
             middle += self.resume_identification_token
         middle += pack_string(self.metadata_encoding)
         middle += pack_string(self.data_encoding)
-        return Frame.serialize(self, middle, flags)
+        return Frame._serialize_fields(self, middle, flags)
 
 
 class InvalidFrame:
@@ -265,9 +316,9 @@ class ErrorFrame(Frame):
         offset += 4
         offset += self.parse_data(buffer, offset)
 
-    def serialize(self, middle=b'', flags=0) -> bytes:
+    def _serialize_fields(self, middle=b'', flags: int = 0) -> Tuple[bytes, int]:
         middle = struct.pack('>I', self.error_code)
-        return Frame.serialize(self, middle, flags)
+        return Frame._serialize_fields(self, middle, flags)
 
 
 class LeaseFrame(Frame):
@@ -290,11 +341,11 @@ class LeaseFrame(Frame):
         self.number_of_requests = number_of_requests & MASK_31_BITS
         offset += self.parse_metadata(buffer, offset + 8)
 
-    def serialize(self, middle=b'', flags=0):
+    def _serialize_fields(self, middle=b'', flags: int = 0) -> Tuple[bytes, int]:
         middle = struct.pack('>II',
                              self.time_to_live & MASK_31_BITS,
                              self.number_of_requests & MASK_31_BITS)
-        return Frame.serialize(self, middle, flags)
+        return Frame._serialize_fields(self, middle, flags)
 
 
 class KeepAliveFrame(Frame):
@@ -316,12 +367,12 @@ class KeepAliveFrame(Frame):
         offset += 8
         offset += self.parse_data(buffer, offset)
 
-    def serialize(self, middle=b'', flags: int = 0) -> bytes:
+    def _serialize_fields(self, middle=b'', flags: int = 0) -> Tuple[bytes, int]:
         flags &= ~_FLAG_RESPOND_BIT
         if self.flags_respond:
             flags |= _FLAG_RESPOND_BIT
         middle += pack_position(self.last_received_position)
-        return Frame.serialize(self, middle, flags)
+        return Frame._serialize_fields(self, middle, flags)
 
 
 class RequestFrame(Frame):
@@ -338,13 +389,13 @@ class RequestFrame(Frame):
         self.flags_follows = is_flag_set(flags, _FLAG_FOLLOWS_BIT)
         return HEADER_LENGTH, flags
 
-    def serialize(self, middle=b'', flags: int = 0) -> bytes:
+    def _serialize_fields(self, middle=b'', flags: int = 0) -> Tuple[bytes, int]:
         flags &= ~_FLAG_FOLLOWS_BIT
 
         if self.flags_follows:
             flags |= _FLAG_FOLLOWS_BIT
 
-        return Frame.serialize(self, middle, flags)
+        return Frame._serialize_fields(self, middle, flags)
 
     def _parse_payload(self, buffer: bytes, offset: int):
         offset += self.parse_metadata(buffer, offset)
@@ -390,9 +441,9 @@ class RequestStreamFrame(RequestFrame):
         offset += 4
         self._parse_payload(buffer, offset)
 
-    def serialize(self, middle=b'', flags=0):
+    def _serialize_fields(self, middle=b'', flags: int = 0) -> Tuple[bytes, int]:
         middle = struct.pack('>I', self.initial_request_n)
-        return RequestFrame.serialize(self, middle)
+        return RequestFrame._serialize_fields(self, middle)
 
 
 class RequestChannelFrame(RequestFrame):
@@ -417,14 +468,14 @@ class RequestChannelFrame(RequestFrame):
         offset += 4
         self._parse_payload(buffer, offset)
 
-    def serialize(self, middle=b'', flags=0):
+    def _serialize_fields(self, middle=b'', flags: int = 0) -> Tuple[bytes, int]:
         middle = struct.pack('>I', self.initial_request_n)
 
         flags &= ~_FLAG_COMPLETE_BIT
         if self.flags_complete:
             flags |= _FLAG_COMPLETE_BIT
 
-        return RequestFrame.serialize(self, middle, flags)
+        return RequestFrame._serialize_fields(self, middle, flags)
 
 
 class RequestNFrame(RequestFrame):
@@ -439,9 +490,9 @@ class RequestNFrame(RequestFrame):
         offset += HEADER_LENGTH
         self.request_n = unpack_32bit(buffer, offset)
 
-    def serialize(self, middle=b'', flags=0):
+    def _serialize_fields(self, middle=b'', flags: int = 0) -> Tuple[bytes, int]:
         middle = struct.pack('>I', self.request_n)
-        return Frame.serialize(self, middle, flags)
+        return Frame._serialize_fields(self, middle, flags)
 
 
 class CancelFrame(Frame):
@@ -475,7 +526,7 @@ class PayloadFrame(Frame):
         offset += self.parse_metadata(buffer, offset)
         offset += self.parse_data(buffer, offset)
 
-    def serialize(self, middle=b'', flags=0):
+    def _serialize_fields(self, middle=b'', flags: int = 0) -> Tuple[bytes, int]:
         flags &= ~(_FLAG_FOLLOWS_BIT | _FLAG_COMPLETE_BIT |
                    _FLAG_NEXT_BIT)
         if self.flags_follows:
@@ -484,7 +535,7 @@ class PayloadFrame(Frame):
             flags |= _FLAG_COMPLETE_BIT
         if self.flags_next:
             flags |= _FLAG_NEXT_BIT
-        return Frame.serialize(self, flags=flags)
+        return Frame._serialize_fields(self, flags=flags)
 
 
 class MetadataPushFrame(Frame):
@@ -529,7 +580,7 @@ class ResumeFrame(Frame):
 
         self.token_length = struct.unpack_from('>H', buffer, offset)[0]
         offset += 2
-        self.resume_identification_token = (
+        self.resume_identification_token = bytes(
             buffer[offset:offset + self.token_length])
         offset += self.token_length
 
@@ -537,7 +588,7 @@ class ResumeFrame(Frame):
         offset += 8
         self.first_client_position = unpack_position(buffer[offset:])
 
-    def serialize(self, middle=b'', flags=0) -> bytes:
+    def _serialize_fields(self, middle=b'', flags: int = 0) -> Tuple[bytes, int]:
         flags &= ~(_FLAG_LEASE_BIT | _FLAG_RESUME_BIT)
 
         middle = struct.pack('>HH', self.major_version, self.minor_version)
@@ -549,7 +600,7 @@ class ResumeFrame(Frame):
         middle += pack_position(self.last_server_position)
         middle += pack_position(self.first_client_position)
 
-        return Frame.serialize(self, middle)
+        return Frame._serialize_fields(self, middle)
 
 
 class ResumeOKFrame(Frame):
@@ -566,12 +617,16 @@ class ResumeOKFrame(Frame):
         offset += HEADER_LENGTH
         self.last_received_client_position = unpack_position(buffer[offset:offset + 8])
 
-    def serialize(self, middle=b'', flags: int = 0) -> bytes:
+    def _serialize_fields(self, middle=b'', flags: int = 0) -> Tuple[bytes, int]:
         serialized = pack_position(self.last_received_client_position)
-        return super().serialize(serialized)
+        return super()._serialize_fields(serialized)
 
 
 class ExtendedFrame(Frame, metaclass=abc.ABCMeta):
+    """
+    Subclasses serialize their fields by overriding _serialize_fields, or, as before it existed, serialize.
+    """
+
     __slots__ = (
         'extended_type'
     )
@@ -579,10 +634,6 @@ class ExtendedFrame(Frame, metaclass=abc.ABCMeta):
     def __init__(self):
         super().__init__(FrameType.EXT)
 
-    @abc.abstractmethod
-    def serialize(self, middle=b'', flags: int = 0) -> bytes:
-        ...
-
 
 _frame_class_by_id = {
     FrameType.SETUP: SetupFrame,
@@ -602,7 +653,11 @@ _frame_class_by_id = {
 }
 
 
-def parse_or_ignore(buffer: bytes) -> Optional[Frame]:
+def parse_or_ignore(buffer: bytes, lazy_data: bool = False) -> Optional[Frame]:
+    """
+    If lazy_data is set, the data of payload carrying frames is a slice of buffer instead of a copy.
+    """
+
     if len(buffer) < HEADER_LENGTH:
         raise ParseError('Frame too short: {} bytes'.format(len(buffer)))
 
@@ -614,6 +669,8 @@ def parse_or_ignore(buffer: bytes) -> Optional[Frame]:
     except KeyError as exception:
         raise RSocketUnknownFrameType(header.frame_type) from exception
 
+    frame.lazy_data = lazy_data and is_fragmentable_frame(frame)
+
     try:
         frame.parse(buffer, 0)
         return frame
@@ -654,10 +711,9 @@ def error_frame_to_exception(frame: ErrorFrame) -> Exception:
 
 
 def serialize_with_frame_size_header(frame: Frame) -> bytes:
-    serialized_frame = frame.serialize()
-    header = struct.pack('>I', len(serialized_frame))[1:]
-    full_frame = header + serialized_frame
-    return full_frame
+    buffer = bytearray()
+    frame.serialize_into(buffer)
+    return bytes(buffer)
 
 
 initiate_request_frame_types = (RequestResponseFrame,
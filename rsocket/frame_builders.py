@@ -1,3 +1,5 @@
+from typing import List, Optional
+
 from rsocket.datetime_helpers import to_milliseconds
 from rsocket.fragment import Fragment
 from rsocket.frame import (PayloadFrame, RequestNFrame,
@@ -5,9 +7,12 @@ from rsocket.frame import (PayloadFrame, RequestNFrame,
                            RequestStreamFrame, RequestResponseFrame,
                            RequestFireAndForgetFrame, SetupFrame,
                            MetadataPushFrame, KeepAliveFrame,
-                           MAX_REQUEST_N)
+                           ResumeFrame, ResumeOKFrame,
+                           MAX_REQUEST_N, Frame)
 from rsocket.payload import Payload
 
+MINIMUM_FRAGMENT_SIZE = 64
+
 
 def to_payload_frame(stream_id: int,
                      payload: Payload,
@@ -82,9 +87,14 @@ def to_setup_frame(payload,
                    metadata_encoding,
                    keep_alive_period,
                    max_lifetime_period,
-                   honor_lease=False):
+                   honor_lease=False,
+                   resume_token: Optional[bytes] = None):
     setup = SetupFrame()
     setup.flags_lease = honor_lease
+    if resume_token is not None:
+        setup.flags_resume = True
+        setup.token_length = len(resume_token)
+        setup.resume_identification_token = resume_token
     setup.keep_alive_milliseconds = to_milliseconds(keep_alive_period)
     setup.max_lifetime_milliseconds = to_milliseconds(max_lifetime_period)
     setup.data_encoding = data_encoding
@@ -101,8 +111,62 @@ def to_metadata_push_frame(metadata: bytes):
     return frame
 
 
-def to_keepalive_frame(data: bytes):
+def to_keepalive_frame(data: bytes, last_received_position: int = 0):
     frame = KeepAliveFrame()
     frame.flags_respond = True
     frame.data = data
+    frame.last_received_position = last_received_position
+    return frame
+
+
+def to_resume_frame(resume_token: bytes, last_server_position: int, first_client_position: int):
+    frame = ResumeFrame()
+    frame.token_length = len(resume_token)
+    frame.resume_identification_token = resume_token
+    frame.last_server_position = last_server_position
+    frame.first_client_position = first_client_position
     return frame
+
+
+def to_resume_ok_frame(last_received_client_position: int):
+    frame = ResumeOKFrame()
+    frame.last_received_client_position = last_received_client_position
+    return frame
+
+
+def to_fragment_frames(frame: Frame, fragment_size: int) -> List[Frame]:
+    """
+    Splits a fragmentable frame whose metadata and data together are larger than fragment_size bytes.
+    The frame itself becomes the first fragment, and is followed by PAYLOAD frames. Metadata is sent before data.
+    Fragments reference slices of the original metadata and data, which are not copied.
+    """
+
+    metadata = memoryview(frame.metadata or b'')
+    data = memoryview(frame.data or b'')
+    metadata_length = len(metadata)
+    total_length = metadata_length + len(data)
+
+    if total_length <= fragment_size:
+        return [frame]
+
+    is_complete = frame.flags_complete
+    is_next = frame.flags_next if isinstance(frame, PayloadFrame) else True
+
+    frame.metadata = metadata[:fragment_size]
+    frame.data = data[:max(fragment_size - metadata_length, 0)]
+    frame.flags_follows = True
+    frame.flags_complete = False
+    fragments = [frame]
+
+    for start in range(fragment_size, total_length, fragment_size):
+        end = start + fragment_size
+        fragment = PayloadFrame()
+        fragment.stream_id = frame.stream_id
+        fragment.metadata = metadata[start:end]
+        fragment.data = data[max(start - metadata_length, 0):max(end - metadata_length, 0)]
+        fragment.flags_next = is_next
+        fragment.flags_follows = end < total_length
+        fragment.flags_complete = is_complete and not fragment.flags_follows
+        fragments.append(fragment)
+
+    return fragments
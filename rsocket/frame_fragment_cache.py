@@ -1,52 +1,157 @@
-from typing import Optional
+from typing import Optional, Dict, List, Set
 
-from rsocket.exceptions import RSocketFrameFragmentDifferentType
-from rsocket.frame import FragmentableFrame
+from rsocket.exceptions import RSocketFrameFragmentDifferentType, RSocketFrameFragmentLimitExceeded
+from rsocket.frame import FragmentableFrame, PayloadFrame, RequestFrame
+
+DEFAULT_MAXIMUM_FRAME_SIZE = 64 * 1024 * 1024
+DEFAULT_MAXIMUM_TOTAL_SIZE = 256 * 1024 * 1024
+
+
+class _FragmentedFrame:
+    __slots__ = (
+        'frame',
+        'data_parts',
+        'metadata_parts',
+        'size'
+    )
+
+    def __init__(self, frame: FragmentableFrame):
+        self.frame = frame
+        self.data_parts: List[bytes] = []
+        self.metadata_parts: List[bytes] = []
+        self.size = 0
+        self.append(frame)
+
+    def append(self, frame: FragmentableFrame):
+        if frame.data:
+            self.data_parts.append(frame.data)
+            self.size += len(frame.data)
+
+        if frame.metadata:
+            self.metadata_parts.append(frame.metadata)
+            self.size += len(frame.metadata)
+
+    def assemble(self, last_frame: FragmentableFrame) -> FragmentableFrame:
+        frame = self.frame
+
+        if self.data_parts:
+            frame.data = _join(self.data_parts)
+
+        if self.metadata_parts:
+            frame.metadata = _join(self.metadata_parts)
+
+        frame.flags_follows = False
+        frame.flags_complete = last_frame.flags_complete
+
+        if isinstance(frame, PayloadFrame):
+            frame.flags_next = last_frame.flags_next
+
+        return frame
+
+
+def _join(parts: List[bytes]) -> bytes:
+    if len(parts) == 1:
+        return bytes(parts[0])
+
+    return b''.join(parts)
 
 
 class FrameFragmentCache:
-    __slots__ = 'frame_by_stream_id'
+    """
+    Reassembles fragmented frames. The fragments of a frame are kept as a list and joined once, on the last fragment.
+
+    A fragmented frame larger than maximum_frame_size, or which would make all partially received frames
+    larger than maximum_total_size together, is rejected with RSocketFrameFragmentLimitExceeded.
+    The remaining fragments of a rejected frame are ignored.
+    """
+
+    __slots__ = (
+        '_fragments_by_stream_id',
+        '_rejected_stream_ids',
+        '_maximum_frame_size',
+        '_maximum_total_size',
+        '_total_size'
+    )
+
+    def __init__(self,
+                 maximum_frame_size: int = DEFAULT_MAXIMUM_FRAME_SIZE,
+                 maximum_total_size: int = DEFAULT_MAXIMUM_TOTAL_SIZE):
+        self._fragments_by_stream_id: Dict[int, _FragmentedFrame] = {}
+        self._rejected_stream_ids: Set[int] = set()
+        self._maximum_frame_size = maximum_frame_size
+        self._maximum_total_size = maximum_total_size
+        self._total_size = 0
 
-    def __init__(self):
-        self.frame_by_stream_id = {}
+    @property
+    def total_size(self) -> int:
+        """Bytes held by partially received frames."""
+
+        return self._total_size
 
     def append(self, frame: FragmentableFrame) -> Optional[FragmentableFrame]:
+        stream_id = frame.stream_id
+        fragments = self._fragments_by_stream_id.get(stream_id)
+
+        if fragments is None:
+            if self._rejected_stream_ids:
+                if stream_id in self._rejected_stream_ids:
+                    if not frame.flags_follows:
+                        self._rejected_stream_ids.discard(stream_id)
+                    return None
+
+            if not frame.flags_follows:
+                return frame
+
+            fragments = self._fragments_by_stream_id[stream_id] = _FragmentedFrame(frame)
+            self._total_size += fragments.size
+        else:
+            if type(fragments.frame) != type(frame) and not _is_request_fragment(fragments.frame, frame):
+                self._remove(stream_id)
+                raise RSocketFrameFragmentDifferentType()
+
+            size_before = fragments.size
+            fragments.append(frame)
+            self._total_size += fragments.size - size_before
+
+        self._check_limits(stream_id, fragments, frame.flags_follows)
+
         if frame.flags_follows:
-            self.frame_by_stream_id[frame.stream_id] = self.frame_fragment_builder(frame)
             return None
-        else:
-            if frame.stream_id in self.frame_by_stream_id:
-                frame = self.frame_fragment_builder(frame)
-                self.frame_by_stream_id.pop(frame.stream_id)
-            return frame
 
-    def frame_fragment_builder(self, next_frame: FragmentableFrame) -> FragmentableFrame:
-        current_frame_from_fragments = self.frame_by_stream_id.get(next_frame.stream_id, next_frame)
+        self._remove(stream_id)
+        return fragments.assemble(frame)
 
-        if type(current_frame_from_fragments) != type(next_frame):
-            raise RSocketFrameFragmentDifferentType()
+    def reject(self, stream_id: int):
+        """Ignore the remaining fragments of the frame being received on stream_id."""
 
-        current_frame_from_fragments.flags_complete = next_frame.flags_complete
-        current_frame_from_fragments.flags_next = next_frame.flags_next
+        self._rejected_stream_ids.add(stream_id)
 
-        if next_frame.flags_follows:
-            if current_frame_from_fragments is not next_frame:
-                self.merge_frame_content_inplace(current_frame_from_fragments, next_frame)
+    def is_receiving(self, stream_id: int) -> bool:
+        """A fragmented frame is being received, or ignored, on stream_id."""
+
+        return stream_id in self._fragments_by_stream_id or stream_id in self._rejected_stream_ids
+
+    def _check_limits(self, stream_id: int, fragments: _FragmentedFrame, follows: bool):
+        if fragments.size > self._maximum_frame_size:
+            limit = self._maximum_frame_size
+        elif self._total_size > self._maximum_total_size:
+            limit = self._maximum_total_size
         else:
-            self.merge_frame_content_inplace(current_frame_from_fragments, next_frame)
-            next_frame = current_frame_from_fragments
-            next_frame.flags_follows = False
-
-        return current_frame_from_fragments
-
-    # noinspection PyMethodMayBeStatic
-    def merge_frame_content_inplace(self,
-                                    current_frame_from_fragments: FragmentableFrame,
-                                    next_frame: FragmentableFrame):
-        if next_frame.data is not None:
-            if current_frame_from_fragments.data is None:
-                current_frame_from_fragments.data = b''
-            current_frame_from_fragments.data += next_frame.data
-
-        if next_frame.metadata is not None:
-            current_frame_from_fragments.metadata += next_frame.metadata
+            return
+
+        self._remove(stream_id)
+
+        if follows:
+            self._rejected_stream_ids.add(stream_id)
+
+        raise RSocketFrameFragmentLimitExceeded(stream_id, limit)
+
+    def _remove(self, stream_id: int):
+        fragments = self._fragments_by_stream_id.pop(stream_id)
+        self._total_size -= fragments.size
+
+
+def _is_request_fragment(first_fragment: FragmentableFrame, next_fragment: FragmentableFrame) -> bool:
+    """The fragments following the first one of a request are PAYLOAD frames."""
+
+    return isinstance(first_fragment, RequestFrame) and isinstance(next_fragment, PayloadFrame)
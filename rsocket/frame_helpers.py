@@ -18,7 +18,7 @@ def pack_string(buffer: bytes) -> bytes:
 
 def unpack_string(buffer: bytes, offset: int) -> Tuple[int, bytes]:
     length = struct.unpack_from('b', buffer, offset)[0]
-    result = buffer[offset + 1:offset + length + 1]
+    result = bytes(buffer[offset + 1:offset + length + 1])
     return length, result
 
 
@@ -1,42 +1,180 @@
-import struct
-from typing import AsyncGenerator
+from typing import AsyncGenerator, List, Optional
 
 from rsocket import frame
+from rsocket.frame_helpers import unpack_24bit
 from rsocket.logger import logger
 
-__all__ = ['FrameParser']
+__all__ = ['FrameParser', 'BufferedFrameParser']
 
 from rsocket.frame import Frame, InvalidFrame
 
+FRAME_LENGTH_HEADER_SIZE = 3
+
 
 class FrameParser:
-    def __init__(self):
+    """
+    If lazy_payloads is set, the data of payload carrying frames is a read-only memoryview into the receive buffer.
+    A buffer region referenced by such views is never overwritten, so the views stay valid for as long as
+    they are referenced, but they keep the whole receive buffer alive. Use Payload.materialize to copy the
+    data if it needs to be retained.
+    """
+
+    __slots__ = (
+        '_buffer',
+        '_offset',
+        '_lazy_payloads'
+    )
+
+    def __init__(self, lazy_payloads: bool = False):
         self._buffer = bytearray()
+        self._offset = 0
+        self._lazy_payloads = lazy_payloads
 
     async def receive_data(self, data: bytes, header_length=3) -> AsyncGenerator[Frame, None]:
+        for new_frame in self.receive_frames(data, header_length):
+            yield new_frame
+
+    def receive_frames(self, data: bytes, header_length=3) -> List[Frame]:
+        self._compact()
         self._buffer.extend(data)
-        total = len(self._buffer)
 
-        frame_length_byte_count = header_length
+        frames = self._decode_frames(len(self._buffer), header_length, len(data))
 
-        while total >= frame_length_byte_count:
-            if header_length > 0:
-                length = struct.unpack('>I', b'\x00' + self._buffer[:frame_length_byte_count])[0]
-            else:
-                length = len(data)
+        if self._offset == len(self._buffer):
+            self._compact()
 
-            if total < length + frame_length_byte_count:
-                return
+        return frames
 
-            try:
-                new_frame = frame.parse_or_ignore(
-                    self._buffer[frame_length_byte_count:length + frame_length_byte_count])
+    def missing_frame_bytes(self) -> int:
+        """Number of bytes still required to complete the partially received frame, if its length is known."""
+
+        available = self._buffer_end() - self._offset
+
+        if available < FRAME_LENGTH_HEADER_SIZE:
+            return 0
+
+        length = unpack_24bit(self._buffer, self._offset)
+        return max(0, FRAME_LENGTH_HEADER_SIZE + length - available)
+
+    def _buffer_end(self) -> int:
+        return len(self._buffer)
+
+    def _decode_frames(self, end: int, header_length: int, message_length: int = 0) -> List[Frame]:
+        frames = []
+        offset = self._offset
+
+        with memoryview(self._buffer) as buffer_view:
+            if self._lazy_payloads:
+                buffer_view = buffer_view.toreadonly()
+
+            while end - offset > header_length:
+                if header_length > 0:
+                    length = unpack_24bit(buffer_view, offset)
+                else:
+                    length = message_length
+
+                frame_end = offset + header_length + length
+
+                if frame_end > end:
+                    break
+
+                new_frame = self._parse_frame(buffer_view[offset + header_length:frame_end])
 
                 if new_frame is not None:
-                    yield new_frame
-            except Exception:
-                logger().error('Error parsing frame', exc_info=True)
-                yield InvalidFrame()
+                    frames.append(new_frame)
+
+                offset = frame_end
+
+        self._offset = offset
+        return frames
+
+    def _compact(self):
+        if self._offset > 0:
+            try:
+                del self._buffer[:self._offset]
+            except BufferError:  # a view of a parsed frame is still referenced, e.g. lazy payload data
+                self._buffer = self._buffer[self._offset:]
+
+            self._offset = 0
+
+    # noinspection PyMethodMayBeStatic
+    def _parse_frame(self, frame_buffer: memoryview) -> Optional[Frame]:
+        try:
+            return frame.parse_or_ignore(frame_buffer, self._lazy_payloads)
+        except Exception:
+            logger().error('Error parsing frame', exc_info=True)
+            return InvalidFrame()
+
+
+class BufferedFrameParser(FrameParser):
+    """
+    Parses length prefixed frames from a preallocated buffer which is written into directly
+    (e.g. by an asyncio.BufferedProtocol) using get_buffer and buffer_updated.
+    """
+
+    __slots__ = (
+        '_end',
+        '_minimum_free_space'
+    )
+
+    def __init__(self, initial_size: int = 64 * 1024, minimum_free_space: int = 4096, lazy_payloads: bool = False):
+        super().__init__(lazy_payloads)
+        self._buffer = bytearray(initial_size)
+        self._end = 0
+        self._minimum_free_space = minimum_free_space
+
+    def get_buffer(self, size_hint: int = -1) -> memoryview:
+        required = max(size_hint, self.missing_frame_bytes(), self._minimum_free_space)
+
+        if len(self._buffer) - self._end < required:
+            self._make_room(required)
+
+        return memoryview(self._buffer)[self._end:]
+
+    def buffer_updated(self, byte_count: int) -> List[Frame]:
+        self._end += byte_count
+
+        frames = self._decode_frames(self._end, FRAME_LENGTH_HEADER_SIZE)
+
+        if self._offset == self._end and not self._lazy_payloads:
+            self._offset = self._end = 0
+
+        return frames
+
+    def receive_frames(self, data: bytes, header_length=3) -> List[Frame]:
+        if header_length != FRAME_LENGTH_HEADER_SIZE:
+            raise ValueError('Buffered frame parser only supports length prefixed frames')
+
+        with self.get_buffer(len(data)) as free_space:
+            free_space[:len(data)] = data
+
+        return self.buffer_updated(len(data))
+
+    def _buffer_end(self) -> int:
+        return self._end
+
+    def _make_room(self, required: int):
+        unread = self._end - self._offset
+
+        if unread + required > len(self._buffer):
+            new_buffer = bytearray(max(2 * len(self._buffer), unread + required))
+            new_buffer[:unread] = self._buffer[self._offset:self._end]
+            self._buffer = new_buffer
+        elif self._lazy_payloads and self._is_buffer_referenced():
+            new_buffer = bytearray(len(self._buffer))
+            new_buffer[:unread] = self._buffer[self._offset:self._end]
+            self._buffer = new_buffer
+        else:
+            self._buffer[:unread] = self._buffer[self._offset:self._end]
+
+        self._offset = 0
+        self._end = unread
+
+    def _is_buffer_referenced(self) -> bool:
+        try:
+            self._buffer.append(0)
+        except BufferError:
+            return True
 
-            self._buffer = self._buffer[length + frame_length_byte_count:]
-            total -= length + frame_length_byte_count
+        del self._buffer[-1]
+        return False
@@ -0,0 +1,36 @@
+import asyncio
+from typing import List
+
+from rsocket.frame import Frame
+
+__all__ = ['FrameSerializer']
+
+
+class FrameSerializer:
+    """
+    Serializes batches of length prefixed frames into a reusable output buffer.
+
+    The buffer is only reused if the asyncio transport sent the previous batch in full,
+    since otherwise the transport may still reference it.
+    """
+
+    __slots__ = (
+        '_buffer',
+        '_maximum_retained_size'
+    )
+
+    def __init__(self, maximum_retained_size: int = 1024 * 1024):
+        self._buffer = bytearray()
+        self._maximum_retained_size = maximum_retained_size
+
+    def write_frames(self, transport: asyncio.WriteTransport, frames: List[Frame]):
+        end = 0
+
+        for frame in frames:
+            end = frame.serialize_into(self._buffer, end)
+
+        with memoryview(self._buffer) as buffer_view:
+            transport.write(buffer_view[:end])
+
+        if transport.get_write_buffer_size() > 0 or len(self._buffer) > self._maximum_retained_size:
+            self._buffer = bytearray()
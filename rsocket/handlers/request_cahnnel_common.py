@@ -4,22 +4,28 @@ from typing import Optional
 from reactivestreams.publisher import Publisher
 from reactivestreams.subscriber import Subscriber, DefaultSubscriber
 from reactivestreams.subscription import Subscription
+from rsocket.exceptions import RSocketRequestTimeout
 from rsocket.frame import CancelFrame, ErrorFrame, RequestNFrame, \
     PayloadFrame, Frame, error_frame_to_exception
 from rsocket.helpers import payload_from_frame
 from rsocket.logger import logger
 from rsocket.payload import Payload
 from rsocket.rsocket import RSocket
+from rsocket.streaming_payload import StreamingPayload
+from rsocket.streams.backpressureapi import WritableSubscriber
 from rsocket.streams.stream_handler import StreamHandler
 
 
-class StreamSubscriber(DefaultSubscriber):
+class StreamSubscriber(DefaultSubscriber, WritableSubscriber):
     def __init__(self, stream_id: int, socket, requester: 'RequestChannelCommon'):
         super().__init__()
         self._stream_id = stream_id
         self._socket = socket
         self._requester = requester
 
+    async def wait_writable(self):
+        await self._socket.wait_writable()
+
     def on_next(self, value, is_complete=False):
         self._socket.send_payload(
             self._stream_id, value, complete=is_complete)
@@ -76,6 +82,18 @@ class RequestChannelCommon(StreamHandler, Publisher, Subscription, metaclass=abc
             self.remote_subscriber.on_error(error_frame_to_exception(frame))
             self.mark_completed_and_finish(received=True)
 
+    def timeout_expired(self):
+        if self.subscriber is not None and self.subscriber.subscription is not None:
+            self.subscriber.subscription.cancel()
+
+        self._finish_on_timeout()
+
+        if self.remote_subscriber is not None:
+            self.remote_subscriber.on_error(RSocketRequestTimeout())
+
+    def _finish_on_timeout(self):
+        self._finish_stream()
+
     def _complete_remote_subscriber(self):
         if self.remote_subscriber is not None:
             self.remote_subscriber.on_complete()
@@ -103,5 +121,17 @@ class RequestChannelCommon(StreamHandler, Publisher, Subscription, metaclass=abc
     def cancel(self):
         self.send_cancel()
 
+    def stream_fragments(self):
+        """
+        Send fragmented payloads to the remote subscriber as a StreamingPayload when their first fragment is received,
+        instead of after all fragments were reassembled.
+        """
+
+        self.streams_fragments = True
+        return self
+
+    def streaming_payload_received(self, payload: StreamingPayload):
+        self.remote_subscriber.on_next(payload)
+
     def request(self, n: int):
         self.send_request_n(n)
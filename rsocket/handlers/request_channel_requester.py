@@ -1,3 +1,4 @@
+from datetime import timedelta
 from typing import Optional
 
 from reactivestreams.publisher import Publisher
@@ -10,9 +11,14 @@ from rsocket.rsocket import RSocket
 
 class RequestChannelRequester(RequestChannelCommon):
 
-    def __init__(self, socket: RSocket, payload: Payload, remote_publisher: Optional[Publisher] = None):
+    def __init__(self,
+                 socket: RSocket,
+                 payload: Payload,
+                 remote_publisher: Optional[Publisher] = None,
+                 timeout: Optional[timedelta] = None):
         super().__init__(socket, remote_publisher)
         self._payload = payload
+        self._timeout = timeout
 
     def setup(self):
         super().setup()
@@ -25,10 +31,14 @@ class RequestChannelRequester(RequestChannelCommon):
                                      self._remote_publisher is None)
         )
 
+    def _finish_on_timeout(self):
+        self.send_cancel()
+
     def subscribe(self, subscriber: Subscriber):
         self.setup()
         super().subscribe(subscriber)
         self._send_channel_request(self._payload)
+        self._start_timeout(self._timeout)
 
         if self._remote_publisher is None:
             self.mark_completed_and_finish(sent=True)
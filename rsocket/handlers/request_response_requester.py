@@ -1,6 +1,9 @@
 import asyncio
 from asyncio import Future
+from datetime import timedelta
+from typing import Optional
 
+from rsocket.exceptions import RSocketRequestTimeout
 from rsocket.frame import ErrorFrame, PayloadFrame, Frame, error_frame_to_exception
 from rsocket.frame_builders import to_request_response_frame
 from rsocket.helpers import create_future, payload_from_frame
@@ -10,9 +13,10 @@ from rsocket.streams.stream_handler import StreamHandler
 
 
 class RequestResponseRequester(StreamHandler):
-    def __init__(self, socket: RSocket, payload: Payload):
+    def __init__(self, socket: RSocket, payload: Payload, timeout: Optional[timedelta] = None):
         super().__init__(socket)
         self._payload = payload
+        self._timeout = timeout
         self._future = create_future()
 
     def setup(self):
@@ -21,6 +25,7 @@ class RequestResponseRequester(StreamHandler):
     def run(self) -> Future:
         request = to_request_response_frame(self.stream_id, self._payload)
         self.socket.send_request(request)
+        self._start_timeout(self._timeout)
         return self._future
 
     def frame_received(self, frame: Frame):
@@ -31,6 +36,12 @@ class RequestResponseRequester(StreamHandler):
             self._future.set_exception(error_frame_to_exception(frame))
             self._finish_stream()
 
+    def timeout_expired(self):
+        self.send_cancel()
+
+        if not self._future.done():
+            self._future.set_exception(RSocketRequestTimeout())
+
     def _on_future_complete(self, future: asyncio.Future):
         if future.cancelled():
             self.cancel()
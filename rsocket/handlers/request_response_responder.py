@@ -24,6 +24,10 @@ class RequestResponseResponder(StreamHandler):
 
         self._finish_stream()
 
+    def timeout_expired(self):
+        self.future.cancel()
+        self._finish_stream()
+
     def frame_received(self, frame: Frame):
         if isinstance(frame, CancelFrame):
             self.future.cancel()
@@ -1,16 +1,22 @@
+from datetime import timedelta
+from typing import Optional
+
 from reactivestreams.subscriber import Subscriber
+from rsocket.exceptions import RSocketRequestTimeout
 from rsocket.frame import ErrorFrame, PayloadFrame, Frame, error_frame_to_exception
 from rsocket.frame_builders import to_request_stream_frame
 from rsocket.helpers import payload_from_frame, DefaultPublisherSubscription
 from rsocket.payload import Payload
 from rsocket.rsocket import RSocket
+from rsocket.streaming_payload import StreamingPayload
 from rsocket.streams.stream_handler import StreamHandler
 
 
 class RequestStreamRequester(StreamHandler, DefaultPublisherSubscription):
-    def __init__(self, socket: RSocket, payload: Payload):
+    def __init__(self, socket: RSocket, payload: Payload, timeout: Optional[timedelta] = None):
         super().__init__(socket)
         self.payload = payload
+        self._timeout = timeout
 
     def setup(self):
         pass
@@ -18,14 +24,31 @@ class RequestStreamRequester(StreamHandler, DefaultPublisherSubscription):
     def subscribe(self, subscriber: Subscriber):
         super().subscribe(subscriber)
         self._send_stream_request(self.payload)
+        self._start_timeout(self._timeout)
 
     def cancel(self):
         super().cancel()
         self.send_cancel()
 
+    def timeout_expired(self):
+        self.send_cancel()
+        self._subscriber.on_error(RSocketRequestTimeout())
+
     def request(self, n: int):
         self.send_request_n(n)
 
+    def stream_fragments(self):
+        """
+        Send fragmented payloads to the subscriber as a StreamingPayload when their first fragment is received,
+        instead of after all fragments were reassembled.
+        """
+
+        self.streams_fragments = True
+        return self
+
+    def streaming_payload_received(self, payload: StreamingPayload):
+        self._subscriber.on_next(payload)
+
     def frame_received(self, frame: Frame):
         if isinstance(frame, PayloadFrame):
             if frame.flags_next:
@@ -1,17 +1,47 @@
 from reactivestreams.publisher import Publisher
 from reactivestreams.subscriber import DefaultSubscriber
+from reactivestreams.subscription import Subscription
 from rsocket.frame import CancelFrame, RequestNFrame, \
     RequestStreamFrame, Frame
 from rsocket.payload import Payload
 from rsocket.rsocket import RSocket
+from rsocket.streams.backpressureapi import WritableSubscriber
 from rsocket.streams.stream_handler import StreamHandler
 
 
-class StreamSubscriber(DefaultSubscriber):
+class StreamSubscriber(DefaultSubscriber, WritableSubscriber):
+    """Requests and cancellation received before the publisher subscribes are applied once it does."""
+
     def __init__(self, stream_id: int, socket):
         super().__init__()
         self.stream_id = stream_id
         self.socket = socket
+        self._pending_request_n = 0
+        self._cancelled = False
+
+    def on_subscribe(self, subscription: Subscription):
+        super().on_subscribe(subscription)
+
+        if self._cancelled:
+            subscription.cancel()
+        elif self._pending_request_n > 0:
+            request_n, self._pending_request_n = self._pending_request_n, 0
+            subscription.request(request_n)
+
+    def request(self, n: int):
+        if self.subscription is None:
+            self._pending_request_n += n
+        else:
+            self.subscription.request(n)
+
+    def cancel(self):
+        self._cancelled = True
+
+        if self.subscription is not None:
+            self.subscription.cancel()
+
+    async def wait_writable(self):
+        await self.socket.wait_writable()
 
     def on_next(self, value: Payload, is_complete=False):
         self.socket.send_payload(
@@ -42,12 +72,18 @@ class RequestStreamResponder(StreamHandler):
         self.subscriber = StreamSubscriber(self.stream_id, self.socket)
         self.publisher.subscribe(self.subscriber)
 
+    def timeout_expired(self):
+        if self.subscriber is not None:
+            self.subscriber.cancel()
+
+        self._finish_stream()
+
     def frame_received(self, frame: Frame):
         if isinstance(frame, RequestStreamFrame):
             self.setup()
-            self.subscriber.subscription.request(frame.initial_request_n)
+            self.subscriber.request(frame.initial_request_n)
         elif isinstance(frame, CancelFrame):
-            self.subscriber.subscription.cancel()
+            self.subscriber.cancel()
             self._finish_stream()
         elif isinstance(frame, RequestNFrame):
-            self.subscriber.subscription.request(frame.request_n)
+            self.subscriber.request(frame.request_n)
@@ -1,9 +1,10 @@
 import asyncio
 from asyncio import Task
 from contextlib import contextmanager
+from datetime import timedelta
 from typing import Any
 from typing import TypeVar
-from typing import Union, Callable, Optional, Tuple
+from typing import Union, Callable, Optional, Tuple, Iterable, List, Dict
 
 from reactivestreams.publisher import DefaultPublisher
 from reactivestreams.subscriber import Subscriber
@@ -60,6 +61,44 @@ class WellKnownType:
         return hash((self.id, self.name))
 
 
+class WellKnownTypeIndex:
+    """
+    Constant time lookup of well known types by id and by name.
+    The ids which fit in the 7 bits of a serialized well known type are kept in an array.
+    """
+
+    __slots__ = (
+        '_by_id',
+        '_by_other_id',
+        '_by_name'
+    )
+
+    def __init__(self, well_known_types: Iterable[WellKnownType]):
+        self._by_id: List[Optional[WellKnownType]] = [None] * 128
+        self._by_other_id: Dict[int, WellKnownType] = {}
+        self._by_name: Dict[bytes, WellKnownType] = {}
+
+        for well_known_type in well_known_types:
+            if 0 <= well_known_type.id < 128:
+                self._by_id[well_known_type.id] = well_known_type
+            else:
+                self._by_other_id[well_known_type.id] = well_known_type
+
+            self._by_name[well_known_type.name] = well_known_type
+
+    def get_by_id(self, id_: int) -> Optional[WellKnownType]:
+        if 0 <= id_ < 128:
+            return self._by_id[id_]
+
+        return self._by_other_id.get(id_)
+
+    def get_by_name(self, name: Union[bytes, bytearray, str]) -> Optional[WellKnownType]:
+        if isinstance(name, bytearray):
+            name = bytes(name)
+
+        return self._by_name.get(name)
+
+
 @contextmanager
 def wrap_transport_exception():
     try:
@@ -68,6 +107,15 @@ def wrap_transport_exception():
         raise RSocketTransportError from exception
 
 
+def timeout_arguments(timeout: Optional[timedelta]) -> Dict[str, timedelta]:
+    """Pass the timeout of a request on to a wrapped RSocket only if set, so implementations without it still work."""
+
+    if timeout is None:
+        return {}
+
+    return {'timeout': timeout}
+
+
 async def single_transport_provider(transport):
     yield transport
 
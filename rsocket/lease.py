@@ -1,6 +1,7 @@
 import abc
 import asyncio
-from datetime import timedelta, datetime
+from datetime import timedelta
+from time import monotonic
 from typing import Optional
 
 from reactivestreams.publisher import Publisher
@@ -37,7 +38,7 @@ class DefinedLease(Lease):
         'maximum_request_count',
         '_request_counter',
         'maximum_lease_time',
-        '_lease_created_at'
+        '_expires_at'
     )
 
     def __str__(self) -> str:
@@ -48,14 +49,14 @@ class DefinedLease(Lease):
                  maximum_lease_time: timedelta = timedelta(milliseconds=MAX_31_BIT)):
         self.maximum_request_count = maximum_request_count
         self.maximum_lease_time = maximum_lease_time
-        self._lease_created_at = datetime.now()
+        self._expires_at = monotonic() + maximum_lease_time.total_seconds()
         self._request_counter = 0
 
     def is_request_allowed(self, stream_id: Optional[int] = None):
         return self._is_request_allowed()
 
     def _is_request_allowed(self) -> bool:
-        if self._lease_created_at + self.maximum_lease_time <= datetime.now():
+        if self._expires_at <= monotonic():
             return False
 
         self._request_counter += 1
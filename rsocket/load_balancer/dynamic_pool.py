@@ -0,0 +1,156 @@
+import asyncio
+import random
+from datetime import timedelta
+from itertools import islice
+from time import monotonic
+from typing import List, Dict, Callable, Hashable, Optional, AsyncIterable, Set
+
+from rsocket.exceptions import RSocketNoAvailableTransport
+from rsocket.helpers import cancel_if_task_exists
+from rsocket.load_balancer.lazy_pool_member import LazyPoolMember
+from rsocket.load_balancer.load_balancer_strategy import LoadBalancerStrategy
+from rsocket.load_balancer.pool_member import DEFAULT_LATENCY_SMOOTHING, DEFAULT_ERROR_RATE_SMOOTHING
+from rsocket.logger import logger
+from rsocket.rsocket import RSocket
+
+RSocketFactory = Callable[[], RSocket]
+
+SELECTION_SAMPLE_SIZE = 8
+
+
+class LoadBalancerDynamicPool(LoadBalancerStrategy):
+    """
+    A pool whose members are added and removed while in use, by key, from a discovery callback
+    (update_members) or an async iterable of membership snapshots.
+
+    Members are given as RSocket factories. A member is created and connected when first selected,
+    at most max_concurrent_connects at a time, and closed after idle_timeout without requests and open streams.
+    Removed members are closed once idle.
+
+    Selection compares the first two available members of a random sample of at most eight
+    (power of two choices), preferring connected ones, so it takes constant time whatever the pool size.
+    If none of the sampled members is available, selection fails with RSocketNoAvailableTransport.
+    """
+
+    def __init__(self,
+                 members: Optional[Dict[Hashable, RSocketFactory]] = None,
+                 discovery: Optional[AsyncIterable[Dict[Hashable, RSocketFactory]]] = None,
+                 max_concurrent_connects: int = 8,
+                 idle_timeout: Optional[timedelta] = timedelta(minutes=1),
+                 idle_check_interval: timedelta = timedelta(seconds=5),
+                 reconnect_delay: timedelta = timedelta(seconds=1),
+                 auto_close=True,
+                 latency_smoothing: float = DEFAULT_LATENCY_SMOOTHING,
+                 error_rate_smoothing: float = DEFAULT_ERROR_RATE_SMOOTHING):
+        self._discovery = discovery
+        self._idle_timeout = idle_timeout.total_seconds() if idle_timeout is not None else None
+        self._idle_check_interval = idle_check_interval.total_seconds()
+        self._reconnect_delay = reconnect_delay
+        self._auto_close = auto_close
+        self._latency_smoothing = latency_smoothing
+        self._error_rate_smoothing = error_rate_smoothing
+        self._connect_limit = asyncio.Semaphore(max_concurrent_connects)
+        self._members: List[LazyPoolMember] = []
+        self._member_index: Dict[Hashable, int] = {}
+        self._removed_members: Set[LazyPoolMember] = set()
+        self._discovery_task: Optional[asyncio.Task] = None
+        self._idle_check_task: Optional[asyncio.Task] = None
+
+        if members is not None:
+            self.update_members(members)
+
+    @property
+    def members(self) -> List[LazyPoolMember]:
+        return self._members
+
+    def add_member(self, key: Hashable, rsocket_factory: RSocketFactory) -> LazyPoolMember:
+        if key in self._member_index:
+            return self._members[self._member_index[key]]
+
+        member = LazyPoolMember(key, rsocket_factory, self._connect_limit, self._reconnect_delay,
+                                self._latency_smoothing, self._error_rate_smoothing)
+        self._member_index[key] = len(self._members)
+        self._members.append(member)
+        return member
+
+    def remove_member(self, key: Hashable) -> Optional[LazyPoolMember]:
+        index = self._member_index.pop(key, None)
+
+        if index is None:
+            return None
+
+        member = self._members[index]
+        last_member = self._members.pop()
+
+        if last_member is not member:
+            self._members[index] = last_member
+            self._member_index[last_member.key] = index
+
+        self._removed_members.add(member)
+        return member
+
+    def update_members(self, members: Dict[Hashable, RSocketFactory]):
+        """Replace the pool membership with the given snapshot. Members already in the pool are kept."""
+
+        for key in [member.key for member in self._members if member.key not in members]:
+            self.remove_member(key)
+
+        for key, rsocket_factory in members.items():
+            self.add_member(key, rsocket_factory)
+
+    def select(self) -> RSocket:
+        if not self._members:
+            raise RSocketNoAvailableTransport()
+
+        sample = random.sample(self._members, min(len(self._members), SELECTION_SAMPLE_SIZE))
+        candidates = list(islice((member for member in sample if member.is_available()), 2))
+
+        if not candidates:
+            raise RSocketNoAvailableTransport()
+
+        return min(candidates, key=lambda member: (not member.is_connected(), member.cost()))
+
+    async def connect(self):
+        if self._discovery is not None and self._discovery_task is None:
+            self._discovery_task = asyncio.create_task(self._follow_discovery())
+
+        if self._idle_check_task is None:
+            self._idle_check_task = asyncio.create_task(self._close_idle_members())
+
+    async def _follow_discovery(self):
+        try:
+            async for members in self._discovery:
+                self.update_members(members)
+        except asyncio.CancelledError:
+            logger().debug('Asyncio task canceled: load balancer discovery')
+        except Exception:
+            logger().error('Load balancer discovery failed', exc_info=True)
+
+    async def _close_idle_members(self):
+        try:
+            while True:
+                await asyncio.sleep(self._idle_check_interval)
+
+                for member in [member for member in self._removed_members if member.is_idle()]:
+                    self._removed_members.discard(member)
+                    await member.close()
+
+                if self._idle_timeout is not None:
+                    idle_since = monotonic() - self._idle_timeout
+
+                    for member in self._members:
+                        if member.is_connected() and member.last_used < idle_since and member.is_idle():
+                            await member.close()
+        except asyncio.CancelledError:
+            logger().debug('Asyncio task canceled: load balancer idle check')
+
+    async def close(self):
+        await cancel_if_task_exists(self._discovery_task)
+        await cancel_if_task_exists(self._idle_check_task)
+        self._discovery_task = None
+        self._idle_check_task = None
+
+        if self._auto_close:
+            await asyncio.gather(*[member.close() for member in self._members + list(self._removed_members)],
+                                 return_exceptions=True)
+            self._removed_members.clear()
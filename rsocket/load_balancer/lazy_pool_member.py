@@ -0,0 +1,225 @@
+import asyncio
+from asyncio import Future
+from datetime import timedelta
+from time import monotonic
+from typing import Union, Optional, Any, Callable, Hashable, Awaitable
+
+from reactivestreams.publisher import Publisher
+from reactivestreams.subscriber import Subscriber
+from rsocket.exceptions import RSocketNoAvailableTransport
+from rsocket.helpers import cancel_if_task_exists, timeout_arguments
+from rsocket.load_balancer.pool_member import PoolMember, DEFAULT_LATENCY_SMOOTHING, DEFAULT_ERROR_RATE_SMOOTHING
+from rsocket.logger import logger
+from rsocket.payload import Payload
+from rsocket.rsocket import RSocket
+from rsocket.rsocket_base import RSocketBase
+from rsocket.streams.backpressureapi import BackpressureApi
+
+
+class DeferredRequester(Publisher, BackpressureApi):
+    """
+    Stands in for a stream or channel requester while its pool member connects.
+    The request is made when subscribed to, once connected, with the options given meanwhile.
+    """
+
+    def __init__(self,
+                 connection: Awaitable[RSocket],
+                 create_requester: Callable[[RSocket], Union[BackpressureApi, Publisher]]):
+        self._connection = connection
+        self._create_requester = create_requester
+        self._initial_request_n: Optional[int] = None
+        self._streams_fragments = False
+        self._subscribe_task: Optional[asyncio.Task] = None
+
+    def initial_request_n(self, n: int):
+        self._initial_request_n = n
+        return self
+
+    def stream_fragments(self):
+        self._streams_fragments = True
+        return self
+
+    def subscribe(self, subscriber: Subscriber):
+        self._subscribe_task = asyncio.create_task(self._subscribe_when_connected(subscriber))
+
+    async def _subscribe_when_connected(self, subscriber: Subscriber):
+        try:
+            rsocket = await self._connection
+        except Exception as exception:
+            subscriber.on_error(exception)
+            return
+
+        requester = self._create_requester(rsocket)
+
+        if self._initial_request_n is not None:
+            requester.initial_request_n(self._initial_request_n)
+
+        if self._streams_fragments:
+            requester.stream_fragments()
+
+        requester.subscribe(subscriber)
+
+
+class LazyPoolMember(PoolMember):
+    """
+    A pool member which creates and connects its RSocket on first use, and can be closed and connected again.
+    Requests made while connecting are sent once connected. After a failed or lost connection,
+    the member is unavailable for reconnect_delay.
+    """
+
+    def __init__(self,
+                 key: Hashable,
+                 rsocket_factory: Callable[[], RSocket],
+                 connect_limit: asyncio.Semaphore,
+                 reconnect_delay: timedelta = timedelta(seconds=1),
+                 latency_smoothing: float = DEFAULT_LATENCY_SMOOTHING,
+                 error_rate_smoothing: float = DEFAULT_ERROR_RATE_SMOOTHING):
+        super().__init__(None, latency_smoothing, error_rate_smoothing)
+        self.key = key
+        self.last_used = monotonic()
+        self._rsocket_factory = rsocket_factory
+        self._connect_limit = connect_limit
+        self._reconnect_delay = reconnect_delay.total_seconds()
+        self._connecting: Optional[asyncio.Task] = None
+        self._retry_after = 0.0
+        self._closing_tasks = set()
+
+    def is_connected(self) -> bool:
+        return self.rsocket is not None
+
+    def is_available(self) -> bool:
+        if self._connecting is None or not self._connecting.done():
+            return True
+
+        if self.rsocket is None or not super().is_available():
+            if monotonic() < self._retry_after:
+                return False
+
+            self._disconnect()
+
+        return True
+
+    def is_idle(self) -> bool:
+        if self.in_flight > 0 or (self._connecting is not None and not self._connecting.done()):
+            return False
+
+        return not isinstance(self.rsocket, RSocketBase) or self.rsocket.active_stream_count() == 0
+
+    def ensure_connected(self) -> Awaitable[RSocket]:
+        if self._connecting is None:
+            self._connecting = asyncio.create_task(self._connect())
+
+        return asyncio.shield(self._connecting)
+
+    async def _connect(self) -> RSocket:
+        rsocket = None
+
+        try:
+            async with self._connect_limit:
+                rsocket = self._rsocket_factory()
+                await rsocket.connect()
+
+            if isinstance(rsocket, RSocketBase) and rsocket.is_connection_lost():
+                raise RSocketNoAvailableTransport()
+        except (Exception, asyncio.CancelledError):
+            if rsocket is not None:
+                self._close_in_background(rsocket)
+
+            self._retry_after = monotonic() + self._reconnect_delay
+            raise
+
+        self.rsocket = rsocket
+        return rsocket
+
+    def _disconnect(self):
+        connecting, rsocket = self._connecting, self.rsocket
+        self._connecting = None
+        self.rsocket = None
+
+        if connecting is not None and not connecting.done():
+            connecting.cancel()
+
+        if rsocket is not None:
+            self._close_in_background(rsocket)
+
+    def _close_in_background(self, rsocket: RSocket):
+        task = asyncio.create_task(self._close_rsocket(rsocket))
+        self._closing_tasks.add(task)
+        task.add_done_callback(self._closing_tasks.discard)
+
+    @staticmethod
+    async def _close_rsocket(rsocket: RSocket):
+        try:
+            await rsocket.close()
+        except Exception:
+            logger().debug('Pool member already closed or failed to close', exc_info=True)
+
+    def request_response(self, payload: Payload, timeout: Optional[timedelta] = None) -> Future:
+        self.last_used = monotonic()
+
+        if self.rsocket is not None:
+            return super().request_response(payload, timeout)
+
+        return asyncio.ensure_future(self._request_response_when_connected(payload, timeout))
+
+    async def _request_response_when_connected(self, payload: Payload, timeout: Optional[timedelta]):
+        rsocket = await self.ensure_connected()
+        return await self._track_response(rsocket.request_response(payload, **timeout_arguments(timeout)))
+
+    def request_channel(self,
+                        payload: Payload,
+                        local_publisher: Optional[Publisher] = None,
+                        timeout: Optional[timedelta] = None) -> Union[Any, Publisher]:
+        self.last_used = monotonic()
+
+        if self.rsocket is not None:
+            return self.rsocket.request_channel(payload, local_publisher, **timeout_arguments(timeout))
+
+        return DeferredRequester(self.ensure_connected(),
+                                 lambda rsocket: rsocket.request_channel(payload, local_publisher,
+                                                                         **timeout_arguments(timeout)))
+
+    def request_stream(self,
+                       payload: Payload,
+                       timeout: Optional[timedelta] = None) -> Union[BackpressureApi, Publisher]:
+        self.last_used = monotonic()
+
+        if self.rsocket is not None:
+            return self.rsocket.request_stream(payload, **timeout_arguments(timeout))
+
+        return DeferredRequester(self.ensure_connected(),
+                                 lambda rsocket: rsocket.request_stream(payload, **timeout_arguments(timeout)))
+
+    def fire_and_forget(self, payload: Payload):
+        self.last_used = monotonic()
+
+        if self.rsocket is not None:
+            self.rsocket.fire_and_forget(payload)
+        else:
+            self._when_connected(lambda rsocket: rsocket.fire_and_forget(payload))
+
+    def metadata_push(self, metadata: bytes):
+        if self.rsocket is not None:
+            self.rsocket.metadata_push(metadata)
+        else:
+            self._when_connected(lambda rsocket: rsocket.metadata_push(metadata))
+
+    def _when_connected(self, action: Callable[[RSocket], Any]):
+        def on_connected(connection: Future):
+            if not connection.cancelled() and connection.exception() is None:
+                action(connection.result())
+
+        self.ensure_connected().add_done_callback(on_connected)
+
+    async def connect(self):
+        await self.ensure_connected()
+
+    async def close(self):
+        connecting = self._connecting
+        self._disconnect()
+
+        if connecting is not None:
+            await cancel_if_task_exists(connecting)
+
+        if self._closing_tasks:
+            await asyncio.gather(*self._closing_tasks)
@@ -0,0 +1,11 @@
+from typing import List
+
+from rsocket.load_balancer.pool import LoadBalancerPool
+from rsocket.load_balancer.pool_member import PoolMember
+
+
+class LoadBalancerLeastLoaded(LoadBalancerPool):
+    """Selects the member with the fewest in-flight requests, preferring the lower latency on a tie."""
+
+    def _select_from(self, available: List[PoolMember]) -> PoolMember:
+        return min(available, key=lambda member: (member.in_flight, member.cost()))
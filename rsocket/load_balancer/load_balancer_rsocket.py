@@ -1,7 +1,9 @@
 from asyncio import Future
+from datetime import timedelta
 from typing import Union, Optional, Any
 
 from reactivestreams.publisher import Publisher
+from rsocket.helpers import timeout_arguments
 from rsocket.load_balancer.load_balancer_strategy import LoadBalancerStrategy
 from rsocket.payload import Payload
 from rsocket.rsocket import RSocket
@@ -13,19 +15,24 @@ class LoadBalancerRSocket(RSocket):
     def __init__(self, strategy: LoadBalancerStrategy):
         self._strategy = strategy
 
-    def request_channel(self, payload: Payload, local_publisher: Optional[Publisher] = None) -> Union[Any, Publisher]:
+    def request_channel(self,
+                        payload: Payload,
+                        local_publisher: Optional[Publisher] = None,
+                        timeout: Optional[timedelta] = None) -> Union[Any, Publisher]:
         return self._select_client().request_channel(
-            payload, local_publisher
+            payload, local_publisher, **timeout_arguments(timeout)
         )
 
-    def request_response(self, payload: Payload) -> Future:
-        return self._select_client().request_response(payload)
+    def request_response(self, payload: Payload, timeout: Optional[timedelta] = None) -> Future:
+        return self._select_client().request_response(payload, **timeout_arguments(timeout))
 
     def fire_and_forget(self, payload: Payload):
         self._select_client().fire_and_forget(payload)
 
-    def request_stream(self, payload: Payload) -> Union[BackpressureApi, Publisher]:
-        return self._select_client().request_stream(payload)
+    def request_stream(self,
+                       payload: Payload,
+                       timeout: Optional[timedelta] = None) -> Union[BackpressureApi, Publisher]:
+        return self._select_client().request_stream(payload, **timeout_arguments(timeout))
 
     def metadata_push(self, metadata: bytes):
         self._select_client().metadata_push(metadata)
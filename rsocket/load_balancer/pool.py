@@ -0,0 +1,50 @@
+import abc
+import asyncio
+from typing import List
+
+from rsocket.exceptions import RSocketNoAvailableTransport
+from rsocket.load_balancer.load_balancer_strategy import LoadBalancerStrategy
+from rsocket.load_balancer.pool_member import PoolMember, DEFAULT_LATENCY_SMOOTHING, DEFAULT_ERROR_RATE_SMOOTHING
+from rsocket.rsocket import RSocket
+
+
+class LoadBalancerPool(LoadBalancerStrategy, metaclass=abc.ABCMeta):
+    """
+    Base for strategies which select by the load of the pool members.
+    Members whose connection was lost, or whose server stopped sending keepalive, are skipped.
+    """
+
+    def __init__(self,
+                 pool: List[RSocket],
+                 auto_connect=True,
+                 auto_close=True,
+                 latency_smoothing: float = DEFAULT_LATENCY_SMOOTHING,
+                 error_rate_smoothing: float = DEFAULT_ERROR_RATE_SMOOTHING):
+        self._auto_close = auto_close
+        self._auto_connect = auto_connect
+        self._members = [PoolMember(client, latency_smoothing, error_rate_smoothing) for client in pool]
+
+    @property
+    def members(self) -> List[PoolMember]:
+        return self._members
+
+    def select(self) -> RSocket:
+        available = [member for member in self._members if member.is_available()]
+
+        if not available:
+            raise RSocketNoAvailableTransport()
+
+        return self._select_from(available)
+
+    @abc.abstractmethod
+    def _select_from(self, available: List[PoolMember]) -> PoolMember:
+        ...
+
+    async def connect(self):
+        if self._auto_connect:
+            await asyncio.gather(*[member.connect() for member in self._members])
+
+    async def close(self):
+        if self._auto_close:
+            await asyncio.gather(*[member.close() for member in self._members],
+                                 return_exceptions=True)
@@ -0,0 +1,119 @@
+from asyncio import Future
+from datetime import timedelta
+from time import monotonic
+from typing import Union, Optional, Any
+
+from reactivestreams.publisher import Publisher
+from rsocket.helpers import timeout_arguments
+from rsocket.payload import Payload
+from rsocket.rsocket import RSocket
+from rsocket.rsocket_base import RSocketBase
+from rsocket.streams.backpressureapi import BackpressureApi
+
+DEFAULT_LATENCY_SMOOTHING = 0.3
+DEFAULT_ERROR_RATE_SMOOTHING = 0.1
+
+
+class PoolMember(RSocket):
+    """
+    Wraps an RSocket of a load balancer pool, and tracks its in-flight request_response calls
+    and the exponentially weighted moving averages of their latency and error rate.
+    Until there are 1 / error_rate_smoothing samples, the error rate is the plain average of the samples,
+    so a few failures are not diluted by the initial rate of zero.
+    """
+
+    def __init__(self,
+                 rsocket: RSocket,
+                 latency_smoothing: float = DEFAULT_LATENCY_SMOOTHING,
+                 error_rate_smoothing: float = DEFAULT_ERROR_RATE_SMOOTHING):
+        self.rsocket = rsocket
+        self.in_flight = 0
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.sample_count = 0
+        self.ejected_until: Optional[float] = None
+        self.ejection_count = 0
+        self.recovery_start: Optional[float] = None
+        self._latency_smoothing = latency_smoothing
+        self._error_rate_smoothing = error_rate_smoothing
+
+    def is_available(self) -> bool:
+        if isinstance(self.rsocket, RSocketBase):
+            return not self.rsocket.is_connection_lost() and self.rsocket.is_server_alive()
+
+        return True
+
+    def cost(self) -> float:
+        """Expected wait of a new request: the average latency times the requests it would queue behind."""
+
+        if self.latency is None:
+            return 0.0
+
+        return self.latency * (self.in_flight + 1)
+
+    def request_response(self, payload: Payload, timeout: Optional[timedelta] = None) -> Future:
+        return self._track_response(self.rsocket.request_response(payload, **timeout_arguments(timeout)))
+
+    def _track_response(self, future: Future) -> Future:
+        start = monotonic()
+        self.in_flight += 1
+
+        def on_complete(completed: Future):
+            self.in_flight -= 1
+
+            if completed.cancelled():
+                return
+
+            if completed.exception() is None:
+                self._update_latency(monotonic() - start)
+                self._update_error_rate(0.0)
+            else:
+                self._update_error_rate(1.0)
+
+        future.add_done_callback(on_complete)
+        return future
+
+    def _update_latency(self, latency: float):
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency += self._latency_smoothing * (latency - self.latency)
+
+    def _update_error_rate(self, error: float):
+        self.sample_count += 1
+        smoothing = max(self._error_rate_smoothing, 1.0 / self.sample_count)
+        self.error_rate += smoothing * (error - self.error_rate)
+
+    def reset_error_rate(self):
+        self.error_rate = 0.0
+        self.sample_count = 0
+
+    def request_channel(self,
+                        payload: Payload,
+                        local_publisher: Optional[Publisher] = None,
+                        timeout: Optional[timedelta] = None) -> Union[Any, Publisher]:
+        return self.rsocket.request_channel(payload, local_publisher, **timeout_arguments(timeout))
+
+    def fire_and_forget(self, payload: Payload):
+        self.rsocket.fire_and_forget(payload)
+
+    def request_stream(self,
+                       payload: Payload,
+                       timeout: Optional[timedelta] = None) -> Union[BackpressureApi, Publisher]:
+        return self.rsocket.request_stream(payload, **timeout_arguments(timeout))
+
+    def metadata_push(self, metadata: bytes):
+        self.rsocket.metadata_push(metadata)
+
+    async def connect(self):
+        await self.rsocket.connect()
+
+    async def close(self):
+        await self.rsocket.close()
+
+    async def __aenter__(self) -> 'PoolMember':
+        await self.rsocket.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.rsocket.close()
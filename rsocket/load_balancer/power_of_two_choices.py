@@ -0,0 +1,19 @@
+import random
+from typing import List
+
+from rsocket.load_balancer.pool import LoadBalancerPool
+from rsocket.load_balancer.pool_member import PoolMember
+
+
+class LoadBalancerPowerOfTwoChoices(LoadBalancerPool):
+    """
+    Selects the lower cost of two random members. The cost is the latency average times the in-flight requests,
+    so a slow member receives fewer requests, while still receiving some to update its latency.
+    """
+
+    def _select_from(self, available: List[PoolMember]) -> PoolMember:
+        if len(available) == 1:
+            return available[0]
+
+        first, second = random.sample(available, 2)
+        return first if first.cost() <= second.cost() else second
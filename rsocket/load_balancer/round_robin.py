@@ -22,7 +22,7 @@ class LoadBalancerRoundRobin(LoadBalancerStrategy):
 
     async def connect(self):
         if self._auto_connect:
-            [await client.connect() for client in self._pool]
+            await asyncio.gather(*[client.connect() for client in self._pool])
 
     async def close(self):
         if self._auto_close:
@@ -0,0 +1,93 @@
+import random
+from datetime import timedelta
+from time import monotonic
+from typing import List
+
+from rsocket.load_balancer.pool import LoadBalancerPool
+from rsocket.load_balancer.pool_member import PoolMember, DEFAULT_LATENCY_SMOOTHING, DEFAULT_ERROR_RATE_SMOOTHING
+from rsocket.rsocket import RSocket
+
+MINIMUM_WEIGHT_FACTOR = 0.05
+
+
+class LoadBalancerWeighted(LoadBalancerPool):
+    """
+    Selects members at random, weighted by the inverse of their cost (latency times in-flight requests)
+    and by their success rate.
+
+    A member whose error rate reaches ejection_error_rate, once it has at least minimum_samples responses
+    (so minimum_samples consecutive failures of a new member are enough), is ejected
+    for ejection_period, which grows with each consecutive ejection up to maximum_ejection_period.
+    After that its weight ramps up from almost zero to full over recovery_period.
+    If all available members are ejected, they are used anyway.
+    """
+
+    def __init__(self,
+                 pool: List[RSocket],
+                 auto_connect=True,
+                 auto_close=True,
+                 ejection_error_rate: float = 0.5,
+                 minimum_samples: int = 5,
+                 ejection_period: timedelta = timedelta(seconds=10),
+                 maximum_ejection_period: timedelta = timedelta(minutes=5),
+                 recovery_period: timedelta = timedelta(seconds=30),
+                 latency_smoothing: float = DEFAULT_LATENCY_SMOOTHING,
+                 error_rate_smoothing: float = DEFAULT_ERROR_RATE_SMOOTHING):
+        super().__init__(pool, auto_connect, auto_close, latency_smoothing, error_rate_smoothing)
+        self._ejection_error_rate = ejection_error_rate
+        self._minimum_samples = minimum_samples
+        self._ejection_period = ejection_period.total_seconds()
+        self._maximum_ejection_period = maximum_ejection_period.total_seconds()
+        self._recovery_period = recovery_period.total_seconds()
+
+    def _select_from(self, available: List[PoolMember]) -> PoolMember:
+        now = monotonic()
+        candidates = [member for member in available if not self._is_ejected(member, now)]
+
+        if not candidates:
+            candidates = available
+
+        return random.choices(candidates, self._weights(candidates, now))[0]
+
+    def _is_ejected(self, member: PoolMember, now: float) -> bool:
+        if member.ejected_until is not None:
+            if now < member.ejected_until:
+                return True
+
+            member.ejected_until = None
+            member.recovery_start = now
+            member.reset_error_rate()
+
+        if member.sample_count >= self._minimum_samples and member.error_rate >= self._ejection_error_rate:
+            self._eject(member, now)
+            return True
+
+        return False
+
+    def _eject(self, member: PoolMember, now: float):
+        member.ejection_count += 1
+        member.ejected_until = now + min(self._ejection_period * member.ejection_count,
+                                         self._maximum_ejection_period)
+        member.recovery_start = None
+        member.reset_error_rate()
+
+    def _weights(self, candidates: List[PoolMember], now: float) -> List[float]:
+        known_latencies = [member.latency for member in candidates if member.latency is not None]
+        default_latency = min(known_latencies, default=1.0) or 1.0
+
+        return [self._weight(member, default_latency, now) for member in candidates]
+
+    def _weight(self, member: PoolMember, default_latency: float, now: float) -> float:
+        latency = member.latency or default_latency
+        weight = max(1.0 - member.error_rate, MINIMUM_WEIGHT_FACTOR) / (latency * (member.in_flight + 1))
+
+        if member.recovery_start is not None:
+            recovered = (now - member.recovery_start) / self._recovery_period if self._recovery_period > 0 else 1
+
+            if recovered >= 1:
+                member.recovery_start = None
+                member.ejection_count = 0
+            else:
+                weight *= max(recovered, MINIMUM_WEIGHT_FACTOR)
+
+        return weight
@@ -1,21 +1,31 @@
 from typing import Union, Optional
 
-ByteTypes = Union[bytes, bytearray]
+ByteTypes = Union[bytes, bytearray, memoryview]
 
 
 class Payload:
+    """
+    Memoryview data and metadata are kept as is (not copied), e.g. payload data received by a transport
+    with lazy payloads enabled. Call materialize to replace them with bytes.
+    """
+
     __slots__ = ('data', 'metadata')
 
     @staticmethod
     def _check(obj):
-        assert obj is None or isinstance(obj, (bytes, bytearray))
+        assert obj is None or isinstance(obj, (bytes, bytearray, memoryview))
 
     def __init__(self, data: Optional[ByteTypes] = None, metadata: Optional[ByteTypes] = None):
         self._check(data)
         self._check(metadata)
 
-        self.data = ensure_bytes(data)
-        self.metadata = ensure_bytes(metadata)
+        self.data = ensure_bytes_or_view(data)
+        self.metadata = ensure_bytes_or_view(metadata)
+
+    def materialize(self) -> 'Payload':
+        self.data = ensure_bytes(self.data)
+        self.metadata = ensure_bytes(self.metadata)
+        return self
 
     def __str__(self):
         return "<payload: {}, {}>".format(self.data, self.metadata)
@@ -35,3 +45,10 @@ def ensure_bytes(data: Optional[ByteTypes]) -> Optional[bytes]:
         return data
 
     return bytes(data)
+
+
+def ensure_bytes_or_view(data: Optional[ByteTypes]) -> Optional[Union[bytes, memoryview]]:
+    if isinstance(data, memoryview):
+        return data
+
+    return ensure_bytes(data)
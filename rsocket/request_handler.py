@@ -66,9 +66,9 @@ class RequestHandler(metaclass=ABCMeta):
         ...
 
     # noinspection PyMethodMayBeStatic
-    def _parse_composite_metadata(self, metadata: bytes) -> CompositeMetadata:
+    def _parse_composite_metadata(self, metadata: bytes, lazy: bool = False) -> CompositeMetadata:
         composite_metadata = CompositeMetadata()
-        composite_metadata.parse(metadata)
+        composite_metadata.parse(metadata, lazy)
         return composite_metadata
 
 
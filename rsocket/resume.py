@@ -0,0 +1,114 @@
+from collections import deque
+from datetime import timedelta
+from typing import Deque, Dict, List, Optional
+
+from rsocket.frame import Frame, CONNECTION_STREAM_ID, InvalidFrame
+
+__all__ = ['ResumeBuffer', 'SessionStore', 'is_resumable_frame', 'DEFAULT_RESUME_BUFFER_SIZE']
+
+DEFAULT_RESUME_BUFFER_SIZE = 4 * 1024 * 1024
+
+
+def is_resumable_frame(frame: Frame) -> bool:
+    """Stream frames are resumable. Connection frames (SETUP, RESUME, KEEPALIVE, LEASE, stream 0 ERROR, ...) are not."""
+
+    return frame.stream_id != CONNECTION_STREAM_ID
+
+
+class ResumeBuffer:
+    """
+    Tracks the implied positions of a resumable session, which are the total length of the resumable frames
+    sent and received, and retains the sent frames not yet acknowledged by the peer, up to maximum_size bytes.
+    When more is retained, the oldest frames are dropped, and resuming from before them is no longer possible.
+    """
+
+    __slots__ = (
+        '_frames',
+        '_maximum_size',
+        'retained_size',
+        'first_available_position',
+        'sent_position',
+        'received_position'
+    )
+
+    def __init__(self, maximum_size: int = DEFAULT_RESUME_BUFFER_SIZE):
+        self._frames: Deque[Frame] = deque()
+        self._maximum_size = maximum_size
+        self.retained_size = 0
+        self.first_available_position = 0
+        self.sent_position = 0
+        self.received_position = 0
+
+    def frames_sent(self, frames: List[Frame]):
+        for frame in frames:
+            if is_resumable_frame(frame):
+                if frame.length == 0:  # not serialized by the transport
+                    frame.serialize()
+
+                self._frames.append(frame)
+                self.sent_position += frame.length
+                self.retained_size += frame.length
+
+        while self.retained_size > self._maximum_size:
+            self._drop_first()
+
+    def frame_received(self, frame: Frame):
+        if not isinstance(frame, InvalidFrame) and is_resumable_frame(frame):
+            self.received_position += frame.length
+
+    def release(self, position: int):
+        """Drop the retained frames the peer acknowledged having received, up to position."""
+
+        while self._frames and self.first_available_position + self._frames[0].length <= position:
+            self._drop_first()
+
+    def frames_after(self, position: int) -> Optional[List[Frame]]:
+        """
+        The retained frames following position, to send again after resuming.
+        None if some of them were already dropped, or position is past the sent frames.
+        """
+
+        if not self.first_available_position <= position <= self.sent_position:
+            return None
+
+        self.release(position)
+
+        if self.first_available_position != position:
+            return None
+
+        return list(self._frames)
+
+    def _drop_first(self):
+        frame = self._frames.popleft()
+        self.first_available_position += frame.length
+        self.retained_size -= frame.length
+
+
+class SessionStore:
+    """
+    Resumable server sessions by resume token, shared by the RSocketServer instances accepting connections
+    for the same service. A session whose connection was lost is kept for session_timeout,
+    waiting for the client to resume it.
+    """
+
+    __slots__ = (
+        '_sessions',
+        'session_timeout'
+    )
+
+    def __init__(self, session_timeout: timedelta = timedelta(minutes=1)):
+        self._sessions: Dict[bytes, 'RSocketServer'] = {}
+        self.session_timeout = session_timeout
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def get(self, token: bytes) -> Optional['RSocketServer']:
+        return self._sessions.get(token)
+
+    def add(self, token: bytes, session: 'RSocketServer'):
+        self._sessions[token] = session
+
+    def remove(self, token: bytes, session: 'RSocketServer'):
+        if self._sessions.get(token) is session:
+            del self._sessions[token]
@@ -1,25 +1,91 @@
 from inspect import signature, Parameter
-from typing import Callable, Any
+from typing import Callable, Any, Awaitable, Mapping, Sequence
 
+from rsocket.exceptions import RSocketValueError
 from rsocket.extensions.composite_metadata import CompositeMetadata
 from rsocket.frame import FrameType
 from rsocket.payload import Payload
+from rsocket.routing.route_table import RouteTable, route_variable_names
 from rsocket.rsocket import RSocket
 
 decorated_method = Callable[[RSocket, Payload, CompositeMetadata], Any]
+route_processor_type = Callable[..., Awaitable[Any]]
 
+_request_argument_names = ('payload', 'composite_metadata')
 
-def decorator_factory(container: dict, route: str):
-    def decorator(function: decorated_method):
-        if route in container:
-            raise KeyError('Duplicate route "%s" already registered', route)
 
-        container[route] = function
+def decorator_factory(container: RouteTable,
+                      route: str,
+                      route_processor_factory: Callable[[str, decorated_method], route_processor_type]):
+    def decorator(function: decorated_method):
+        container.add(route, route_processor_factory(route, function))
         return function
 
     return decorator
 
 
+def compile_route_processor(function: decorated_method,
+                            payload_mapper: Callable[[Any, Payload], Any],
+                            route_variables: Sequence[str] = ()) -> route_processor_type:
+    """
+    Inspects the signature of the route method once, and returns a callable which passes it
+    only the request arguments and route template variables it expects.
+    Route template variables must be unique, and not named like a request argument.
+    """
+
+    _check_route_variable_names(route_variables)
+
+    parameters = signature(function).parameters
+    route_processor = _compile_request_arguments(function, parameters, payload_mapper)
+    expected_route_variables = [name for name in route_variables if name in parameters]
+
+    if len(expected_route_variables) < len(route_variables):
+        return lambda payload, composite_metadata, **variables: route_processor(
+            payload, composite_metadata, **{name: variables[name] for name in expected_route_variables})
+
+    return route_processor
+
+
+def _check_route_variable_names(route_variables: Sequence[str]):
+    for index, name in enumerate(route_variables):
+        if name in _request_argument_names:
+            raise RSocketValueError('Route variable "%s" is reserved for the request argument' % name)
+
+        if name in route_variables[:index]:
+            raise RSocketValueError('Route variable "%s" is used more than once' % name)
+
+
+def _compile_request_arguments(function: decorated_method,
+                               parameters: Mapping[str, Parameter],
+                               payload_mapper: Callable[[Any, Payload], Any]) -> route_processor_type:
+    expects_composite_metadata = 'composite_metadata' in parameters
+
+    if 'payload' not in parameters:
+        if expects_composite_metadata:
+            return lambda payload, composite_metadata, **variables: function(
+                composite_metadata=composite_metadata, **variables)
+
+        return lambda payload, composite_metadata, **variables: function(**variables)
+
+    payload_expected_type = parameters['payload'].annotation
+
+    if payload_expected_type is not Payload and payload_expected_type is not Parameter.empty:
+        if expects_composite_metadata:
+            return lambda payload, composite_metadata, **variables: function(
+                payload=payload_mapper(payload_expected_type, payload),
+                composite_metadata=composite_metadata,
+                **variables)
+
+        return lambda payload, composite_metadata, **variables: function(
+            payload=payload_mapper(payload_expected_type, payload), **variables)
+
+    if expects_composite_metadata:
+        return lambda payload, composite_metadata, **variables: function(
+            payload=payload, composite_metadata=composite_metadata, **variables)
+
+    return lambda payload, composite_metadata, **variables: function(payload=payload, **variables)
+
+
 class RequestRouter:
     __slots__ = (
         '_channel_routes',
@@ -33,11 +99,11 @@ class RequestRouter:
 
     def __init__(self, payload_mapper=lambda cls, _: _):
         self._payload_mapper = payload_mapper
-        self._channel_routes = {}
-        self._stream_routes = {}
-        self._response_routes = {}
-        self._fnf_routes = {}
-        self._metadata_push = {}
+        self._channel_routes = RouteTable()
+        self._stream_routes = RouteTable()
+        self._response_routes = RouteTable()
+        self._fnf_routes = RouteTable()
+        self._metadata_push = RouteTable()
 
         self._route_map_by_frame_type = {
             FrameType.REQUEST_CHANNEL: self._channel_routes,
@@ -48,19 +114,19 @@ class RequestRouter:
         }
 
     def response(self, route: str):
-        return decorator_factory(self._response_routes, route)
+        return decorator_factory(self._response_routes, route, self._compile_route_processor)
 
     def stream(self, route: str):
-        return decorator_factory(self._stream_routes, route)
+        return decorator_factory(self._stream_routes, route, self._compile_route_processor)
 
     def channel(self, route: str):
-        return decorator_factory(self._channel_routes, route)
+        return decorator_factory(self._channel_routes, route, self._compile_route_processor)
 
     def fire_and_forget(self, route: str):
-        return decorator_factory(self._fnf_routes, route)
+        return decorator_factory(self._fnf_routes, route, self._compile_route_processor)
 
     def metadata_push(self, route: str):
-        return decorator_factory(self._metadata_push, route)
+        return decorator_factory(self._metadata_push, route, self._compile_route_processor)
 
     async def route(self,
                     frame_type: FrameType,
@@ -68,27 +134,11 @@ class RequestRouter:
                     payload: Payload,
                     composite_metadata: CompositeMetadata):
 
-        if route in self._route_map_by_frame_type[frame_type]:
-            route_processor = self._route_map_by_frame_type[frame_type][route]
-            route_kwargs = await self._collect_route_arguments(route_processor,
-                                                               payload,
-                                                               composite_metadata)
-
-            return await route_processor(**route_kwargs)
-
-    async def _collect_route_arguments(self, route_processor, payload, composite_metadata):
-        route_signature = signature(route_processor)
-        route_kwargs = {}
-
-        if 'payload' in route_signature.parameters:
-            payload_expected_type = route_signature.parameters['payload']
-
-            if payload_expected_type is not Payload and payload_expected_type is not Parameter:
-                payload = self._payload_mapper(payload_expected_type, payload)
-
-            route_kwargs['payload'] = payload
+        route_match = self._route_map_by_frame_type[frame_type].find(route)
 
-        if 'composite_metadata' in route_signature.parameters:
-            route_kwargs['composite_metadata'] = composite_metadata
+        if route_match is not None:
+            route_processor, route_variables = route_match
+            return await route_processor(payload, composite_metadata, **route_variables)
 
-        return route_kwargs
+    def _compile_route_processor(self, route: str, function: decorated_method) -> route_processor_type:
+        return compile_route_processor(function, self._payload_mapper, route_variable_names(route))
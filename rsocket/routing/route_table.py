@@ -0,0 +1,155 @@
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple, Mapping
+
+__all__ = ['RouteTable', 'is_route_template', 'route_variable_names']
+
+_no_variables: Mapping[str, str] = MappingProxyType({})
+
+
+def is_route_template(route: str) -> bool:
+    return '{' in route or '*' in route
+
+
+def route_variable_names(route: str) -> List[str]:
+    return [segment[1:-1] for segment in route.split('.') if segment.startswith('{')]
+
+
+class _TemplateRoute:
+    __slots__ = (
+        'value',
+        'variable_names'
+    )
+
+    def __init__(self, value: Any, variable_names: List[Optional[str]]):
+        self.value = value
+        self.variable_names = variable_names
+
+    def bind(self, captured_segments: List[str]) -> Dict[str, str]:
+        return {name: segment
+                for name, segment in zip(self.variable_names, captured_segments)
+                if name is not None}
+
+
+class _TemplateNode:
+    __slots__ = (
+        'literal_children',
+        'segment_child',
+        'route',
+        'remainder_route'
+    )
+
+    def __init__(self):
+        self.literal_children: Dict[str, _TemplateNode] = {}
+        self.segment_child: Optional[_TemplateNode] = None
+        self.route: Optional[_TemplateRoute] = None
+        self.remainder_route: Optional[_TemplateRoute] = None
+
+
+class RouteTable:
+    """
+    Exact routes are looked up in a dict first. Route templates are kept in a trie of dot separated segments.
+
+    A template segment is either literal, a {variable} or * which match exactly one segment,
+    or a trailing ** which matches the remaining segments, if any.
+    Literal segments take precedence over single segment matches, which take precedence over **.
+    """
+
+    __slots__ = (
+        '_exact_routes',
+        '_template_root'
+    )
+
+    def __init__(self):
+        self._exact_routes: Dict[str, Any] = {}
+        self._template_root = _TemplateNode()
+
+    def add(self, route: str, value: Any):
+        if not is_route_template(route):
+            if route in self._exact_routes:
+                raise KeyError('Duplicate route "%s" already registered', route)
+
+            self._exact_routes[route] = value
+            return
+
+        node = self._template_root
+        variable_names = []
+        segments = route.split('.')
+
+        for index, segment in enumerate(segments):
+            if segment == '**':
+                if index != len(segments) - 1:
+                    raise ValueError('Route template "%s": ** is only allowed as the last segment' % route)
+
+                if node.remainder_route is not None:
+                    raise KeyError('Duplicate route "%s" already registered', route)
+
+                node.remainder_route = _TemplateRoute(value, variable_names)
+                return
+
+            if segment == '*' or _is_variable_segment(segment):
+                if node.segment_child is None:
+                    node.segment_child = _TemplateNode()
+
+                node = node.segment_child
+                variable_names.append(segment[1:-1] if segment != '*' else None)
+            elif '{' in segment or '}' in segment or '*' in segment:
+                raise ValueError('Route template "%s": invalid segment "%s"' % (route, segment))
+            else:
+                node = node.literal_children.setdefault(segment, _TemplateNode())
+
+        if node.route is not None:
+            raise KeyError('Duplicate route "%s" already registered', route)
+
+        node.route = _TemplateRoute(value, variable_names)
+
+    def find(self, route: str) -> Optional[Tuple[Any, Mapping[str, str]]]:
+        """
+        Returns the value registered for the route, and the variables extracted from it if it matched a template.
+        """
+
+        value = self._exact_routes.get(route)
+
+        if value is not None:
+            return value, _no_variables
+
+        captured_segments = []
+        template_route = _match(self._template_root, route.split('.'), 0, captured_segments)
+
+        if template_route is None:
+            return None
+
+        return template_route.value, template_route.bind(captured_segments)
+
+
+def _is_variable_segment(segment: str) -> bool:
+    return len(segment) > 2 and segment[0] == '{' and segment[-1] == '}' and segment[1:-1].isidentifier()
+
+
+def _match(node: _TemplateNode,
+           segments: List[str],
+           index: int,
+           captured_segments: List[str]) -> Optional[_TemplateRoute]:
+    if index == len(segments):
+        if node.route is not None:
+            return node.route
+
+        return node.remainder_route
+
+    literal_child = node.literal_children.get(segments[index])
+
+    if literal_child is not None:
+        template_route = _match(literal_child, segments, index + 1, captured_segments)
+
+        if template_route is not None:
+            return template_route
+
+    if node.segment_child is not None:
+        captured_segments.append(segments[index])
+        template_route = _match(node.segment_child, segments, index + 1, captured_segments)
+
+        if template_route is not None:
+            return template_route
+
+        captured_segments.pop()
+
+    return node.remainder_route
@@ -84,16 +84,16 @@ class RoutingRequestHandler(BaseRequestHandler):
             frame_type: FrameType,
             payload: Payload
     ) -> Union[Future, Publisher, None, Tuple[Optional[Publisher], Optional[Subscriber]]]:
-        composite_metadata = self._parse_composite_metadata(payload.metadata)
+        composite_metadata = self._parse_composite_metadata(payload.metadata, lazy=True)
         route = require_route(composite_metadata)
         await self._verify_authentication(route, composite_metadata)
         return await self.router.route(frame_type, route, payload, composite_metadata)
 
     async def _verify_authentication(self, route: str, composite_metadata: CompositeMetadata):
         if self.authentication_verifier is not None:
-            for item in composite_metadata.items:
-                if isinstance(item, AuthenticationContent):
-                    await self.authentication_verifier(route, item.authentication)
-                    return
+            authentication = composite_metadata.find_first(WellKnownMimeTypes.MESSAGE_RSOCKET_AUTHENTICATION)
 
-            raise Exception('Authentication required but not provided')
+            if not isinstance(authentication, AuthenticationContent):
+                raise Exception('Authentication required but not provided')
+
+            await self.authentication_verifier(route, authentication.authentication)
@@ -1,5 +1,6 @@
 import abc
 from asyncio import Future
+from datetime import timedelta
 from typing import Union, Optional, Any
 
 from reactivestreams.publisher import Publisher
@@ -13,11 +14,12 @@ class RSocket(metaclass=abc.ABCMeta):
     def request_channel(
             self,
             payload: Payload,
-            local_publisher: Optional[Publisher] = None) -> Union[Any, Publisher]:
+            local_publisher: Optional[Publisher] = None,
+            timeout: Optional[timedelta] = None) -> Union[Any, Publisher]:
         ...
 
     @abc.abstractmethod
-    def request_response(self, payload: Payload) -> Future:
+    def request_response(self, payload: Payload, timeout: Optional[timedelta] = None) -> Future:
         ...
 
     @abc.abstractmethod
@@ -25,7 +27,9 @@ class RSocket(metaclass=abc.ABCMeta):
         ...
 
     @abc.abstractmethod
-    def request_stream(self, payload: Payload) -> Union[BackpressureApi, Publisher]:
+    def request_stream(self,
+                       payload: Payload,
+                       timeout: Optional[timedelta] = None) -> Union[BackpressureApi, Publisher]:
         ...
 
     @abc.abstractmethod
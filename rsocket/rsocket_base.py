@@ -1,15 +1,19 @@
 import abc
 import asyncio
 from asyncio import Future, Task
+from functools import partial
 from datetime import timedelta
-from typing import Union, Optional, Dict, Any, Coroutine, Callable, Type, cast, TypeVar
+from typing import Union, Optional, Dict, Any, Coroutine, Callable, Type, cast, TypeVar, List
 
 from reactivestreams.publisher import Publisher
 from reactivestreams.subscriber import DefaultSubscriber
 from rsocket.error_codes import ErrorCode
-from rsocket.exceptions import RSocketProtocolError, RSocketTransportError
+from rsocket.exceptions import RSocketProtocolError, RSocketTransportError, RSocketValueError, \
+    RSocketFrameFragmentLimitExceeded
+from rsocket.extensions.composite_metadata import CompositeMetadata
+from rsocket.extensions.helpers import find_request_timeout, request_timeout
 from rsocket.extensions.mimetypes import WellKnownMimeTypes, ensure_encoding_name
-from rsocket.frame import (KeepAliveFrame,
+from rsocket.frame import (KeepAliveFrame, error_frame_to_exception,
                            MetadataPushFrame, RequestFireAndForgetFrame,
                            RequestResponseFrame, RequestStreamFrame, Frame,
                            exception_to_error_frame,
@@ -18,10 +22,11 @@ from rsocket.frame import (KeepAliveFrame,
                            FragmentableFrame)
 from rsocket.frame import (RequestChannelFrame, ResumeFrame,
                            is_fragmentable_frame, CONNECTION_STREAM_ID)
-from rsocket.frame import SetupFrame
+from rsocket.frame import SetupFrame, PayloadFrame
 from rsocket.frame_builders import to_payload_frame, to_fire_and_forget_frame, to_setup_frame, to_metadata_push_frame, \
-    to_keepalive_frame
-from rsocket.frame_fragment_cache import FrameFragmentCache
+    to_keepalive_frame, to_fragment_frames, MINIMUM_FRAGMENT_SIZE
+from rsocket.frame_fragment_cache import FrameFragmentCache, DEFAULT_MAXIMUM_FRAME_SIZE, DEFAULT_MAXIMUM_TOTAL_SIZE
+from rsocket.fragment import Fragment
 from rsocket.frame_logger import log_frame
 from rsocket.handlers.request_cahnnel_responder import RequestChannelResponder
 from rsocket.handlers.request_channel_requester import RequestChannelRequester
@@ -33,12 +38,16 @@ from rsocket.helpers import payload_from_frame, async_noop, cancel_if_task_exist
 from rsocket.lease import DefinedLease, NullLease, Lease
 from rsocket.logger import logger
 from rsocket.payload import Payload
+from rsocket.resume import ResumeBuffer, DEFAULT_RESUME_BUFFER_SIZE
 from rsocket.request_handler import BaseRequestHandler, RequestHandler
 from rsocket.rsocket import RSocket
 from rsocket.rsocket_internal import RSocketInternal
+from rsocket.send_queue import SendQueue, DEFAULT_HIGH_WATERMARK, DEFAULT_LOW_WATERMARK
 from rsocket.stream_control import StreamControl
+from rsocket.streaming_payload import StreamingPayload
 from rsocket.streams.backpressureapi import BackpressureApi
 from rsocket.streams.stream_handler import StreamHandler
+from rsocket.timer import TimerQueue, Timer
 
 T = TypeVar('T')
 
@@ -61,8 +70,17 @@ class RSocketBase(RSocket, RSocketInternal):
                  metadata_encoding: Union[str, bytes, WellKnownMimeTypes] = WellKnownMimeTypes.APPLICATION_JSON,
                  keep_alive_period: timedelta = timedelta(milliseconds=500),
                  max_lifetime_period: timedelta = timedelta(minutes=10),
-                 setup_payload: Optional[Payload] = None
+                 setup_payload: Optional[Payload] = None,
+                 fair_send_scheduling: bool = False,
+                 send_queue_high_watermark: int = DEFAULT_HIGH_WATERMARK,
+                 send_queue_low_watermark: int = DEFAULT_LOW_WATERMARK,
+                 fragment_size: Optional[int] = None,
+                 max_fragmented_frame_size: int = DEFAULT_MAXIMUM_FRAME_SIZE,
+                 max_fragment_cache_size: int = DEFAULT_MAXIMUM_TOTAL_SIZE,
+                 resume_buffer_size: int = DEFAULT_RESUME_BUFFER_SIZE
                  ):
+        if fragment_size is not None and fragment_size < MINIMUM_FRAGMENT_SIZE:
+            raise RSocketValueError('fragment_size must be at least %d bytes' % MINIMUM_FRAGMENT_SIZE)
 
         self._handler_factory = handler_factory
         self._request_queue_size = request_queue_size
@@ -70,15 +88,29 @@ class RSocketBase(RSocket, RSocketInternal):
         self._max_lifetime_period = max_lifetime_period
         self._keep_alive_period = keep_alive_period
         self._setup_payload = setup_payload
+        self._fair_send_scheduling = fair_send_scheduling
+        self._send_queue_high_watermark = send_queue_high_watermark
+        self._send_queue_low_watermark = send_queue_low_watermark
+        self._fragment_size = fragment_size
+        self._max_fragmented_frame_size = max_fragmented_frame_size
+        self._max_fragment_cache_size = max_fragment_cache_size
+        self._resume_buffer_size = resume_buffer_size
+        self._resume_token: Optional[bytes] = None
+        self._resume_buffer: Optional[ResumeBuffer] = None
         self._data_encoding = ensure_encoding_name(data_encoding)
         self._metadata_encoding = ensure_encoding_name(metadata_encoding)
         self._lease_publisher = lease_publisher
         self._sender_task = None
         self._receiver_task = None
+        self._timers = TimerQueue()
+        self._liveness_timer: Optional[Timer] = None
+        self._keepalive_timeout_task: Optional[Task] = None
+        self._last_keepalive = self._timers.now()
         self._handler = self._handler_factory(self)
         self._responder_lease = None
         self._requester_lease = None
         self._is_closing = False
+        self._is_connection_lost = False
         self._connecting = True
 
         self._async_frame_handler_by_type: Dict[Type[Frame], Any] = {
@@ -104,8 +136,12 @@ class RSocketBase(RSocket, RSocketInternal):
         ...
 
     def _reset_internals(self):
-        self._frame_fragment_cache = FrameFragmentCache()
-        self._send_queue = asyncio.Queue()
+        self._frame_fragment_cache = FrameFragmentCache(self._max_fragmented_frame_size,
+                                                        self._max_fragment_cache_size)
+        self._streaming_payloads: Dict[int, StreamingPayload] = {}
+        self._send_queue = SendQueue(self._fair_send_scheduling,
+                                     high_watermark=self._send_queue_high_watermark,
+                                     low_watermark=self._send_queue_low_watermark)
         self._request_queue = asyncio.Queue(self._request_queue_size)
 
         if self._honor_lease:
@@ -115,9 +151,24 @@ class RSocketBase(RSocket, RSocketInternal):
 
         self._responder_lease = NullLease()
         self._stream_control = StreamControl(self._get_first_stream_id())
+        self._stream_timeouts: Dict[int, Timer] = {}
+        self._resume_buffer = None
         self._is_closing = False
+        self._is_connection_lost = False
 
     def stop_all_streams(self, error_code=ErrorCode.CANCELED, data=b''):
+        if self._streaming_payloads:
+            exception = RSocketProtocolError(error_code, data=bytes(data).decode())
+
+            for streaming_payload in self._streaming_payloads.values():
+                streaming_payload.fail(exception)
+
+            self._streaming_payloads.clear()
+
+        for timer in self._stream_timeouts.values():
+            timer.cancel()
+
+        self._stream_timeouts.clear()
         self._stream_control.stop_all_streams(error_code, data)
 
     def _start_tasks(self):
@@ -152,6 +203,19 @@ class RSocketBase(RSocket, RSocketInternal):
     def finish_stream(self, stream_id: int):
         self._stream_control.finish_stream(stream_id)
 
+        if self._stream_timeouts:
+            timer = self._stream_timeouts.pop(stream_id, None)
+
+            if timer is not None:
+                timer.cancel()
+
+        if self._streaming_payloads:
+            streaming_payload = self._streaming_payloads.pop(stream_id, None)
+
+            if streaming_payload is not None:
+                streaming_payload.fail(RSocketProtocolError(ErrorCode.CANCELED,
+                                                            'Stream finished before the payload was complete'))
+
     def send_request(self, frame: RequestFrame):
         if self._honor_lease and not self._is_frame_allowed_to_send(frame):
             self._queue_request_frame(frame)
@@ -164,16 +228,24 @@ class RSocketBase(RSocket, RSocketInternal):
         self._request_queue.put_nowait(frame)
 
     def send_priority_frame(self, frame: Frame):
-        items = []
-        while not self._send_queue.empty():
-            items.append(self._send_queue.get_nowait())
-
-        self._send_queue.put_nowait(frame)
-        for item in items:
-            self._send_queue.put_nowait(item)
+        self._send_queue.put_first_nowait(frame)
 
     def send_frame(self, frame: Frame):
-        self._send_queue.put_nowait(frame)
+        if self._fragment_size is not None and is_fragmentable_frame(frame):
+            self._send_queue.put_fragments_nowait(to_fragment_frames(frame, self._fragment_size))
+        else:
+            self._send_queue.put_nowait(frame)
+
+    def is_writable(self) -> bool:
+        return self._send_queue.is_writable()
+
+    async def wait_writable(self):
+        """
+        Wait until the send queue is below its low watermark, if it went above its high watermark.
+        Producers sending many requests or payloads should await this to keep memory bounded when the peer is slow.
+        """
+
+        await self._send_queue.wait_writable()
 
     def send_complete(self, stream_id: int):
         self.send_payload(stream_id, Payload(), complete=True, is_next=False)
@@ -185,7 +257,77 @@ class RSocketBase(RSocket, RSocketInternal):
         self.send_frame(to_payload_frame(stream_id, payload, complete, is_next=is_next))
 
     def _update_last_keepalive(self):
-        pass
+        self._last_keepalive = self._timers.now()
+
+    def _start_liveness_check(self):
+        self._stop_liveness_check()
+        self._liveness_timer = self._timers.call_at(self._last_keepalive + self._liveness_period(),
+                                                    self._check_liveness)
+
+    def _stop_liveness_check(self):
+        if self._liveness_timer is not None:
+            self._liveness_timer.cancel()
+            self._liveness_timer = None
+
+    def _liveness_period(self) -> float:
+        """Seconds without a keepalive from the peer after which it is considered lost."""
+
+        return self._max_lifetime_period.total_seconds()
+
+    def _check_liveness(self):
+        max_lifetime = self._liveness_period()
+        time_since_last_keepalive = self._timers.now() - self._last_keepalive
+
+        if time_since_last_keepalive < max_lifetime:
+            self._liveness_timer = self._timers.call_at(self._last_keepalive + max_lifetime, self._check_liveness)
+            return
+
+        self._liveness_timer = self._timers.call_later(max_lifetime, self._check_liveness)
+
+        if self._keepalive_timeout_task is None or self._keepalive_timeout_task.done():
+            self._keepalive_timeout_task = asyncio.create_task(
+                self._on_keepalive_timeout(timedelta(seconds=time_since_last_keepalive)))
+
+    async def _on_keepalive_timeout(self, time_since_last_keepalive: timedelta):
+        await self._handler.on_keepalive_timeout(time_since_last_keepalive, self)
+
+    def set_stream_timeout(self, stream_id: int, timeout: timedelta):
+        """Call timeout_expired on the handler of the stream, unless the stream finished within timeout."""
+
+        previous_timer = self._stream_timeouts.get(stream_id)
+
+        if previous_timer is not None:
+            previous_timer.cancel()
+
+        self._stream_timeouts[stream_id] = self._timers.call_later(timeout.total_seconds(),
+                                                                   partial(self._stream_timed_out, stream_id))
+
+    def _stream_timed_out(self, stream_id: int):
+        self._stream_timeouts.pop(stream_id, None)
+        handler = self._stream_control.get_stream(stream_id)
+
+        if handler is not None:
+            logger().debug('%s: Stream %d timed out', self._log_identifier(), stream_id)
+            handler.timeout_expired()
+
+    def _with_request_timeout(self, payload: Payload, timeout: Optional[timedelta]) -> Payload:
+        """Propagate the request timeout to the responder, if the metadata is composite."""
+
+        if timeout is None or self._metadata_encoding != WellKnownMimeTypes.MESSAGE_RSOCKET_COMPOSITE_METADATA.value.name:
+            return payload
+
+        return Payload(payload.data, b''.join((payload.metadata or b'',
+                                              CompositeMetadata().append(request_timeout(timeout)).serialize())))
+
+    def _start_responder_timeout(self, frame: RequestFrame):
+        if (frame.metadata
+                and self._metadata_encoding == WellKnownMimeTypes.MESSAGE_RSOCKET_COMPOSITE_METADATA.value.name):
+            composite_metadata = CompositeMetadata()
+            composite_metadata.parse(frame.metadata, lazy=True)
+            timeout = find_request_timeout(composite_metadata)
+
+            if timeout is not None:
+                self.set_stream_timeout(frame.stream_id, timeout)
 
     def register_new_stream(self, handler: T) -> T:
         stream_id = self._allocate_stream()
@@ -203,10 +345,20 @@ class RSocketBase(RSocket, RSocketInternal):
     async def handle_keep_alive(self, frame: KeepAliveFrame):
         self._update_last_keepalive()
 
+        if self._resume_buffer is not None:
+            self._resume_buffer.release(frame.last_received_position)
+
         if frame.flags_respond:
             frame.flags_respond = False
+            frame.last_received_position = self._last_received_position()
             self.send_frame(frame)
 
+    def _last_received_position(self) -> int:
+        if self._resume_buffer is None:
+            return 0
+
+        return self._resume_buffer.received_position
+
     async def handle_request_response(self, frame: RequestResponseFrame):
         stream_id = frame.stream_id
         self._stream_control.assert_stream_id_available(stream_id)
@@ -219,6 +371,7 @@ class RSocketBase(RSocket, RSocketInternal):
             return
 
         self._register_stream(stream_id, RequestResponseResponder(self, response_future)).setup()
+        self._start_responder_timeout(frame)
 
     async def handle_request_stream(self, frame: RequestStreamFrame):
         stream_id = frame.stream_id
@@ -234,9 +387,10 @@ class RSocketBase(RSocket, RSocketInternal):
         request_responder = RequestStreamResponder(self, publisher)
         self._register_stream(stream_id, request_responder)
         request_responder.frame_received(frame)
+        self._start_responder_timeout(frame)
 
     async def handle_setup(self, frame: SetupFrame):
-        if frame.flags_resume:
+        if frame.flags_resume and not self._accept_resumable_session(frame):
             raise RSocketProtocolError(ErrorCode.UNSUPPORTED_SETUP, data='Resume not supported')
 
         if frame.flags_lease:
@@ -255,6 +409,11 @@ class RSocketBase(RSocket, RSocketInternal):
             logger().error('%s: Setup error', self._log_identifier(), exc_info=True)
             raise RSocketProtocolError(ErrorCode.REJECTED_SETUP, data=str(exception)) from exception
 
+        self._metadata_encoding = frame.metadata_encoding
+
+    def _accept_resumable_session(self, frame: SetupFrame) -> bool:
+        return False
+
     def _subscribe_to_lease_publisher(self):
         if self._lease_publisher is not None:
             self._lease_publisher.subscribe(self.LeaseSubscriber(self))
@@ -290,6 +449,7 @@ class RSocketBase(RSocket, RSocketInternal):
         self._register_stream(stream_id, channel_responder)
         channel_responder.subscribe(subscriber)
         channel_responder.frame_received(frame)
+        self._start_responder_timeout(frame)
 
     async def handle_resume(self, frame: ResumeFrame):
         raise RSocketProtocolError(ErrorCode.REJECTED_RESUME, data='Resume not supported')
@@ -316,25 +476,65 @@ class RSocketBase(RSocket, RSocketInternal):
             raise
 
     async def _on_connection_lost(self, exception: Exception):
+        self._is_connection_lost = True
         logger().warning(str(exception))
         logger().debug(str(exception), exc_info=exception)
+
+        if self._resume_buffer is not None:
+            await self._on_resumable_connection_lost(exception)
+            return
+
         self.stop_all_streams(ErrorCode.CONNECTION_ERROR, b'Connection error')
         await self._handler.on_connection_lost(self, exception)
 
+    async def _on_resumable_connection_lost(self, exception: Exception):
+        """Streams of a resumable session are kept, to continue once the session is resumed."""
+
+        await self._handler.on_connection_lost(self, exception)
+
     @abc.abstractmethod
     def is_server_alive(self) -> bool:
         ...
 
+    def is_connection_lost(self) -> bool:
+        return self._is_connection_lost
+
+    def active_stream_count(self) -> int:
+        return self._stream_control.active_stream_count
+
     async def _receiver_listen(self):
+        self._start_liveness_check()
 
+        try:
+            await self._receive_frames()
+        finally:
+            self._stop_liveness_check()
+
+    async def _receive_frames(self):
         transport = await self._current_transport()
-        while self.is_server_alive():
-            next_frame_generator = await transport.next_frame_generator()
-            if next_frame_generator is None:
+        while self.is_server_alive() and not self._is_closing:
+            frames = await transport.next_frames()
+
+            if frames is None:
+                if self._resume_buffer is not None:
+                    raise RSocketTransportError()
+
                 break
-            async for frame in next_frame_generator:
+
+            for frame in frames:
+                if self._resume_buffer is not None:
+                    self._resume_buffer.frame_received(frame)
+
                 try:
-                    await self._handle_next_frame(frame)
+                    frame = self._handle_stream_frame(frame)
+
+                    if frame is not None:
+                        await self._handle_frame_by_type(frame)
+                except RSocketFrameFragmentLimitExceeded as exception:
+                    logger().error('%s: Protocol error %s', self._log_identifier(), str(exception))
+                    self._stream_control.handle_stream(frame.stream_id,
+                                                       exception_to_error_frame(frame.stream_id, exception))
+                    self.send_error(frame.stream_id, exception)
                 except RSocketProtocolError as exception:
                     logger().error('%s: Protocol error %s', self._log_identifier(), str(exception))
                     self.send_error(frame.stream_id, exception)
@@ -344,33 +544,90 @@ class RSocketBase(RSocket, RSocketInternal):
                     logger().error('%s: Unknown error', self._log_identifier(), exc_info=True)
                     self.send_error(frame.stream_id, exception)
 
-    async def _handle_next_frame(self, frame: Frame):
+    def _handle_stream_frame(self, frame: Frame) -> Optional[Frame]:
+        """Dispatch frames of existing streams. Returns the frame if it requires async handling by type."""
 
         log_frame(frame, self._log_identifier())
 
         if isinstance(frame, InvalidFrame):
-            return
+            return None
 
         if is_fragmentable_frame(frame):
+            if (frame.flags_follows or self._streaming_payloads) and self._stream_fragment(frame):
+                return None
+
             frame = self._frame_fragment_cache.append(cast(FragmentableFrame, frame))
             if frame is None:
-                return
+                return None
 
         stream_id = frame.stream_id
 
         if stream_id == CONNECTION_STREAM_ID or isinstance(frame, initiate_request_frame_types):
-            await self._handle_frame_by_type(frame)
-        elif self._stream_control.handle_stream(stream_id, frame):
-            return
-        else:
+            return frame
+
+        if isinstance(frame, ErrorFrame) and self._streaming_payloads:
+            streaming_payload = self._streaming_payloads.pop(stream_id, None)
+
+            if streaming_payload is not None:
+                streaming_payload.fail(error_frame_to_exception(frame))
+
+        if not self._stream_control.handle_stream(stream_id, frame):
             logger().debug('%s: Dropping frame from unknown stream %d', self._log_identifier(), frame.stream_id)
 
+        return None
+
+    def _stream_fragment(self, frame: FragmentableFrame) -> bool:
+        """
+        Deliver the fragment to the StreamingPayload of its stream, if the stream handler accepts those.
+        Returns False if the fragment should be reassembled instead, or is not a fragment.
+        """
+
+        stream_id = frame.stream_id
+        streaming_payload = self._streaming_payloads.get(stream_id)
+
+        if streaming_payload is None:
+            if not frame.flags_follows or not isinstance(frame, PayloadFrame) or not frame.flags_next:
+                return False
+
+            if self._frame_fragment_cache.is_receiving(stream_id):
+                return False
+
+            handler = self._stream_control.get_stream(stream_id)
+
+            if handler is None or not handler.streams_fragments:
+                return False
+
+            streaming_payload = self._streaming_payloads[stream_id] = StreamingPayload()
+            handler.streaming_payload_received(streaming_payload)
+
+        streaming_payload.feed(Fragment(frame.data, frame.metadata, is_last=not frame.flags_follows))
+
+        if frame.flags_follows:
+            if streaming_payload.buffered_size > self._max_fragmented_frame_size:
+                self._reject_streaming_payload(stream_id)
+        else:
+            del self._streaming_payloads[stream_id]
+
+            if frame.flags_complete:
+                self._stream_control.handle_stream(stream_id, to_payload_frame(stream_id, Payload(),
+                                                                               complete=True, is_next=False))
+
+        return True
+
+    def _reject_streaming_payload(self, stream_id: int):
+        """The consumer of the streaming payload fell too far behind. Fail the stream, and drop its remaining fragments."""
+
+        exception = RSocketFrameFragmentLimitExceeded(stream_id, self._max_fragmented_frame_size)
+        self._streaming_payloads.pop(stream_id).fail(exception)
+        self._frame_fragment_cache.reject(stream_id)
+        raise exception
+
     async def _handle_frame_by_type(self, frame: Frame):
         frame_handler = self._async_frame_handler_by_type.get(type(frame), async_noop)
         await frame_handler(frame)
 
     def _send_new_keepalive(self, data: bytes = b''):
-        self.send_frame(to_keepalive_frame(data))
+        self.send_frame(to_keepalive_frame(data, self._last_received_position()))
 
     def _before_sender(self):
         pass
@@ -378,6 +635,9 @@ class RSocketBase(RSocket, RSocketInternal):
     async def _finally_sender(self):
         pass
 
+    async def _next_frames_to_send(self) -> List[Frame]:
+        return await self._send_queue.get_all()
+
     async def _sender(self):
         try:
             try:
@@ -385,13 +645,22 @@ class RSocketBase(RSocket, RSocketInternal):
 
                 self._before_sender()
                 while self.is_server_alive():
-                    frame = await self._send_queue.get()
-                    await transport.send_frame(frame)
-                    log_frame(frame, self._log_identifier(), 'Sent')
-                    self._send_queue.task_done()
+                    frames = await self._next_frames_to_send()
+
+                    try:
+                        await transport.send_frames(frames)
+                    finally:
+                        if self._resume_buffer is not None:
+                            self._resume_buffer.frames_sent(frames)
+
+                    for frame in frames:
+                        log_frame(frame, self._log_identifier(), 'Sent')
 
                     if self._send_queue.empty():
                         await transport.on_send_queue_empty()
+                    else:
+                        await transport.drain()
+                        await asyncio.sleep(0)  # let other streams queue frames before the next round
             except RSocketTransportError as exception:
                 await self._on_connection_lost(exception)
 
@@ -409,8 +678,10 @@ class RSocketBase(RSocket, RSocketInternal):
         logger().debug('%s: Closing', self._log_identifier())
 
         self._is_closing = True
+        self._is_connection_lost = True
         await cancel_if_task_exists(self._sender_task)
         await cancel_if_task_exists(self._receiver_task)
+        self._timers.cancel_all()
 
         await self._close_transport()
 
@@ -434,10 +705,10 @@ class RSocketBase(RSocket, RSocketInternal):
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close()
 
-    def request_response(self, payload: Payload) -> Future:
+    def request_response(self, payload: Payload, timeout: Optional[timedelta] = None) -> Future:
         logger().debug('%s: request-response: %s', self._log_identifier(), payload)
 
-        requester = RequestResponseRequester(self, payload)
+        requester = RequestResponseRequester(self, self._with_request_timeout(payload, timeout), timeout)
         self.register_new_stream(requester).setup()
         return requester.run()
 
@@ -448,19 +719,23 @@ class RSocketBase(RSocket, RSocketInternal):
         self.send_request(to_fire_and_forget_frame(stream_id, payload))
         self.finish_stream(stream_id)
 
-    def request_stream(self, payload: Payload) -> Union[BackpressureApi, Publisher]:
+    def request_stream(self,
+                       payload: Payload,
+                       timeout: Optional[timedelta] = None) -> Union[BackpressureApi, Publisher]:
         logger().debug('%s: request-stream: %s', self._log_identifier(), payload)
 
-        requester = RequestStreamRequester(self, payload)
+        requester = RequestStreamRequester(self, self._with_request_timeout(payload, timeout), timeout)
         return self.register_new_stream(requester)
 
     def request_channel(
             self,
             payload: Payload,
-            local_publisher: Optional[Publisher] = None) -> Union[BackpressureApi, Publisher]:
+            local_publisher: Optional[Publisher] = None,
+            timeout: Optional[timedelta] = None) -> Union[BackpressureApi, Publisher]:
         logger().debug('%s: request-channel: %s', self._log_identifier(), payload)
 
-        requester = RequestChannelRequester(self, payload, local_publisher)
+        requester = RequestChannelRequester(self, self._with_request_timeout(payload, timeout), local_publisher,
+                                            timeout)
         return self.register_new_stream(requester)
 
     def metadata_push(self, metadata: bytes):
@@ -483,7 +758,8 @@ class RSocketBase(RSocket, RSocketInternal):
                               metadata_encoding,
                               self._keep_alive_period,
                               self._max_lifetime_period,
-                              self._honor_lease)
+                              self._honor_lease,
+                              self._resume_token)
 
     @abc.abstractmethod
     def _log_identifier(self) -> str:
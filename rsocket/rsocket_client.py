@@ -1,18 +1,25 @@
 import asyncio
 from asyncio import Future, CancelledError
-from datetime import timedelta, datetime
+from datetime import timedelta
 from typing import Optional, Callable, AsyncGenerator, Any
 from typing import Union
 
 from reactivestreams.publisher import Publisher
-from rsocket.exceptions import RSocketNoAvailableTransport
+from rsocket.error_codes import ErrorCode
+from rsocket.exceptions import RSocketNoAvailableTransport, RSocketProtocolError
 from rsocket.extensions.mimetypes import WellKnownMimeTypes
+from rsocket.frame import ResumeOKFrame, ErrorFrame
+from rsocket.frame_builders import to_resume_frame
+from rsocket.frame_fragment_cache import DEFAULT_MAXIMUM_FRAME_SIZE, DEFAULT_MAXIMUM_TOTAL_SIZE
 from rsocket.helpers import create_future, cancel_if_task_exists
 from rsocket.logger import logger
 from rsocket.payload import Payload
 from rsocket.request_handler import BaseRequestHandler
 from rsocket.request_handler import RequestHandler
+from rsocket.resume import DEFAULT_RESUME_BUFFER_SIZE, ResumeBuffer
 from rsocket.rsocket_base import RSocketBase
+from rsocket.send_queue import DEFAULT_HIGH_WATERMARK, DEFAULT_LOW_WATERMARK
+from rsocket.timer import Timer
 from rsocket.transports.transport import Transport
 
 
@@ -29,15 +36,30 @@ class RSocketClient(RSocketBase):
                  keep_alive_period: timedelta = timedelta(milliseconds=500),
                  max_lifetime_period: timedelta = timedelta(minutes=10),
                  setup_payload: Optional[Payload] = None,
+                 fair_send_scheduling: bool = False,
+                 send_queue_high_watermark: int = DEFAULT_HIGH_WATERMARK,
+                 send_queue_low_watermark: int = DEFAULT_LOW_WATERMARK,
+                 fragment_size: Optional[int] = None,
+                 max_fragmented_frame_size: int = DEFAULT_MAXIMUM_FRAME_SIZE,
+                 max_fragment_cache_size: int = DEFAULT_MAXIMUM_TOTAL_SIZE,
+                 resume_token: Optional[bytes] = None,
+                 resume_buffer_size: int = DEFAULT_RESUME_BUFFER_SIZE
                  ):
+        """
+        Setting resume_token makes the session resumable: after a lost connection, reconnect() resumes it
+        on a new transport, continuing the open streams, if the server supports resumption.
+        Up to resume_buffer_size bytes of sent frames are kept until the server acknowledges them.
+        """
+
         self._transport_provider = transport_provider.__aiter__()
         self._is_server_alive = True
-        self._update_last_keepalive()
         self._connect_request_event = asyncio.Event()
         self._transport: Optional[Transport] = None
         self._next_transport = asyncio.Future()
         self._reconnect_task = asyncio.create_task(self._reconnect_listener())
-        self._keepalive_task = None
+        self._keepalive_timer: Optional[Timer] = None
+        self._resumable_session = False
+        self._resume_ok: Optional[Future] = None
 
         super().__init__(handler_factory=handler_factory,
                          honor_lease=honor_lease,
@@ -47,7 +69,17 @@ class RSocketClient(RSocketBase):
                          metadata_encoding=metadata_encoding,
                          keep_alive_period=keep_alive_period,
                          max_lifetime_period=max_lifetime_period,
-                         setup_payload=setup_payload)
+                         setup_payload=setup_payload,
+                         fair_send_scheduling=fair_send_scheduling,
+                         send_queue_high_watermark=send_queue_high_watermark,
+                         send_queue_low_watermark=send_queue_low_watermark,
+                         fragment_size=fragment_size,
+                         max_fragmented_frame_size=max_fragmented_frame_size,
+                         max_fragment_cache_size=max_fragment_cache_size,
+                         resume_buffer_size=resume_buffer_size)
+
+        self._resume_token = resume_token
+        self._async_frame_handler_by_type[ResumeOKFrame] = self.handle_resume_ok
 
     def _current_transport(self) -> Future:
         return self._next_transport
@@ -55,10 +87,20 @@ class RSocketClient(RSocketBase):
     def _log_identifier(self) -> str:
         return 'client'
 
+    def _reset_internals(self):
+        super()._reset_internals()
+
+        if self._resume_token is not None:
+            self._resume_buffer = ResumeBuffer(self._resume_buffer_size)
+
     async def connect(self):
+        if self._resumable_session:
+            return await self._resume_session()
+
         logger().debug('%s: connecting', self._log_identifier())
         self._is_closing = False
         self._reset_internals()
+        self._update_last_keepalive()
         self._start_tasks()
 
         try:
@@ -68,7 +110,75 @@ class RSocketClient(RSocketBase):
             await self._on_connection_lost(exception)
             return
 
-        return await super().connect()
+        return await self._setup_session()
+
+    async def _setup_session(self):
+        result = await super().connect()
+        self._resumable_session = self._resume_token is not None
+        return result
+
+    async def _resume_session(self):
+        logger().debug('%s: resuming session', self._log_identifier())
+        self._is_closing = False
+        self._is_connection_lost = False
+        self._update_last_keepalive()
+        self._resume_ok = create_future()
+        self._receiver_task = self._start_task_if_not_closing(self._receiver)
+
+        try:
+            await self._connect_new_transport()
+            transport = await self._current_transport()
+            await transport.send_frame(to_resume_frame(self._resume_token,
+                                                       self._resume_buffer.received_position,
+                                                       self._resume_buffer.first_available_position))
+            resume_ok = await asyncio.wait_for(self._resume_ok, self._max_lifetime_period.total_seconds())
+        except RSocketProtocolError as exception:
+            logger().warning('%s: Resume rejected (%s), starting a new session', self._log_identifier(), exception)
+            return await self._setup_session_after_rejected_resume()
+        except Exception as exception:
+            logger().error('%s: Connection error', self._log_identifier(), exc_info=True)
+            await self._on_connection_lost(exception)
+            return
+        finally:
+            self._resume_ok = None
+
+        frames = self._resume_buffer.frames_after(resume_ok.last_received_client_position)
+
+        if frames is None:
+            await self._abandon_session(RSocketProtocolError(ErrorCode.CONNECTION_ERROR,
+                                                             data='Resume position not available'))
+            return
+
+        await transport.send_frames(frames)
+        self._sender_task = self._start_task_if_not_closing(self._sender)
+        return self
+
+    async def _setup_session_after_rejected_resume(self):
+        self._resumable_session = False
+        await cancel_if_task_exists(self._receiver_task)
+        self.stop_all_streams(ErrorCode.CONNECTION_ERROR, b'Resume rejected')
+        self._reset_internals()
+        self._start_tasks()
+        return await self._setup_session()
+
+    async def _abandon_session(self, exception: Exception):
+        self._resumable_session = False
+        self._resume_buffer = None
+        await self._close_transport()
+        await self._on_connection_lost(exception)
+
+    async def handle_resume_ok(self, frame: ResumeOKFrame):
+        if self._resume_ok is not None and not self._resume_ok.done():
+            self._resume_ok.set_result(frame)
+
+    async def handle_error(self, frame: ErrorFrame):
+        if (frame.error_code == ErrorCode.REJECTED_RESUME
+                and self._resume_ok is not None and not self._resume_ok.done()):
+            self._resume_ok.set_exception(RSocketProtocolError(frame.error_code,
+                                                                data=bytes(frame.data or b'').decode()))
+            return
+
+        await super().handle_error(frame)
 
     async def _connect_new_transport(self):
         try:
@@ -132,46 +242,25 @@ class RSocketClient(RSocketBase):
         finally:
             self.stop_all_streams()
 
-    async def _keepalive_send_task(self):
-        try:
-            while True:
-                await asyncio.sleep(self._keep_alive_period.total_seconds())
-                self._send_new_keepalive()
-        except asyncio.CancelledError:
-            logger().debug('%s: Asyncio task canceled: keepalive_send', self._log_identifier())
-
     def _before_sender(self):
-        self._keepalive_task = self._start_task_if_not_closing(self._keepalive_send_task)
+        self._schedule_keepalive()
 
     async def _finally_sender(self):
-        await cancel_if_task_exists(self._keepalive_task)
+        if self._keepalive_timer is not None:
+            self._keepalive_timer.cancel()
+            self._keepalive_timer = None
 
-    def _update_last_keepalive(self):
-        self._last_server_keepalive = datetime.now()
+    def _schedule_keepalive(self):
+        self._keepalive_timer = self._timers.call_later(self._keep_alive_period.total_seconds(),
+                                                        self._keepalive_due)
+
+    def _keepalive_due(self):
+        self._send_new_keepalive()
+        self._schedule_keepalive()
 
     def is_server_alive(self) -> bool:
         return self._is_server_alive
 
-    async def _keepalive_timeout_task(self):
-        try:
-            while True:
-                await asyncio.sleep(self._max_lifetime_period.total_seconds())
-                now = datetime.now()
-                time_since_last_keepalive = now - self._last_server_keepalive
-
-                if time_since_last_keepalive > self._max_lifetime_period:
-                    self._is_server_alive = False
-                    await self._handler.on_keepalive_timeout(
-                        time_since_last_keepalive,
-                        self
-                    )
-        except asyncio.CancelledError:
-            logger().debug('%s: Asyncio task canceled: keepalive_timeout', self._log_identifier())
-
-    async def _receiver_listen(self):
-        keepalive_timeout_task = self._start_task_if_not_closing(self._keepalive_timeout_task)
-
-        try:
-            await super()._receiver_listen()
-        finally:
-            await cancel_if_task_exists(keepalive_timeout_task)
+    async def _on_keepalive_timeout(self, time_since_last_keepalive: timedelta):
+        self._is_server_alive = False
+        await super()._on_keepalive_timeout(time_since_last_keepalive)
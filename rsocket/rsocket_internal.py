@@ -10,6 +10,10 @@ class RSocketInternal(metaclass=abc.ABCMeta):
     def send_frame(self, frame: Frame):
         ...
 
+    @abc.abstractmethod
+    async def wait_writable(self):
+        ...
+
     @abc.abstractmethod
     def send_complete(self, stream_id: int):
         ...
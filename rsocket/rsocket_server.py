@@ -1,13 +1,22 @@
+import asyncio
 from asyncio import Future
 from datetime import timedelta
 from typing import Optional, Union, Callable
 
 from reactivestreams.publisher import Publisher
+from rsocket.error_codes import ErrorCode
+from rsocket.exceptions import RSocketProtocolError, RSocketTransportError
 from rsocket.extensions.mimetypes import WellKnownMimeTypes
-from rsocket.helpers import create_future
+from rsocket.frame import SetupFrame, ResumeFrame
+from rsocket.frame_builders import to_resume_ok_frame
+from rsocket.frame_fragment_cache import DEFAULT_MAXIMUM_FRAME_SIZE, DEFAULT_MAXIMUM_TOTAL_SIZE
+from rsocket.helpers import create_future, cancel_if_task_exists
+from rsocket.logger import logger
 from rsocket.payload import Payload
 from rsocket.request_handler import RequestHandler, BaseRequestHandler
+from rsocket.resume import SessionStore, ResumeBuffer, DEFAULT_RESUME_BUFFER_SIZE
 from rsocket.rsocket_base import RSocketBase
+from rsocket.send_queue import DEFAULT_HIGH_WATERMARK, DEFAULT_LOW_WATERMARK
 from rsocket.transports.transport import Transport
 
 
@@ -23,7 +32,26 @@ class RSocketServer(RSocketBase):
                  metadata_encoding: Union[str, bytes, WellKnownMimeTypes] = WellKnownMimeTypes.APPLICATION_JSON,
                  keep_alive_period: timedelta = timedelta(milliseconds=500),
                  max_lifetime_period: timedelta = timedelta(minutes=10),
-                 setup_payload: Optional[Payload] = None):
+                 setup_payload: Optional[Payload] = None,
+                 fair_send_scheduling: bool = False,
+                 send_queue_high_watermark: int = DEFAULT_HIGH_WATERMARK,
+                 send_queue_low_watermark: int = DEFAULT_LOW_WATERMARK,
+                 fragment_size: Optional[int] = None,
+                 max_fragmented_frame_size: int = DEFAULT_MAXIMUM_FRAME_SIZE,
+                 max_fragment_cache_size: int = DEFAULT_MAXIMUM_TOTAL_SIZE,
+                 session_store: Optional[SessionStore] = None,
+                 resume_buffer_size: int = DEFAULT_RESUME_BUFFER_SIZE):
+        """
+        Clients not sending a keepalive for max_lifetime_period are disconnected, or for longer if the max lifetime
+        or keepalive period announced by the client in SETUP is longer.
+        Resumable sessions are supported when a session_store is given. It must be shared by the servers
+        accepting connections for the same service, since a session is resumed on a new connection.
+        """
+
+        self._session_store = session_store
+        self._client_liveness_period: Optional[timedelta] = None
+        self._session_expiry_task: Optional[asyncio.Task] = None
+
         super().__init__(handler_factory,
                          honor_lease,
                          lease_publisher,
@@ -32,7 +60,14 @@ class RSocketServer(RSocketBase):
                          metadata_encoding,
                          keep_alive_period,
                          max_lifetime_period,
-                         setup_payload)
+                         setup_payload,
+                         fair_send_scheduling,
+                         send_queue_high_watermark,
+                         send_queue_low_watermark,
+                         fragment_size,
+                         max_fragmented_frame_size,
+                         max_fragment_cache_size,
+                         resume_buffer_size)
         self._transport = transport
 
     def _current_transport(self) -> Future:
@@ -50,3 +85,110 @@ class RSocketServer(RSocketBase):
 
     def is_server_alive(self) -> bool:
         return True
+
+    async def _on_keepalive_timeout(self, time_since_last_keepalive: timedelta):
+        logger().warning('%s: No keepalive from client for %s, closing connection',
+                         self._log_identifier(), time_since_last_keepalive)
+
+        await super()._on_keepalive_timeout(time_since_last_keepalive)
+        await self._close_transport()
+        await self._on_connection_lost(RSocketTransportError('Keepalive timeout'))
+
+    async def handle_setup(self, frame: SetupFrame):
+        await super().handle_setup(frame)
+
+        self._client_liveness_period = timedelta(milliseconds=max(frame.max_lifetime_milliseconds,
+                                                                  frame.keep_alive_milliseconds))
+
+    def _liveness_period(self) -> float:
+        if self._client_liveness_period is None:
+            return super()._liveness_period()
+
+        return max(self._max_lifetime_period, self._client_liveness_period).total_seconds()
+
+    def _accept_resumable_session(self, frame: SetupFrame) -> bool:
+        if self._session_store is None:
+            return False
+
+        token = frame.resume_identification_token
+
+        if self._session_store.get(token) is not None:
+            raise RSocketProtocolError(ErrorCode.REJECTED_SETUP, data='Resume token already in use')
+
+        self._resume_token = token
+        self._resume_buffer = ResumeBuffer(self._resume_buffer_size)
+        self._session_store.add(token, self)
+        return True
+
+    async def handle_resume(self, frame: ResumeFrame):
+        if self._session_store is None:
+            return await super().handle_resume(frame)
+
+        session = self._session_store.get(frame.resume_identification_token)
+
+        if session is None:
+            raise RSocketProtocolError(ErrorCode.REJECTED_RESUME, data='Unknown resume token')
+
+        await session._resume(self._transport, frame)
+
+        logger().debug('%s: Transport handed over to the resumed session', self._log_identifier())
+        self._is_closing = True
+        self._transport = None
+        self._sender_task.cancel()
+
+    async def _resume(self, transport, frame: ResumeFrame):
+        frames = self._resume_buffer.frames_after(frame.last_server_position)
+
+        if frames is None or frame.first_client_position > self._resume_buffer.received_position:
+            exception = RSocketProtocolError(ErrorCode.REJECTED_RESUME, data='Resume position not available')
+            await cancel_if_task_exists(self._session_expiry_task)
+            self._session_expiry_task = None
+            await self._discard_session(exception)
+            raise exception
+
+        logger().debug('%s: Resuming session', self._log_identifier())
+
+        await cancel_if_task_exists(self._session_expiry_task)
+        await cancel_if_task_exists(self._sender_task)
+        await cancel_if_task_exists(self._receiver_task)
+        await self._close_transport()
+
+        self._transport = transport
+        self._is_closing = False
+        self._is_connection_lost = False
+        self._update_last_keepalive()
+
+        await transport.send_frames([to_resume_ok_frame(self._resume_buffer.received_position)] + frames)
+        self._start_tasks()
+
+    async def _on_resumable_connection_lost(self, exception: Exception):
+        if not self._is_closing and (self._session_expiry_task is None or self._session_expiry_task.done()):
+            self._session_expiry_task = asyncio.create_task(self._expire_session(exception))
+
+    async def _expire_session(self, exception: Exception):
+        try:
+            await asyncio.sleep(self._session_store.session_timeout.total_seconds())
+
+            logger().debug('%s: Resumable session expired', self._log_identifier())
+            self._session_expiry_task = None
+            await self._discard_session(exception)
+        except asyncio.CancelledError:
+            logger().debug('%s: Asyncio task canceled: session_expiry', self._log_identifier())
+
+    async def _discard_session(self, exception: Exception):
+        """The session can no longer be resumed. Its token is freed, so the client may set up a new session."""
+
+        self._session_store.remove(self._resume_token, self)
+        self._resume_buffer = None
+        self.stop_all_streams(ErrorCode.CONNECTION_ERROR, b'Connection error')
+        await self._handler.on_connection_lost(self, exception)
+
+    async def close(self):
+        if self._session_store is not None and self._resume_token is not None:
+            self._session_store.remove(self._resume_token, self)
+
+        if self._resume_buffer is not None:
+            self.stop_all_streams()
+
+        await super().close()
+        await cancel_if_task_exists(self._session_expiry_task)
@@ -1,9 +1,11 @@
+from datetime import timedelta
 from typing import Optional
 
 import rx
 from rx import Observable
 
 from rsocket.frame import MAX_REQUEST_N
+from rsocket.helpers import timeout_arguments
 from rsocket.payload import Payload
 from rsocket.rsocket import RSocket
 from rsocket.rx_support.back_pressure_publisher import BackPressurePublisher
@@ -14,24 +16,30 @@ class RxRSocket:
     def __init__(self, rsocket: RSocket):
         self._rsocket = rsocket
 
-    def request_stream(self, request: Payload, request_limit: int = MAX_REQUEST_N) -> Observable:
-        response_publisher = self._rsocket.request_stream(request).initial_request_n(request_limit)
+    def request_stream(self,
+                       request: Payload,
+                       request_limit: int = MAX_REQUEST_N,
+                       timeout: Optional[timedelta] = None) -> Observable:
+        response_publisher = self._rsocket.request_stream(
+            request, **timeout_arguments(timeout)
+        ).initial_request_n(request_limit)
         return from_rsocket_publisher(response_publisher, request_limit)
 
-    def request_response(self, request: Payload) -> Observable:
-        return rx.from_future(self._rsocket.request_response(request))
+    def request_response(self, request: Payload, timeout: Optional[timedelta] = None) -> Observable:
+        return rx.from_future(self._rsocket.request_response(request, **timeout_arguments(timeout)))
 
     def request_channel(self,
                         request: Payload,
                         request_limit: int = MAX_REQUEST_N,
-                        observable: Optional[Observable] = None) -> Observable:
+                        observable: Optional[Observable] = None,
+                        timeout: Optional[timedelta] = None) -> Observable:
         if observable is not None:
             local_publisher = BackPressurePublisher(observable)
         else:
             local_publisher = None
 
         response_publisher = self._rsocket.request_channel(
-            request, local_publisher
+            request, local_publisher, **timeout_arguments(timeout)
         ).initial_request_n(request_limit)
         return from_rsocket_publisher(response_publisher, request_limit)
 
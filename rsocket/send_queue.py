@@ -0,0 +1,238 @@
+import asyncio
+from collections import deque
+from typing import List, Deque, Dict, Optional
+
+from rsocket.frame import Frame, FrameType, CONNECTION_STREAM_ID, HEADER_LENGTH
+
+__all__ = ['SendQueue', 'StreamRoundRobin', 'frame_send_priority']
+
+DEFAULT_QUANTUM = 16 * 1024
+DEFAULT_HIGH_WATERMARK = 1024 * 1024
+DEFAULT_LOW_WATERMARK = 256 * 1024
+
+CONNECTION_PRIORITY = 0
+CONTROL_PRIORITY = 1
+PAYLOAD_PRIORITY = 2
+
+_control_frame_types = frozenset((
+    FrameType.REQUEST_N,
+    FrameType.CANCEL,
+    FrameType.REQUEST_RESPONSE,
+    FrameType.REQUEST_FNF,
+    FrameType.REQUEST_STREAM,
+    FrameType.REQUEST_CHANNEL
+))
+
+
+def frame_send_priority(frame: Frame) -> int:
+    """
+    Connection level frames (stream 0, except metadata push) are sent first, then stream control frames,
+    then payloads and stream errors. Requests are control frames, so a REQUEST_N or CANCEL can never
+    overtake the request which opens its stream.
+    """
+
+    if frame.stream_id == CONNECTION_STREAM_ID and frame.frame_type != FrameType.METADATA_PUSH:
+        return CONNECTION_PRIORITY
+
+    if frame.frame_type in _control_frame_types:
+        return CONTROL_PRIORITY
+
+    return PAYLOAD_PRIORITY
+
+
+def frame_send_size(frame: Frame) -> int:
+    return HEADER_LENGTH + len(frame.data or b'') + len(frame.metadata or b'')
+
+
+class StreamRoundRobin:
+    """
+    Deficit round-robin over streams: each round every stream with queued frames may send up to
+    quantum bytes, plus whatever it could not use in previous rounds while its next frame was larger than that.
+    Frames of one stream keep their order.
+    """
+
+    __slots__ = (
+        '_quantum',
+        '_frames_by_stream',
+        '_deficit_by_stream',
+        '_active_streams',
+        '_frame_count'
+    )
+
+    def __init__(self, quantum: int = DEFAULT_QUANTUM):
+        self._quantum = quantum
+        self._frames_by_stream: Dict[int, Deque[Frame]] = {}
+        self._deficit_by_stream: Dict[int, int] = {}
+        self._active_streams: Deque[int] = deque()
+        self._frame_count = 0
+
+    def __len__(self):
+        return self._frame_count
+
+    def append(self, frame: Frame):
+        stream_frames = self._frames_by_stream.get(frame.stream_id)
+
+        if stream_frames is None:
+            stream_frames = self._frames_by_stream[frame.stream_id] = deque()
+            self._deficit_by_stream[frame.stream_id] = 0
+            self._active_streams.append(frame.stream_id)
+
+        stream_frames.append(frame)
+        self._frame_count += 1
+
+    def next_round(self, frames: List[Frame]):
+        """Append the frames sent in the next round (at least one frame, unless empty) to the given list."""
+
+        count_before = len(frames)
+
+        while len(frames) == count_before and self._active_streams:
+            for _ in range(len(self._active_streams)):
+                self._serve_next_stream(frames)
+
+        self._frame_count -= len(frames) - count_before
+
+    def _serve_next_stream(self, frames: List[Frame]):
+        stream_id = self._active_streams.popleft()
+        stream_frames = self._frames_by_stream[stream_id]
+        deficit = self._deficit_by_stream[stream_id] + self._quantum
+
+        while stream_frames:
+            size = frame_send_size(stream_frames[0])
+
+            if size > deficit:
+                break
+
+            deficit -= size
+            frames.append(stream_frames.popleft())
+
+        if stream_frames:
+            self._deficit_by_stream[stream_id] = deficit
+            self._active_streams.append(stream_id)
+        else:
+            del self._frames_by_stream[stream_id]
+            del self._deficit_by_stream[stream_id]
+
+
+class SendQueue:
+    """
+    Frames waiting to be sent, one FIFO per priority class. Frames within a class keep their order.
+
+    With fair_scheduling, payload class frames are instead scheduled per stream by a StreamRoundRobin,
+    and each call to get_all returns a single round of them, so a stream with a large backlog
+    does not delay the frames of other streams queued after it.
+
+    The queue stops being writable once more than high_watermark bytes are queued,
+    and becomes writable again when the sender has taken enough frames to get to low_watermark bytes or less.
+    Frames are still accepted while not writable: producers are expected to wait_writable before queueing more.
+    """
+
+    __slots__ = (
+        '_queues',
+        '_stream_scheduler',
+        '_frame_count',
+        '_frames_available',
+        '_queued_bytes',
+        '_high_watermark',
+        '_low_watermark',
+        '_writable'
+    )
+
+    def __init__(self,
+                 fair_scheduling: bool = False,
+                 quantum: int = DEFAULT_QUANTUM,
+                 high_watermark: int = DEFAULT_HIGH_WATERMARK,
+                 low_watermark: int = DEFAULT_LOW_WATERMARK):
+        if low_watermark > high_watermark:
+            raise ValueError('low_watermark must not be greater than high_watermark')
+
+        self._queues: List[Deque[Frame]] = [deque(), deque(), deque()]
+        self._stream_scheduler: Optional[StreamRoundRobin] = StreamRoundRobin(quantum) if fair_scheduling else None
+        self._frame_count = 0
+        self._frames_available = asyncio.Event()
+        self._queued_bytes = 0
+        self._high_watermark = high_watermark
+        self._low_watermark = low_watermark
+        self._writable = asyncio.Event()
+        self._writable.set()
+
+    def __len__(self):
+        return self._frame_count
+
+    @property
+    def queued_bytes(self) -> int:
+        return self._queued_bytes
+
+    def empty(self) -> bool:
+        return self._frame_count == 0
+
+    def is_writable(self) -> bool:
+        return self._writable.is_set()
+
+    async def wait_writable(self):
+        if not self._writable.is_set():
+            await self._writable.wait()
+
+    def put_nowait(self, frame: Frame):
+        self._put(frame, frame_send_priority(frame))
+
+    def put_fragments_nowait(self, fragments: List[Frame]):
+        """
+        Queue all fragments of a frame in the priority class of the first one, e.g. the remaining PAYLOAD fragments
+        of a request are control frames, so a REQUEST_N or CANCEL can not be sent before the request is complete.
+        """
+
+        priority = frame_send_priority(fragments[0])
+
+        for fragment in fragments:
+            self._put(fragment, priority)
+
+    def put_first_nowait(self, frame: Frame):
+        """Send the frame before any other queued frame."""
+
+        self._queues[CONNECTION_PRIORITY].appendleft(frame)
+        self._frame_added(frame)
+
+    def _put(self, frame: Frame, priority: int):
+        if priority == PAYLOAD_PRIORITY and self._stream_scheduler is not None:
+            self._stream_scheduler.append(frame)
+        else:
+            self._queues[priority].append(frame)
+
+        self._frame_added(frame)
+
+    def get_all_nowait(self) -> List[Frame]:
+        frames = []
+
+        for queue in self._queues:
+            frames.extend(queue)
+            queue.clear()
+
+        if self._stream_scheduler is not None:
+            self._stream_scheduler.next_round(frames)
+
+        self._frame_count -= len(frames)
+
+        if self._frame_count == 0:
+            self._frames_available.clear()
+            self._queued_bytes = 0
+        else:
+            self._queued_bytes -= sum(map(frame_send_size, frames))
+
+        if self._queued_bytes <= self._low_watermark:
+            self._writable.set()
+
+        return frames
+
+    async def get_all(self) -> List[Frame]:
+        while self._frame_count == 0:
+            await self._frames_available.wait()
+
+        return self.get_all_nowait()
+
+    def _frame_added(self, frame: Frame):
+        self._frame_count += 1
+        self._frames_available.set()
+        self._queued_bytes += frame_send_size(frame)
+
+        if self._queued_bytes > self._high_watermark:
+            self._writable.clear()
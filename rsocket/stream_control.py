@@ -1,4 +1,5 @@
-from typing import Dict
+from collections import deque
+from typing import Dict, Deque, Optional
 
 from rsocket.error_codes import ErrorCode
 from rsocket.exceptions import RSocketStreamAllocationFailure, RSocketStreamIdInUse
@@ -9,13 +10,50 @@ MAX_STREAM_ID = 0x7FFFFFFF
 
 
 class StreamControl:
+    """
+    Stream ids are allocated sequentially until the id space wraps around.
+    After that, ids released since the wrap-around are reused first, and otherwise the next free id is searched
+    for from where the sequential allocation stopped, which is amortized O(1) unless almost all ids are in use.
+    """
+
     def __init__(self, first_stream_id: int):
         self._first_stream_id = first_stream_id
         self._current_stream_id = self._first_stream_id
         self._streams: Dict[int, StreamHandler] = {}
         self._maximum_stream_id = MAX_STREAM_ID
+        self._wrapped_around = False
+        self._released_stream_ids: Deque[int] = deque()
+        self._self_allocated_streams_in_use = 0
+        self._allocated_stream_count = 0
+        self._allocation_attempts = 0
+
+    @property
+    def active_stream_count(self) -> int:
+        return len(self._streams)
+
+    @property
+    def allocated_stream_count(self) -> int:
+        """Number of stream ids allocated by this side of the connection, including released ones."""
+        return self._allocated_stream_count
+
+    @property
+    def allocation_attempts(self) -> int:
+        """Number of stream ids examined in order to allocate the allocated_stream_count ids."""
+        return self._allocation_attempts
 
     def allocate_stream(self) -> int:
+        if self._wrapped_around:
+            while self._released_stream_ids:
+                stream_id = self._released_stream_ids.popleft()
+                self._allocation_attempts += 1
+
+                if stream_id not in self._streams:
+                    self._allocated_stream_count += 1
+                    return stream_id
+
+        if self._self_allocated_streams_in_use >= self._allocatable_stream_id_count():
+            raise RSocketStreamAllocationFailure()
+
         attempt_counter = 0
 
         while (self._current_stream_id == CONNECTION_STREAM_ID
@@ -27,13 +65,35 @@ class StreamControl:
             self._increment_stream_id()
             attempt_counter += 1
 
-        return self._current_stream_id
+        stream_id = self._current_stream_id
+        self._increment_stream_id()
+        self._allocation_attempts += attempt_counter + 1
+        self._allocated_stream_count += 1
+        return stream_id
 
     def _increment_stream_id(self):
-        self._current_stream_id = (self._current_stream_id + 2) & self._maximum_stream_id
+        next_stream_id = (self._current_stream_id + 2) & self._maximum_stream_id
+
+        if next_stream_id < self._current_stream_id:
+            self._wrapped_around = True
+
+        self._current_stream_id = next_stream_id
+
+    def _is_allocated_by_self(self, stream_id: int) -> bool:
+        return (stream_id & 1) == (self._first_stream_id & 1)
+
+    def _allocatable_stream_id_count(self) -> int:
+        if self._first_stream_id & 1:
+            return (self._maximum_stream_id + 1) // 2
+
+        return self._maximum_stream_id // 2
 
     def finish_stream(self, stream_id: int):
-        self._streams.pop(stream_id, None)
+        if self._streams.pop(stream_id, None) is not None and self._is_allocated_by_self(stream_id):
+            self._self_allocated_streams_in_use -= 1
+
+            if self._wrapped_around:
+                self._released_stream_ids.append(stream_id)
 
     def register_stream(self, stream_id: int, handler: StreamHandler):
         if stream_id == CONNECTION_STREAM_ID:
@@ -42,8 +102,14 @@ class StreamControl:
         if stream_id > self._maximum_stream_id:
             raise RuntimeError('Stream id larger then maximum allowed')
 
+        if stream_id not in self._streams and self._is_allocated_by_self(stream_id):
+            self._self_allocated_streams_in_use += 1
+
         self._streams[stream_id] = handler
 
+    def get_stream(self, stream_id: int) -> Optional[StreamHandler]:
+        return self._streams.get(stream_id)
+
     def handle_stream(self, stream_id: int, frame: Frame) -> bool:
         if stream_id in self._streams:
             self._streams[stream_id].frame_received(frame)
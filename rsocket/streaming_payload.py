@@ -0,0 +1,68 @@
+import asyncio
+from collections import deque
+from typing import Deque, Optional
+
+from rsocket.fragment import Fragment
+
+__all__ = ['StreamingPayload']
+
+
+class StreamingPayload:
+    """
+    A fragmented payload delivered as soon as its first fragment is received.
+    Iterating it asynchronously returns its fragments as they arrive. Metadata is received before data,
+    and the last fragment has is_last set. Only the fragments not yet consumed are held in memory.
+
+    The connection does not wait for the payload to be consumed. If the fragments not yet consumed exceed
+    the maximum fragmented frame size of the connection, the stream is rejected with RSocketFrameFragmentLimitExceeded.
+
+    If the stream ends before the last fragment is received, iterating raises the error which ended it.
+    """
+
+    __slots__ = (
+        '_fragments',
+        '_exception',
+        '_finished',
+        '_readable',
+        'buffered_size'
+    )
+
+    def __init__(self):
+        self._fragments: Deque[Fragment] = deque()
+        self._exception: Optional[Exception] = None
+        self._finished = False
+        self._readable = asyncio.Event()
+        self.buffered_size = 0
+
+    def feed(self, fragment: Fragment):
+        self._fragments.append(fragment)
+        self.buffered_size += _fragment_size(fragment)
+        self._readable.set()
+
+    def fail(self, exception: Exception):
+        self._exception = exception
+        self._readable.set()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Fragment:
+        if self._finished:
+            raise StopAsyncIteration()
+
+        while not self._fragments:
+            if self._exception is not None:
+                self._finished = True
+                raise self._exception
+
+            self._readable.clear()
+            await self._readable.wait()
+
+        fragment = self._fragments.popleft()
+        self.buffered_size -= _fragment_size(fragment)
+        self._finished = fragment.is_last
+        return fragment
+
+
+def _fragment_size(fragment: Fragment) -> int:
+    return len(fragment.data or b'') + len(fragment.metadata or b'')
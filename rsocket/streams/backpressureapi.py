@@ -5,3 +5,14 @@ class BackpressureApi(metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def initial_request_n(self, n: int):
         ...
+
+
+class WritableSubscriber(metaclass=abc.ABCMeta):
+    """
+    A subscriber which sends what it receives over a connection.
+    Publishers should wait_writable before each on_next to not queue payloads faster than the connection sends them.
+    """
+
+    @abc.abstractmethod
+    async def wait_writable(self):
+        ...
@@ -2,22 +2,28 @@ import abc
 import asyncio
 from datetime import timedelta
 from io import BytesIO
-from typing import AsyncGenerator, Tuple, Optional
+from itertools import islice
+from typing import Optional
 
 from reactivestreams.subscriber import Subscriber
 from rsocket.frame_helpers import payload_to_n_size_fragments
 from rsocket.helpers import DefaultPublisherSubscription
 from rsocket.logger import logger
 from rsocket.payload import Payload
+from rsocket.streams.backpressureapi import WritableSubscriber
 
 __all__ = ['StreamFromGenerator']
 
-from rsocket.streams.exceptions import FinishedIterator
-
-_finished_iterator = object()
+MAX_ITEMS_PER_ITERATION = 1024
 
 
 class StreamFromGenerator(DefaultPublisherSubscription, metaclass=abc.ABCMeta):
+    """
+    Sends the (payload, is_complete) tuples of a generator to the subscriber, as many as it requested.
+
+    Without a delay between messages, all requested items (at most MAX_ITEMS_PER_ITERATION)
+    are handed to the subscriber in a single event loop iteration.
+    """
 
     def __init__(self,
                  generator,
@@ -26,14 +32,14 @@ class StreamFromGenerator(DefaultPublisherSubscription, metaclass=abc.ABCMeta):
                  on_cancel=None,
                  on_complete=None):
         self._generator = generator
-        self._queue = asyncio.Queue()
         self._fragment_size = fragment_size
-        self._delay_between_messages = delay_between_messages
+        self._delay_between_messages = delay_between_messages.total_seconds()
         self._subscriber: Optional[Subscriber] = None
         self._payload_feeder = None
         self._iteration = None
-        self._request_n_queue = asyncio.Queue()
-        self._n_feeder = None
+        self._requested = 0
+        self._request_received = asyncio.Event()
+        self._wait_writable = None
         self._on_complete = on_complete
         self._on_cancel = on_cancel
 
@@ -42,89 +48,82 @@ class StreamFromGenerator(DefaultPublisherSubscription, metaclass=abc.ABCMeta):
 
     def subscribe(self, subscriber: Subscriber):
         super().subscribe(subscriber)
+
+        if isinstance(subscriber, WritableSubscriber):
+            self._wait_writable = subscriber.wait_writable
+
         self._payload_feeder = asyncio.create_task(self.feed_subscriber())
 
     def request(self, n: int):
-        if self._n_feeder is None:
-            self._n_feeder = asyncio.create_task(self.queue_next_n())
+        self._requested += n
+        self._request_received.set()
+
+    def cancel(self):
+        self._cancel_payload_feeder()
+
+        if self._on_cancel is not None:
+            self._on_cancel()
 
-        self._request_n_queue.put_nowait(n)
+    def _cancel_payload_feeder(self):
+        if self._payload_feeder is not None:
+            self._payload_feeder.cancel()
 
-    async def queue_next_n(self):
+    async def feed_subscriber(self):
         try:
+            await self._wait_for_request()
             await self._start_generator()
 
-            while True:
-                n = await self._request_n_queue.get()
+            while not await self._send_next(min(self._requested, MAX_ITEMS_PER_ITERATION)):
+                if self._requested == 0:
+                    await self._wait_for_request()
+                elif self._delay_between_messages == 0:
+                    await asyncio.sleep(0)
 
-                async for payload, is_complete in self._generate_next_n(n):
-                    await self._queue.put((payload, is_complete))
-        except FinishedIterator:
-            self._queue.put_nowait((Payload(), True))
+            if self._on_complete is not None:
+                self._on_complete()
         except asyncio.CancelledError:
-            logger().debug('Asyncio task canceled: queue_next_n')
+            logger().debug('Asyncio task canceled: stream_from_generator')
         except Exception as exception:
             self._subscriber.on_error(exception)
-            self._cancel_feeders()
 
-    async def _generate_next_n(self, n: int) -> AsyncGenerator[Tuple[Payload, bool], None]:
-        is_complete_sent = False
-        for i in range(n):
-            next_value = next(self._iteration, _finished_iterator)
+    async def _wait_for_request(self):
+        while self._requested == 0:
+            self._request_received.clear()
+            await self._request_received.wait()
 
-            if next_value is _finished_iterator:
-                if not is_complete_sent:
-                    raise FinishedIterator()
-                return
+    async def _send_next(self, n: int) -> bool:
+        """Send up to n items, and return True once the stream is complete."""
 
-            is_complete_sent = next_value[1]
-            yield next_value
+        items = list(islice(self._iteration, n))
 
-    def cancel(self):
-        self._cancel_feeders()
+        for payload, is_complete in items:
+            if await self._send_item(payload, is_complete):
+                return True
 
-        if self._on_cancel is not None:
-            self._on_cancel()
-
-    def _cancel_feeders(self):
-        self._cancel_payload_feeder()
+        if len(items) < n:
+            self._send_to_subscriber(Payload(), True)
+            return True
 
-        self._cancel_n_feeder()
+        return False
 
-    def _cancel_payload_feeder(self):
-        if self._payload_feeder is not None:
-            self._payload_feeder.cancel()
+    async def _send_item(self, payload: Optional[Payload], is_complete: bool) -> bool:
+        if self._wait_writable is not None:
+            await self._wait_writable()
 
-    def _cancel_n_feeder(self):
-        if self._n_feeder is not None:
-            self._n_feeder.cancel()
+        self._requested -= 1
 
-    async def feed_subscriber(self):
-
-        try:
-            while True:
-                payload, is_complete = await self._queue.get()
-
-                if self._fragment_size is None:
-                    self._send_to_subscriber(payload, is_complete)
-                else:
-                    async for fragment in payload_to_n_size_fragments(BytesIO(payload.data),
-                                                                      BytesIO(payload.metadata),
-                                                                      self._fragment_size):
-                        self._send_to_subscriber(fragment, is_complete and fragment.is_last)
-
-                await asyncio.sleep(self._delay_between_messages.total_seconds())
+        if self._fragment_size is None:
+            self._send_to_subscriber(payload, is_complete)
+        else:
+            async for fragment in payload_to_n_size_fragments(BytesIO(payload.data),
+                                                              BytesIO(payload.metadata),
+                                                              self._fragment_size):
+                self._send_to_subscriber(fragment, is_complete and fragment.is_last)
 
-                self._queue.task_done()
+        if self._delay_between_messages > 0:
+            await asyncio.sleep(self._delay_between_messages)
 
-                if is_complete:
-                    if self._on_complete is not None:
-                        self._on_complete()
-                    break
-        except asyncio.CancelledError:
-            logger().debug('Asyncio task canceled: stream_from_generator')
-        finally:
-            self._cancel_n_feeder()
+        return is_complete
 
     def _send_to_subscriber(self, payload: Optional[Payload], is_complete=False):
         if payload is None and is_complete:
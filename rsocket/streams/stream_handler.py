@@ -1,4 +1,5 @@
 from abc import abstractmethod, ABCMeta
+from datetime import timedelta
 from typing import Optional
 
 from rsocket.exceptions import RSocketValueError
@@ -14,6 +15,7 @@ class StreamHandler(BackpressureApi, metaclass=ABCMeta):
         self.stream_id: Optional[int] = None
         self.socket = socket
         self._initial_request_n = MAX_REQUEST_N
+        self.streams_fragments = False
 
     @abstractmethod
     def setup(self):
@@ -34,6 +36,18 @@ class StreamHandler(BackpressureApi, metaclass=ABCMeta):
     def frame_received(self, frame: Frame):
         ...
 
+    def timeout_expired(self):
+        """Called if the stream did not finish within the timeout set with set_stream_timeout."""
+
+        self._finish_stream()
+
+    def streaming_payload_received(self, payload):
+        """
+        Called with the StreamingPayload of a fragmented payload, instead of frame_received with the reassembled
+        frame, if streams_fragments is set. Not being marked abstract, since only the handlers which set
+        streams_fragments override it, and the others never receive one.
+        """
+
     def send_cancel(self):
         """Convenience method for use by requester subclasses."""
         logger().debug('Sending cancel')
@@ -46,5 +60,9 @@ class StreamHandler(BackpressureApi, metaclass=ABCMeta):
 
         self.socket.send_frame(to_request_n_frame(self.stream_id, n))
 
+    def _start_timeout(self, timeout: Optional[timedelta]):
+        if timeout is not None:
+            self.socket.set_stream_timeout(self.stream_id, timeout)
+
     def _finish_stream(self):
         self.socket.finish_stream(self.stream_id)
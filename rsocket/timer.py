@@ -0,0 +1,127 @@
+import asyncio
+import heapq
+from itertools import count
+from math import inf
+from typing import Callable, List, Optional, Tuple
+
+from rsocket.logger import logger
+
+__all__ = ['Timer', 'TimerQueue']
+
+
+class Timer:
+    __slots__ = (
+        'deadline',
+        '_callback',
+        '_queue'
+    )
+
+    def __init__(self, deadline: float, callback: Callable[[], None], queue: 'TimerQueue'):
+        self.deadline = deadline
+        self._callback = callback
+        self._queue = queue
+
+    def is_active(self) -> bool:
+        return self._callback is not None
+
+    def cancel(self):
+        if self._callback is not None:
+            self._callback = None
+            self._queue._timer_canceled()
+
+
+class TimerQueue:
+    """
+    The timers of a connection (keepalive, liveness and request deadlines), on the event loop's monotonic clock.
+
+    Timers are kept in a heap, and a single event loop callback is scheduled at the earliest deadline,
+    so a connection costs one loop handle whatever the number of its timers, and no task.
+    Canceled timers are dropped when they reach the head of the heap, or when they make up most of it.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, Timer]] = []
+        self._sequence = count()
+        self._canceled_count = 0
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._handle_deadline = inf
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def __len__(self):
+        return len(self._heap) - self._canceled_count
+
+    def now(self) -> float:
+        return self._get_loop().time()
+
+    def call_at(self, deadline: float, callback: Callable[[], None]) -> Timer:
+        timer = Timer(deadline, callback, self)
+        heapq.heappush(self._heap, (deadline, next(self._sequence), timer))
+
+        if deadline < self._handle_deadline:
+            self._schedule(deadline)
+
+        return timer
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> Timer:
+        return self.call_at(self.now() + delay, callback)
+
+    def cancel_all(self):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+            self._handle_deadline = inf
+
+        for _, _, timer in self._heap:
+            timer._callback = None
+
+        self._heap.clear()
+        self._canceled_count = 0
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            self._loop = asyncio.get_event_loop()
+
+        return self._loop
+
+    def _schedule(self, deadline: float):
+        if self._handle is not None:
+            self._handle.cancel()
+
+        self._handle = self._get_loop().call_at(deadline, self._run_expired)
+        self._handle_deadline = deadline
+
+    def _timer_canceled(self):
+        self._canceled_count += 1
+
+        if self._canceled_count > 64 and self._canceled_count * 2 > len(self._heap):
+            self._heap[:] = [entry for entry in self._heap if entry[2].is_active()]
+            heapq.heapify(self._heap)
+            self._canceled_count = 0
+
+    def _run_expired(self):
+        now = max(self.now(), self._handle_deadline)
+        self._handle = None
+        self._handle_deadline = inf
+        heap = self._heap
+
+        while heap and heap[0][0] <= now:
+            timer = heapq.heappop(heap)[2]
+            callback = timer._callback
+
+            if callback is None:
+                self._canceled_count -= 1
+                continue
+
+            timer._callback = None
+
+            try:
+                callback()
+            except Exception:
+                logger().error('Timer callback failed', exc_info=True)
+
+        while heap and not heap[0][2].is_active():
+            heapq.heappop(heap)
+            self._canceled_count -= 1
+
+        if heap and heap[0][0] < self._handle_deadline:
+            self._schedule(heap[0][0])
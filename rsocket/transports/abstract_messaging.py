@@ -1,6 +1,8 @@
 import abc
 import asyncio
+from typing import List, Optional
 
+from rsocket.frame import Frame
 from rsocket.transports.transport import Transport
 
 
@@ -9,13 +11,45 @@ class AbstractMessagingTransport(Transport, metaclass=abc.ABCMeta):
         super().__init__()
         self._incoming_frame_queue = asyncio.Queue()
 
+    def _queue_incoming_message(self, message: bytes):
+        self._incoming_frame_queue.put_nowait(self._frame_parser.receive_frames(message, 0))
+
     async def next_frame_generator(self):
-        frame = await self._incoming_frame_queue.get()
+        frames = await self.next_frames()
 
-        if isinstance(frame, Exception):
-            raise frame
+        if frames is None:
+            return
 
         async def frame_generator():
-            yield frame
+            for frame in frames:
+                yield frame
 
         return frame_generator()
+
+    async def next_frames(self) -> Optional[List[Frame]]:
+        """
+        Drains all incoming frames already queued.
+        Queued exceptions are raised, and a queued None marks the connection as closed.
+        """
+        frames = []
+        incoming = await self._incoming_frame_queue.get()
+
+        while True:
+            if incoming is None or isinstance(incoming, Exception):
+                if frames:
+                    self._incoming_frame_queue.put_nowait(incoming)
+                    break
+
+                if incoming is None:
+                    return None
+
+                raise incoming
+
+            frames.extend(incoming)
+
+            if self._incoming_frame_queue.empty():
+                break
+
+            incoming = self._incoming_frame_queue.get_nowait()
+
+        return frames
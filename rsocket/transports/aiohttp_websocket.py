@@ -59,8 +59,7 @@ class TransportAioHttpClient(AbstractMessagingTransport):
         try:
             async for msg in self._ws:
                 if msg.type == aiohttp.WSMsgType.BINARY:
-                    async for frame in self._frame_parser.receive_data(msg.data, 0):
-                        self._incoming_frame_queue.put_nowait(frame)
+                    self._queue_incoming_message(msg.data)
         except asyncio.CancelledError:
             logger().debug('Asyncio task canceled: incoming_data_listener')
         except Exception:
@@ -92,8 +91,7 @@ class TransportAioHttpWebsocket(AbstractMessagingTransport):
     async def handle_incoming_ws_messages(self):
         try:
             async for message in self._message_generator():
-                async for frame in self._frame_parser.receive_data(message, 0):
-                    self._incoming_frame_queue.put_nowait(frame)
+                self._queue_incoming_message(message)
         except asyncio.CancelledError:
             logger().debug('Asyncio task canceled: aiohttp_handle_incoming_ws_messages')
 
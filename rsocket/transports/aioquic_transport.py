@@ -103,8 +103,7 @@ class RSocketQuicTransport(AbstractMessagingTransport):
                     self._incoming_frame_queue.put_nowait(data)
                     return
                 else:
-                    async for frame in self._frame_parser.receive_data(data, 0):
-                        self._incoming_frame_queue.put_nowait(frame)
+                    self._queue_incoming_message(data)
 
         except asyncio.CancelledError:
             logger().debug('Asyncio task canceled: incoming_data_listener')
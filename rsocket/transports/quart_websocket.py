@@ -26,8 +26,7 @@ class TransportQuartWebsocket(AbstractMessagingTransport):
             while True:
                 data = await websocket.receive()
 
-                async for frame in self._frame_parser.receive_data(data, 0):
-                    self._incoming_frame_queue.put_nowait(frame)
+                self._queue_incoming_message(data)
         except asyncio.CancelledError:
             logger().debug('Asyncio task canceled: quart_handle_incoming_ws_messages')
 
@@ -1,21 +1,44 @@
-from asyncio import StreamReader, StreamWriter
+from asyncio import StreamReader, StreamWriter, IncompleteReadError
+from typing import List, Optional
 
-from rsocket.frame import Frame, serialize_with_frame_size_header
+from rsocket.frame import Frame
+from rsocket.frame_parser import FrameParser
+from rsocket.frame_serializer import FrameSerializer
 from rsocket.helpers import wrap_transport_exception
 from rsocket.transports.transport import Transport
 
+DEFAULT_READ_BUFFER_SIZE = 64 * 1024
+
 
 class TransportTCP(Transport):
-    def __init__(self, reader: StreamReader, writer: StreamWriter):
+    """
+    Reads up to read_buffer_size bytes at a time.
+    When a partially received frame is larger than that, the rest of it is read in a single call.
+
+    See FrameParser for lazy_payloads.
+    """
+
+    def __init__(self,
+                 reader: StreamReader,
+                 writer: StreamWriter,
+                 read_buffer_size: int = DEFAULT_READ_BUFFER_SIZE,
+                 lazy_payloads: bool = False):
         super().__init__()
+        self._frame_parser = FrameParser(lazy_payloads)
         self._writer = writer
         self._reader = reader
+        self._read_buffer_size = read_buffer_size
+        self._frame_serializer = FrameSerializer()
 
     async def send_frame(self, frame: Frame):
         with wrap_transport_exception():
-            self._writer.write(serialize_with_frame_size_header(frame))
+            self._frame_serializer.write_frames(self._writer.transport, [frame])
 
-    async def on_send_queue_empty(self):
+    async def send_frames(self, frames: List[Frame]):
+        with wrap_transport_exception():
+            self._frame_serializer.write_frames(self._writer.transport, frames)
+
+    async def drain(self):
         with wrap_transport_exception():
             await self._writer.drain()
 
@@ -24,11 +47,35 @@ class TransportTCP(Transport):
         await self._writer.wait_closed()
 
     async def next_frame_generator(self):
+        data = await self._read()
+
+        if data is None:
+            return
+
+        return self._frame_parser.receive_data(data)
+
+    async def next_frames(self) -> Optional[List[Frame]]:
+        data = await self._read()
+
+        if data is None:
+            return
+
+        return self._frame_parser.receive_frames(data)
+
+    async def _read(self) -> Optional[bytes]:
         with wrap_transport_exception():
-            data = await self._reader.read(1024)
+            missing_frame_bytes = self._frame_parser.missing_frame_bytes()
+
+            try:
+                if missing_frame_bytes > self._read_buffer_size:
+                    data = await self._reader.readexactly(missing_frame_bytes)
+                else:
+                    data = await self._reader.read(self._read_buffer_size)
+            except IncompleteReadError:
+                data = None
 
             if not data:
                 self._writer.close()
                 return
 
-        return self._frame_parser.receive_data(data)
+        return data
@@ -0,0 +1,137 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Optional, List, Callable, Awaitable
+
+from rsocket.exceptions import RSocketTransportError
+from rsocket.frame import Frame
+from rsocket.frame_parser import BufferedFrameParser
+from rsocket.frame_serializer import FrameSerializer
+from rsocket.helpers import wrap_transport_exception
+from rsocket.logger import logger
+from rsocket.rsocket_server import RSocketServer
+from rsocket.transports.abstract_messaging import AbstractMessagingTransport
+
+
+@asynccontextmanager
+async def rsocket_connect(host: str, port: int, **kwargs) -> 'TransportBufferedTCP':
+    loop = asyncio.get_running_loop()
+    _, transport = await loop.create_connection(lambda: TransportBufferedTCP(**kwargs), host, port)
+
+    try:
+        yield transport
+    finally:
+        await transport.close()
+
+
+def rsocket_serve(host: str,
+                  port: int,
+                  on_server_create: Optional[Callable[[RSocketServer], None]] = None,
+                  initial_buffer_size: int = 64 * 1024,
+                  lazy_payloads: bool = False,
+                  **kwargs) -> Awaitable[asyncio.AbstractServer]:
+    def protocol_factory():
+        transport = TransportBufferedTCP(initial_buffer_size, lazy_payloads=lazy_payloads)
+        server = RSocketServer(transport, **kwargs)
+
+        if on_server_create is not None:
+            on_server_create(server)
+
+        return transport
+
+    return asyncio.get_event_loop().create_server(protocol_factory, host, port)
+
+
+class TransportBufferedTCP(AbstractMessagingTransport, asyncio.BufferedProtocol):
+    """
+    TCP transport implemented as an asyncio.BufferedProtocol.
+
+    The event loop reads directly into the preallocated buffer of the frame parser,
+    which grows to fit the largest frame received.
+
+    See FrameParser for lazy_payloads.
+    """
+
+    def __init__(self,
+                 initial_buffer_size: int = 64 * 1024,
+                 max_pending_reads: int = 64,
+                 lazy_payloads: bool = False):
+        super().__init__()
+        self._frame_parser = BufferedFrameParser(initial_buffer_size, lazy_payloads=lazy_payloads)
+        self._frame_serializer = FrameSerializer()
+        self._max_pending_reads = max_pending_reads
+        self._transport: Optional[asyncio.Transport] = None
+        self._connection_ready = asyncio.Event()
+        self._connection_closed = asyncio.Event()
+        self._reading_paused = False
+        self._write_ready = asyncio.Event()
+        self._write_ready.set()
+
+    def connection_made(self, transport: asyncio.Transport):
+        self._transport = transport
+        self._connection_ready.set()
+
+    def get_buffer(self, size_hint: int) -> memoryview:
+        return self._frame_parser.get_buffer(size_hint)
+
+    def buffer_updated(self, byte_count: int):
+        frames = self._frame_parser.buffer_updated(byte_count)
+
+        if frames:
+            self._incoming_frame_queue.put_nowait(frames)
+
+            if self._incoming_frame_queue.qsize() >= self._max_pending_reads and not self._reading_paused:
+                self._reading_paused = True
+                self._transport.pause_reading()
+
+    def eof_received(self) -> Optional[bool]:
+        self._incoming_frame_queue.put_nowait(None)
+        return False
+
+    def connection_lost(self, exception: Optional[Exception]):
+        if exception is not None:
+            logger().debug('TCP connection lost', exc_info=exception)
+            self._incoming_frame_queue.put_nowait(RSocketTransportError())
+        else:
+            self._incoming_frame_queue.put_nowait(None)
+
+        self._write_ready.set()
+        self._connection_closed.set()
+
+    def pause_writing(self):
+        self._write_ready.clear()
+
+    def resume_writing(self):
+        self._write_ready.set()
+
+    async def next_frames(self) -> Optional[List[Frame]]:
+        frames = await super().next_frames()
+
+        if self._reading_paused and self._incoming_frame_queue.empty():
+            self._reading_paused = False
+            self._transport.resume_reading()
+
+        return frames
+
+    async def send_frame(self, frame: Frame):
+        await self._connection_ready.wait()
+
+        with wrap_transport_exception():
+            self._frame_serializer.write_frames(self._transport, [frame])
+
+    async def send_frames(self, frames: List[Frame]):
+        await self._connection_ready.wait()
+
+        with wrap_transport_exception():
+            self._frame_serializer.write_frames(self._transport, frames)
+
+    async def drain(self):
+        with wrap_transport_exception():
+            if self._transport.is_closing():
+                raise ConnectionResetError('Connection lost')
+
+            await self._write_ready.wait()
+
+    async def close(self):
+        if self._transport is not None:
+            self._transport.close()
+            await self._connection_closed.wait()
@@ -1,4 +1,5 @@
 import abc
+from typing import List, Optional
 
 from rsocket.frame import Frame
 from rsocket.frame_parser import FrameParser
@@ -16,13 +17,33 @@ class Transport(metaclass=abc.ABCMeta):
     async def send_frame(self, frame: Frame):
         ...
 
+    async def send_frames(self, frames: List[Frame]):
+        """Send a batch of frames. Transports able to write several frames at once should override this."""
+        for frame in frames:
+            await self.send_frame(frame)
+
     @abc.abstractmethod
     async def next_frame_generator(self):
         ...
 
+    async def next_frames(self) -> Optional[List[Frame]]:
+        """
+        Returns all frames decoded from the next read, or None if the connection was closed.
+        Transports should override this to avoid creating a generator per read.
+        """
+        next_frame_generator = await self.next_frame_generator()
+
+        if next_frame_generator is None:
+            return None
+
+        return [frame async for frame in next_frame_generator]
+
     @abc.abstractmethod
     async def close(self):
         ...
 
+    async def drain(self):
+        """Wait until the transport is ready to accept more data to send."""
+
     async def on_send_queue_empty(self):
-        pass
+        await self.drain()
@@ -10,7 +10,7 @@ from tests.tools.fixtures_aiohttp import pipe_factory_aiohttp_websocket, aiohttp
 # noinspection PyUnresolvedReferences
 from tests.tools.fixtures_aioquic import pipe_factory_quic, generate_test_certificates
 from tests.tools.fixtures_quart import pipe_factory_quart_websocket
-from tests.tools.fixtures_tcp import pipe_factory_tcp
+from tests.tools.fixtures_tcp import pipe_factory_tcp, pipe_factory_tcp_buffered
 
 
 def setup_logging():
@@ -34,6 +34,7 @@ setup_logging()
 
 tested_transports = [
     'tcp',
+    'tcp_buffered',
     'aiohttp',
     'quart',
     'quic'
@@ -107,6 +108,8 @@ def get_pipe_factory_by_id(aiohttp_raw_server,
                            generate_test_certificates):
     if transport_id == 'tcp':
         return pipe_factory_tcp
+    if transport_id == 'tcp_buffered':
+        return pipe_factory_tcp_buffered
     if transport_id == 'quart':
         return pipe_factory_quart_websocket
     if transport_id == 'aiohttp':
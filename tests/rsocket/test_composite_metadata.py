@@ -1,10 +1,11 @@
 import pytest
 
 from rsocket.exceptions import RSocketError
-from rsocket.extensions.composite_metadata import CompositeMetadata
+from rsocket.extensions.composite_metadata import CompositeMetadata, ImmutableCompositeMetadata
+from rsocket.extensions.composite_metadata_item import CompositeMetadataItem
 from rsocket.extensions.mimetypes import WellKnownMimeTypes
 from rsocket.extensions.routing import RoutingMetadata
-from rsocket.extensions.helpers import composite, data_mime_type, data_mime_types
+from rsocket.extensions.helpers import composite, data_mime_type, data_mime_types, route, authenticate_bearer
 
 
 def test_tag_composite_metadata_too_long():
@@ -42,3 +43,47 @@ def test_data_mime_types_composite_metadata():
     assert composite_metadata.items[0].data_encodings[1] == b'text/xml'
 
     assert composite_metadata.serialize() == data
+
+
+def test_lazy_composite_metadata_parses_only_accessed_items():
+    data = composite(route('orders.create'),
+                     data_mime_type(WellKnownMimeTypes.APPLICATION_JSON),
+                     CompositeMetadataItem(b'application/custom', b'custom content'))
+
+    composite_metadata = CompositeMetadata()
+    composite_metadata.parse(data, lazy=True)
+
+    routing = composite_metadata.find_first(WellKnownMimeTypes.MESSAGE_RSOCKET_ROUTING)
+    assert isinstance(routing, RoutingMetadata)
+    assert routing.tags == [b'orders.create']
+    assert composite_metadata.find_first(WellKnownMimeTypes.MESSAGE_RSOCKET_ROUTING) is routing
+    assert composite_metadata.find_first(b'application/custom').content == b'custom content'
+    assert composite_metadata.find_first(WellKnownMimeTypes.MESSAGE_RSOCKET_AUTHENTICATION) is None
+
+    assert len(composite_metadata.items) == 3
+    assert composite_metadata.items[0] is routing
+    assert composite_metadata.items[1].data_encoding == b'application/json'
+    assert composite_metadata.serialize() == data
+
+
+def test_immutable_composite_metadata_serialized_once():
+    template = ImmutableCompositeMetadata(authenticate_bearer('token'),
+                                          data_mime_type(WellKnownMimeTypes.APPLICATION_JSON))
+
+    assert template.serialize() is template.serialize()
+    assert template.serialize() == composite(authenticate_bearer('token'),
+                                             data_mime_type(WellKnownMimeTypes.APPLICATION_JSON))
+    assert template.serialize_with(route('orders.create')) == composite(
+        authenticate_bearer('token'),
+        data_mime_type(WellKnownMimeTypes.APPLICATION_JSON),
+        route('orders.create'))
+
+
+def test_tag_longer_than_127_bytes():
+    tag = b'x' * 200
+    data = composite(route(tag))
+
+    composite_metadata = CompositeMetadata()
+    composite_metadata.parse(data)
+
+    assert composite_metadata.items[0].tags == [tag]
@@ -24,6 +24,7 @@ from rsocket.rsocket_server import RSocketServer
 from rsocket.streams.stream_from_async_generator import StreamFromAsyncGenerator
 from rsocket.transports.aiohttp_websocket import websocket_handler_factory, TransportAioHttpClient
 from rsocket.transports.aioquic_transport import rsocket_connect, rsocket_serve
+from rsocket.transports import tcp_buffered
 from rsocket.transports.tcp import TransportTCP
 from rsocket.transports.transport import Transport
 from tests.rsocket.helpers import future_from_payload, IdentifiedHandlerFactory, \
@@ -238,6 +239,44 @@ async def start_tcp_client(port: int, generate_test_certificates) -> RSocketClie
     return RSocketClient(transport_provider(), handler_factory=ClientHandler)
 
 
+async def start_tcp_buffered_service(waiter: asyncio.Event, container, port: int, generate_test_certificates):
+    index_iterator = iter(range(1, 3))
+
+    def handler_factory(*args, **kwargs):
+        return IdentifiedHandlerFactory(
+            next(index_iterator),
+            ServerHandler,
+            delay=timedelta(seconds=1)).factory(*args, **kwargs)
+
+    def on_server_create(server):
+        container.server = server
+        container.transport = server._transport
+        waiter.set()
+
+    service = await tcp_buffered.rsocket_serve(host='localhost',
+                                               port=port,
+                                               on_server_create=on_server_create,
+                                               handler_factory=handler_factory)
+    return sync(service.close)
+
+
+async def start_tcp_buffered_client(port: int, generate_test_certificates) -> RSocketClient:
+    async def transport_provider():
+        try:
+            async with tcp_buffered.rsocket_connect('localhost', port) as transport:
+                yield transport
+
+            yield FailingTransport()
+
+            async with tcp_buffered.rsocket_connect('localhost', port) as transport:
+                yield transport
+        except Exception:
+            logger().error('Client connection error', exc_info=True)
+            raise
+
+    return RSocketClient(transport_provider(), handler_factory=ClientHandler)
+
+
 async def start_websocket_service(waiter: asyncio.Event, container, port: int, generate_test_certificates):
     index_iterator = iter(range(1, 3))
 
@@ -337,6 +376,7 @@ async def start_quic_client(port: int, generate_test_certificates) -> RSocketCli
     'transport_id, start_service, start_client',
     (
             ('tcp', start_tcp_service, start_tcp_client),
+            ('tcp_buffered', start_tcp_buffered_service, start_tcp_buffered_client),
             ('aiohttp', start_websocket_service, start_websocket_client),
             ('quic', start_quic_service, start_quic_client),
     )
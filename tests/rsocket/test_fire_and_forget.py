@@ -51,3 +51,36 @@ async def test_request_fire_and_forget_awaitable_client(lazy_pipe):
 
         assert handler.received_payload.data == b'dog'
         assert handler.received_payload.metadata == b'cat'
+
+
+async def test_request_fire_and_forget_burst_sent_in_batches(lazy_pipe):
+    received_payloads = []
+    all_received = asyncio.Event()
+    request_count = 100
+
+    class Handler(BaseRequestHandler):
+        async def request_fire_and_forget(self, payload: Payload):
+            received_payloads.append(payload.data)
+
+            if len(received_payloads) == request_count:
+                all_received.set()
+
+    async with lazy_pipe(
+            server_arguments={'handler_factory': Handler}) as (server, client):
+        transport = await client._current_transport()
+        batch_sizes = []
+        send_frames = transport.send_frames
+
+        async def record_send_frames(frames):
+            batch_sizes.append(len(frames))
+            await send_frames(frames)
+
+        transport.send_frames = record_send_frames
+
+        for index in range(request_count):
+            client.fire_and_forget(Payload(str(index).encode()))
+
+        await all_received.wait()
+
+        assert received_payloads == [str(index).encode() for index in range(request_count)]
+        assert max(batch_sizes) > 1
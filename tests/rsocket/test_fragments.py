@@ -1,13 +1,28 @@
+import asyncio
+from datetime import timedelta
 from io import BytesIO
+from typing import List, Awaitable
 
 import pytest
 from asyncstdlib import builtins
 
-from rsocket.exceptions import RSocketFrameFragmentDifferentType
-from rsocket.frame import PayloadFrame, RequestResponseFrame
-from rsocket.frame_builders import to_payload_frame
+from reactivestreams.publisher import Publisher
+from reactivestreams.subscriber import DefaultSubscriber
+from reactivestreams.subscription import DefaultSubscription
+from rsocket.awaitable.awaitable_rsocket import AwaitableRSocket
+from rsocket.error_codes import ErrorCode
+from rsocket.exceptions import RSocketFrameFragmentDifferentType, RSocketFrameFragmentLimitExceeded, \
+    RSocketProtocolError
+from rsocket.frame import PayloadFrame, RequestResponseFrame, Frame, parse_or_ignore
+from rsocket.frame_builders import to_payload_frame, to_fragment_frames, to_request_channel_frame
 from rsocket.frame_fragment_cache import FrameFragmentCache
+from rsocket.fragment import Fragment
 from rsocket.frame_helpers import payload_to_n_size_fragments
+from rsocket.helpers import create_future
+from rsocket.payload import Payload
+from rsocket.request_handler import BaseRequestHandler
+from rsocket.streaming_payload import StreamingPayload
+from rsocket.streams.stream_from_generator import StreamFromGenerator
 
 
 @pytest.mark.parametrize('data, metadata, fragment_size, expected_frame_count', (
@@ -63,3 +78,334 @@ async def test_frame_building_should_fail_if_inconsistent_frame_type():
 
     with pytest.raises(RSocketFrameFragmentDifferentType):
         cache.append(second_frame)
+
+
+@pytest.mark.parametrize('data, metadata', (
+        (b'd' * 200, b''),
+        (b'', b'm' * 200),
+        (b'd' * 100, b'm' * 100),
+        (b'd' * 64, b'm' * 64),
+        (b'd' * 10, b'm' * 10),
+))
+def test_fragment_frames_reassembled(data, metadata):
+    fragment_size = 64
+    frame = to_request_channel_frame(1, Payload(data, metadata), initial_request_n=5, complete=True)
+
+    fragments = to_fragment_frames(frame, fragment_size)
+
+    assert len(fragments) == max(1, -(-(len(data) + len(metadata)) // fragment_size))
+    assert all(isinstance(fragment, PayloadFrame) for fragment in fragments[1:])
+
+    cache = FrameFragmentCache()
+    received = [cache.append(parse_or_ignore(fragment.serialize())) for fragment in fragments]
+
+    assert received[:-1] == [None] * (len(fragments) - 1)
+    assert received[-1].initial_request_n == 5
+    assert received[-1].flags_complete
+    assert (received[-1].data or b'') == data
+    assert (received[-1].metadata or b'') == metadata
+
+
+async def test_connection_fragment_size(lazy_pipe):
+    sent_frames: List[Frame] = []
+
+    class Handler(BaseRequestHandler):
+        async def request_response(self, payload: Payload) -> asyncio.Future:
+            return create_future(Payload(payload.data * 2, payload.metadata))
+
+        async def request_stream(self, payload: Payload) -> Publisher:
+            def generator():
+                for index in range(3):
+                    yield Payload(payload.data + str(index).encode()), index == 2
+
+            return StreamFromGenerator(generator)
+
+    async with lazy_pipe(
+            client_arguments={'fragment_size': 1000},
+            server_arguments={'handler_factory': Handler, 'fragment_size': 1000}) as (server, client):
+        transport = await client._current_transport()
+        send_frames = transport.send_frames
+
+        async def record_send_frames(frames):
+            sent_frames.extend(frames)
+            await send_frames(frames)
+
+        transport.send_frames = record_send_frames
+
+        data = bytes(range(256)) * 20
+        metadata = b'metadata' * 200
+
+        response = await client.request_response(Payload(data, metadata))
+        stream = await AwaitableRSocket(client).request_stream(Payload(data))
+
+        assert response.data == data * 2
+        assert response.metadata == metadata
+        assert [payload.data for payload in stream] == [data + b'0', data + b'1', data + b'2']
+        assert len([frame for frame in sent_frames if frame.flags_follows]) == 11
+
+
+def build_payload_fragments(stream_id: int, sizes: List[int]) -> List[PayloadFrame]:
+    fragments = []
+
+    for index, size in enumerate(sizes):
+        fragment = to_payload_frame(stream_id, Payload(b'x' * size), complete=index == len(sizes) - 1)
+        fragment.flags_follows = index < len(sizes) - 1
+        fragments.append(fragment)
+
+    return fragments
+
+
+def test_fragment_cache_rejects_frame_above_limit_and_ignores_remaining_fragments():
+    cache = FrameFragmentCache(maximum_frame_size=250, maximum_total_size=1000)
+
+    rejected = build_payload_fragments(1, [100, 100, 100, 100])
+    accepted = build_payload_fragments(3, [100, 100])
+
+    assert cache.append(rejected[0]) is None
+    assert cache.append(rejected[1]) is None
+    assert cache.append(accepted[0]) is None
+    assert cache.total_size == 300
+
+    with pytest.raises(RSocketFrameFragmentLimitExceeded):
+        cache.append(rejected[2])
+
+    assert cache.total_size == 100
+    assert cache.append(rejected[3]) is None
+    assert cache.append(accepted[1]).data == b'x' * 200
+    assert cache.total_size == 0
+
+    next_frame = to_payload_frame(1, Payload(b'next'))
+    assert cache.append(next_frame) is next_frame
+
+
+def test_fragment_cache_limits_total_size():
+    cache = FrameFragmentCache(maximum_frame_size=250, maximum_total_size=300)
+
+    for stream_id in (1, 3):
+        assert cache.append(build_payload_fragments(stream_id, [150, 10])[0]) is None
+
+    with pytest.raises(RSocketFrameFragmentLimitExceeded):
+        cache.append(build_payload_fragments(5, [150, 10])[0])
+
+    assert cache.total_size == 300
+
+
+@pytest.mark.allow_error_log(regex_filter='Fragmented frame exceeds')
+async def test_fragmented_response_above_limit_fails_request(lazy_pipe):
+    class Handler(BaseRequestHandler):
+        async def request_response(self, payload: Payload) -> asyncio.Future:
+            return create_future(Payload(b'x' * 10000))
+
+    async with lazy_pipe(
+            client_arguments={'max_fragmented_frame_size': 5000},
+            server_arguments={'handler_factory': Handler, 'fragment_size': 1000}) as (server, client):
+        with pytest.raises(RSocketProtocolError) as exc_info:
+            await client.request_response(Payload(b'request'))
+
+        assert exc_info.value.error_code == ErrorCode.REJECTED
+
+        assert client._frame_fragment_cache.total_size == 0
+
+
+async def test_request_stream_streams_fragments(lazy_pipe):
+    class Handler(BaseRequestHandler):
+        async def request_stream(self, payload: Payload) -> Publisher:
+            def generator():
+                yield Payload(b'a' * 5000, b'meta'), False
+                yield Payload(b'b' * 10), True
+
+            return StreamFromGenerator(generator)
+
+    received = []
+    complete = asyncio.Event()
+
+    class Subscriber(DefaultSubscriber):
+        def on_next(self, value, is_complete=False):
+            if isinstance(value, StreamingPayload):
+                received.append(asyncio.create_task(builtins.list(value)))
+            else:
+                received.append(create_future(value))
+
+            if is_complete:
+                complete.set()
+
+        def on_complete(self):
+            complete.set()
+
+    async with lazy_pipe(
+            server_arguments={'handler_factory': Handler, 'fragment_size': 1000}) as (server, client):
+        client.request_stream(Payload(b'request')).stream_fragments().subscribe(Subscriber())
+
+        await complete.wait()
+        fragment_lists = await asyncio.gather(*received)
+
+    assert len(fragment_lists) == 2
+    assert len(fragment_lists[0]) > 1
+    assert [fragment.is_last for fragment in fragment_lists[0]] == [False] * (len(fragment_lists[0]) - 1) + [True]
+    assert b''.join(fragment.metadata or b'' for fragment in fragment_lists[0]) == b'meta'
+    assert b''.join(fragment.data or b'' for fragment in fragment_lists[0]) == b'a' * 5000
+    assert fragment_lists[1].data == b'b' * 10
+    assert client._streaming_payloads == {}
+
+
+async def test_stalled_streaming_payload_does_not_block_connection(lazy_pipe_tcp):
+    class Handler(BaseRequestHandler):
+        async def request_stream(self, payload: Payload) -> Publisher:
+            def generator():
+                yield Payload(b'a' * 100000), True
+
+            return StreamFromGenerator(generator)
+
+        async def request_response(self, payload: Payload) -> Awaitable[Payload]:
+            return create_future(Payload(b'response'))
+
+    received = create_future()
+
+    class Subscriber(DefaultSubscriber):
+        def on_next(self, value, is_complete=False):
+            received.set_result(value)
+
+    async with lazy_pipe_tcp(
+            client_arguments={'keep_alive_period': timedelta(milliseconds=50)},
+            server_arguments={'handler_factory': Handler, 'fragment_size': 1000}) as (server, client):
+        client.request_stream(Payload(b'request')).stream_fragments().subscribe(Subscriber())
+        streaming_payload = await received
+
+        response = await asyncio.wait_for(client.request_response(Payload(b'request')), 5)
+
+        last_keepalive = client._last_keepalive
+        await asyncio.sleep(0.2)
+
+        assert response.data == b'response'
+        assert client._last_keepalive > last_keepalive
+
+        fragments = await builtins.list(streaming_payload)
+
+    assert b''.join(fragment.data for fragment in fragments) == b'a' * 100000
+    assert streaming_payload.buffered_size == 0
+
+
+@pytest.mark.allow_error_log(regex_filter='Fragmented frame exceeds')
+async def test_stalled_streaming_payload_above_limit_fails_stream_only(lazy_pipe_tcp):
+    class Handler(BaseRequestHandler):
+        async def request_stream(self, payload: Payload) -> Publisher:
+            def generator():
+                yield Payload(b'a' * 100000), True
+
+            return StreamFromGenerator(generator)
+
+        async def request_response(self, payload: Payload) -> Awaitable[Payload]:
+            return create_future(Payload(b'response'))
+
+    received = create_future()
+    stream_error = create_future()
+
+    class Subscriber(DefaultSubscriber):
+        def on_next(self, value, is_complete=False):
+            received.set_result(value)
+
+        def on_error(self, exception):
+            stream_error.set_result(exception)
+
+    async with lazy_pipe_tcp(
+            client_arguments={'max_fragmented_frame_size': 10000},
+            server_arguments={'handler_factory': Handler, 'fragment_size': 1000}) as (server, client):
+        client.request_stream(Payload(b'request')).stream_fragments().subscribe(Subscriber())
+        streaming_payload = await received
+
+        assert (await asyncio.wait_for(stream_error, 5)).error_code == ErrorCode.REJECTED
+
+        response = await client.request_response(Payload(b'request'))
+
+        with pytest.raises(RSocketFrameFragmentLimitExceeded):
+            async for _ in streaming_payload:
+                pass
+
+    assert response.data == b'response'
+    assert client._streaming_payloads == {}
+
+
+async def test_unfragmented_payloads_not_streamed_during_other_stream_transfer(lazy_pipe_tcp):
+    send_last_fragment = asyncio.Event()
+
+    class PartialPayloadPublisher(Publisher):
+        def subscribe(self, subscriber):
+            subscriber.on_subscribe(DefaultSubscription())
+            subscriber.socket.send_frame(to_payload_frame(subscriber.stream_id, Fragment(b'a' * 10, is_last=False)))
+            asyncio.create_task(self._send_last_fragment(subscriber))
+
+        async def _send_last_fragment(self, subscriber):
+            await send_last_fragment.wait()
+            subscriber.socket.send_frame(to_payload_frame(subscriber.stream_id, Fragment(b'b' * 10), complete=True))
+            subscriber.socket.finish_stream(subscriber.stream_id)
+
+    class Handler(BaseRequestHandler):
+        async def request_stream(self, payload: Payload) -> Publisher:
+            if payload.data == b'fragmented':
+                return PartialPayloadPublisher()
+
+            def generator():
+                for index in range(3):
+                    yield Payload(str(index).encode()), index == 2
+
+            return StreamFromGenerator(generator)
+
+    fragmented_received = create_future()
+    received = []
+    complete = asyncio.Event()
+
+    class FragmentedSubscriber(DefaultSubscriber):
+        def on_next(self, value, is_complete=False):
+            fragmented_received.set_result(value)
+
+    class Subscriber(DefaultSubscriber):
+        def on_next(self, value, is_complete=False):
+            received.append(value)
+
+            if is_complete:
+                complete.set()
+
+    async with lazy_pipe_tcp(server_arguments={'handler_factory': Handler}) as (server, client):
+        client.request_stream(Payload(b'fragmented')).stream_fragments().subscribe(FragmentedSubscriber())
+        streaming_payload = await fragmented_received
+
+        client.request_stream(Payload(b'unfragmented')).stream_fragments().subscribe(Subscriber())
+        await asyncio.wait_for(complete.wait(), 5)
+
+        send_last_fragment.set()
+        fragments = await builtins.list(streaming_payload)
+
+    assert [type(value) for value in received] == [Payload] * 3
+    assert [value.data for value in received] == [b'0', b'1', b'2']
+    assert [fragment.data for fragment in fragments] == [b'a' * 10, b'b' * 10]
+
+
+async def test_streaming_payload_fails_with_stream_error(lazy_pipe_tcp):
+    class BrokenPayloadPublisher(Publisher):
+        def subscribe(self, subscriber):
+            subscriber.on_subscribe(DefaultSubscription())
+            subscriber.socket.send_frame(to_payload_frame(subscriber.stream_id, Fragment(b'a' * 10, is_last=False)))
+            subscriber.on_error(RuntimeError('Payload source failed'))
+
+    class Handler(BaseRequestHandler):
+        async def request_stream(self, payload: Payload) -> Publisher:
+            return BrokenPayloadPublisher()
+
+    received = create_future()
+
+    class Subscriber(DefaultSubscriber):
+        def on_next(self, value, is_complete=False):
+            received.set_result(value)
+
+    async with lazy_pipe_tcp(server_arguments={'handler_factory': Handler}) as (server, client):
+        client.request_stream(Payload(b'request')).stream_fragments().subscribe(Subscriber())
+        streaming_payload = await received
+
+        fragments = []
+
+        with pytest.raises(RuntimeError) as exc_info:
+            async for fragment in streaming_payload:
+                fragments.append(fragment)
+
+    assert [fragment.data for fragment in fragments] == [b'a' * 10]
+    assert str(exc_info.value) == 'Payload source failed'
@@ -6,11 +6,13 @@ from rsocket.exceptions import RSocketProtocolError
 from rsocket.extensions.authentication_types import WellKnownAuthenticationTypes
 from rsocket.extensions.composite_metadata import CompositeMetadata
 from rsocket.extensions.mimetypes import WellKnownMimeTypes
-from rsocket.frame import (SetupFrame, CancelFrame, ErrorFrame, FrameType,
+from rsocket.frame import (ExtendedFrame, Frame, SetupFrame, CancelFrame, ErrorFrame, FrameType,
                            RequestResponseFrame, RequestNFrame, ResumeFrame,
                            MetadataPushFrame, PayloadFrame, LeaseFrame, ResumeOKFrame, KeepAliveFrame,
                            serialize_with_frame_size_header, RequestStreamFrame, RequestChannelFrame, ParseError,
                            parse_or_ignore)
+from rsocket.frame_builders import to_request_n_frame, to_payload_frame, to_cancel_frame, to_keepalive_frame
+from rsocket.payload import Payload
 from tests.rsocket.helpers import data_bits, build_frame, bits
 
 
@@ -602,3 +604,48 @@ def test_parse_broken_frame_raises_exception():
 
     with pytest.raises(RSocketProtocolError):
         parse_or_ignore(broken_frame_data)
+
+
+def test_serialize_into_reused_buffer():
+    frames = [
+        to_request_n_frame(1, 5),
+        to_payload_frame(1, Payload(b'data' * 100, b'metadata'), complete=True),
+        to_cancel_frame(3),
+        to_keepalive_frame(b'keepalive'),
+    ]
+    expected = b''.join(serialize_with_frame_size_header(frame) for frame in frames)
+
+    buffer = bytearray(b'\xff' * 2048)
+    end = 0
+
+    for frame in frames:
+        end = frame.serialize_into(buffer, end)
+
+    assert end == len(expected)
+    assert buffer[:end] == expected
+
+    end = to_payload_frame(1, Payload(b'x' * 4096), complete=True).serialize_into(buffer, 2)
+
+    assert len(buffer) == end
+    assert parse_or_ignore(buffer[5:end]).data == b'x' * 4096
+
+
+
+def test_frame_subclass_overriding_serialize():
+    class CustomRequestNFrame(RequestNFrame):
+        def serialize(self, middle=b'', flags: int = 0) -> bytes:
+            return Frame.serialize(self, b'\x00\x00\x00\x07', flags)
+
+    class CustomExtendedFrame(ExtendedFrame):
+        def parse(self, buffer: bytes, offset: int):
+            pass
+
+        def serialize(self, middle=b'', flags: int = 0) -> bytes:
+            return Frame.serialize(self, b'\x00\x00\x00\x07', flags)
+
+    frame = CustomRequestNFrame()
+    frame.stream_id = 1
+
+    assert frame.serialize() == to_request_n_frame(1, 7).serialize()
+    assert serialize_with_frame_size_header(frame) == serialize_with_frame_size_header(to_request_n_frame(1, 7))
+    assert isinstance(CustomExtendedFrame(), ExtendedFrame)
@@ -1,10 +1,15 @@
 from typing import cast
 
 import asyncstdlib
+import pytest
 
 from rsocket.extensions.authentication import AuthenticationSimple
 from rsocket.extensions.authentication_content import AuthenticationContent
 from rsocket.extensions.composite_metadata import CompositeMetadata
+from rsocket.frame import serialize_with_frame_size_header
+from rsocket.frame_builders import to_payload_frame
+from rsocket.frame_parser import BufferedFrameParser, FrameParser
+from rsocket.payload import Payload
 
 
 async def test_decode_spring_demo_auth():
@@ -31,3 +36,78 @@ async def test_multiple_frames(frame_parser):
     data += b'\x00\x00\x06\x00\x00\x00\x7b\x24\x00'
     frames = await asyncstdlib.builtins.list(frame_parser.receive_data(data))
     assert len(frames) == 5
+
+
+async def test_frames_split_between_reads(frame_parser):
+    data = b'\x00\x00\x06\x00\x00\x00\x7b\x24\x00'
+    data += b'\x00\x00\x13\x00\x00\x26\x6a\x2c\x00\x00\x00\x02\x04\x77\x65\x69'
+    data += b'\x72\x64\x6e\x65\x73\x73'
+    data += b'\x00\x00\x06\x00\x00\x00\x7b\x24\x00'
+
+    frames = []
+    for chunk_start in range(0, len(data), 4):
+        frames.extend(await asyncstdlib.builtins.list(frame_parser.receive_data(data[chunk_start:chunk_start + 4])))
+
+    assert len(frames) == 3
+    assert isinstance(frames[1].data, bytes)
+    assert frames[1].data == b'weirdness'
+
+
+def test_multiple_frames_batch(frame_parser):
+    data = b'\x00\x00\x06\x00\x00\x00\x7b\x24\x00' * 3
+    data += b'\x00\x00\x06\x00\x00'
+
+    frames = frame_parser.receive_frames(data)
+    assert len(frames) == 3
+
+    frames = frame_parser.receive_frames(b'\x00\x7b\x24\x00')
+    assert len(frames) == 1
+
+
+def test_buffered_frame_parser_grows_to_fit_frame():
+    frame_parser = BufferedFrameParser(initial_size=16, minimum_free_space=4)
+    frame = to_payload_frame(1, Payload(b'x' * 100, b'metadata'))
+    data = serialize_with_frame_size_header(frame) * 2
+
+    frames = []
+    for chunk_start in range(0, len(data), 10):
+        chunk = data[chunk_start:chunk_start + 10]
+        buffer = frame_parser.get_buffer(-1)
+        buffer[:len(chunk)] = chunk
+        frames.extend(frame_parser.buffer_updated(len(chunk)))
+
+        if chunk_start == 10:
+            assert frame_parser.missing_frame_bytes() == len(data) // 2 - 20
+
+    assert len(frames) == 2
+    assert frames[1].data == b'x' * 100
+    assert frames[1].metadata == b'metadata'
+
+
+@pytest.mark.parametrize('frame_parser', (
+        FrameParser(lazy_payloads=True),
+        BufferedFrameParser(initial_size=256, minimum_free_space=16, lazy_payloads=True),
+))
+def test_lazy_payload_data_is_not_overwritten_by_later_reads(frame_parser):
+    def serialized_payload(index: int) -> bytes:
+        return serialize_with_frame_size_header(
+            to_payload_frame(1, Payload(str(index).encode() * 30, b'metadata')))
+
+    received = []
+    for index in range(20):
+        data = serialized_payload(index)
+        received.extend(frame_parser.receive_frames(data[:7]))
+        received.extend(frame_parser.receive_frames(data[7:]))
+
+    assert len(received) == 20
+
+    for index, frame in enumerate(received):
+        assert isinstance(frame.data, memoryview)
+        assert frame.data.readonly
+        assert frame.data == str(index).encode() * 30
+        assert frame.metadata == b'metadata'
+
+    payload = Payload(received[0].data, received[0].metadata)
+    assert payload.data is received[0].data
+    assert payload.materialize().data == b'0' * 30
+    assert isinstance(payload.data, bytes)
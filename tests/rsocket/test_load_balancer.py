@@ -1,16 +1,28 @@
 import asyncio
-from contextlib import AsyncExitStack
-from typing import Tuple, Optional
+from contextlib import AsyncExitStack, asynccontextmanager
+from datetime import timedelta
+from time import monotonic
+from typing import Tuple, Optional, List, Dict, Type
+
+import pytest
 
 from reactivestreams.publisher import Publisher
 from reactivestreams.subscriber import Subscriber
 from rsocket.awaitable.awaitable_rsocket import AwaitableRSocket
+from rsocket.exceptions import RSocketNoAvailableTransport
 from rsocket.helpers import create_future
+from rsocket.load_balancer.dynamic_pool import LoadBalancerDynamicPool, SELECTION_SAMPLE_SIZE
+from rsocket.load_balancer.least_loaded import LoadBalancerLeastLoaded
 from rsocket.load_balancer.load_balancer_rsocket import LoadBalancerRSocket
+from rsocket.load_balancer.power_of_two_choices import LoadBalancerPowerOfTwoChoices
 from rsocket.load_balancer.random_client import LoadBalancerRandom
 from rsocket.load_balancer.round_robin import LoadBalancerRoundRobin
+from rsocket.load_balancer.weighted import LoadBalancerWeighted
 from rsocket.payload import Payload
+from rsocket.rsocket_client import RSocketClient
+from rsocket.rsocket_server import RSocketServer
 from rsocket.streams.stream_from_generator import StreamFromGenerator
+from rsocket.transports.tcp import TransportTCP
 from tests.conftest import pipe_factory_tcp
 from tests.rsocket.helpers import IdentifiedHandlerFactory, IdentifiedHandler, \
     to_test_response_payload
@@ -37,6 +49,12 @@ class Handler(IdentifiedHandler):
         return create_future(to_response_payload(payload, self._server_id))
 
 
+class DelayedHandler(Handler):
+    async def request_response(self, payload: Payload):
+        await asyncio.sleep(self._delay.total_seconds())
+        return create_future(to_response_payload(payload, self._server_id))
+
+
 async def test_load_balancer_round_robin_request_response(unused_tcp_port_factory):
     clients = []
     server_count = 3
@@ -123,3 +141,311 @@ async def test_load_balancer_random_request_response(unused_tcp_port_factory):
             assert '0' in server_ids
             assert '1' in server_ids
             assert '2' in server_ids
+
+
+@pytest.mark.parametrize('strategy_type', (
+        LoadBalancerLeastLoaded,
+        LoadBalancerPowerOfTwoChoices,
+))
+async def test_load_balancer_pool_prefers_fast_members(unused_tcp_port_factory, strategy_type):
+    clients = []
+    delays = [timedelta(milliseconds=200), timedelta(0), timedelta(0)]
+
+    async with AsyncExitStack() as stack:
+        for i, delay in enumerate(delays):
+            _, client = await stack.enter_async_context(
+                pipe_factory_tcp(unused_tcp_port_factory(),
+                                 server_arguments={
+                                     'handler_factory': IdentifiedHandlerFactory(i, DelayedHandler, delay).factory},
+                                 auto_connect_client=False))
+            clients.append(client)
+
+        strategy = strategy_type(clients)
+        async with LoadBalancerRSocket(strategy) as load_balancer_client:
+            server_ids = []
+
+            for _ in range(5):
+                results = await asyncio.gather(*[load_balancer_client.request_response(Payload(b'request'))
+                                                 for _ in range(6)])
+                server_ids.extend(payload.data.decode()[-1] for payload in results)
+
+            assert server_ids.count('0') < server_ids.count('1') + server_ids.count('2')
+            assert strategy.members[0].latency > strategy.members[1].latency
+            assert all(member.in_flight == 0 for member in strategy.members)
+
+
+async def test_load_balancer_pool_skips_lost_connections(unused_tcp_port_factory):
+    clients = []
+
+    async with AsyncExitStack() as stack:
+        for i in range(2):
+            _, client = await stack.enter_async_context(
+                pipe_factory_tcp(unused_tcp_port_factory(),
+                                 server_arguments={'handler_factory': IdentifiedHandlerFactory(i, Handler).factory},
+                                 auto_connect_client=False))
+            clients.append(client)
+
+        strategy = LoadBalancerPowerOfTwoChoices(clients)
+        async with LoadBalancerRSocket(strategy) as load_balancer_client:
+            await clients[0].close()
+
+            results = await asyncio.gather(*[load_balancer_client.request_response(Payload(b'request'))
+                                             for _ in range(10)])
+
+            assert all(payload.data.endswith(b'server 1') for payload in results)
+
+            await clients[1].close()
+
+            with pytest.raises(RSocketNoAvailableTransport):
+                await load_balancer_client.request_response(Payload(b'request'))
+
+
+def fault_injecting_handler(faults: Dict[int, Tuple[float, bool]]) -> Type[IdentifiedHandler]:
+    """Creates a handler class which delays or fails responses of each server as configured in faults."""
+
+    class FaultInjectingHandler(IdentifiedHandler):
+        async def request_response(self, payload: Payload):
+            delay, fail = faults[self._server_id]
+            await asyncio.sleep(delay)
+
+            if fail:
+                raise Exception('Injected failure')
+
+            return create_future(to_response_payload(payload, self._server_id))
+
+    return FaultInjectingHandler
+
+
+@pytest.mark.allow_error_log()
+async def test_load_balancer_weighted_ejects_and_recovers_failing_member(unused_tcp_port_factory):
+    clients = []
+    faults = {0: (0, True), 1: (0, False), 2: (0, False)}
+    handler = fault_injecting_handler(faults)
+
+    async def request_server_ids(count: int):
+        results = await asyncio.gather(*[load_balancer_client.request_response(Payload(b'request'))
+                                         for _ in range(count)], return_exceptions=True)
+        return [result.data.decode()[-1] if isinstance(result, Payload) else 'error' for result in results]
+
+    async with AsyncExitStack() as stack:
+        for i in range(3):
+            _, client = await stack.enter_async_context(
+                pipe_factory_tcp(unused_tcp_port_factory(),
+                                 server_arguments={
+                                     'handler_factory': IdentifiedHandlerFactory(i, handler).factory},
+                                 auto_connect_client=False))
+            clients.append(client)
+
+        strategy = LoadBalancerWeighted(clients,
+                                        minimum_samples=3,
+                                        ejection_period=timedelta(milliseconds=300),
+                                        recovery_period=timedelta(milliseconds=300),
+                                        error_rate_smoothing=0.5)
+        failing_member = strategy.members[0]
+
+        async with LoadBalancerRSocket(strategy) as load_balancer_client:
+            while failing_member.ejected_until is None:
+                await request_server_ids(1)
+
+            assert failing_member.ejection_count == 1
+            assert set(await request_server_ids(30)) <= {'1', '2'}
+
+            faults[0] = (0, False)
+            await asyncio.sleep(0.3)
+
+            await request_server_ids(1)
+            assert failing_member.ejected_until is None
+            assert failing_member.recovery_start is not None
+
+            await asyncio.sleep(0.3)
+
+            assert '0' in await request_server_ids(100)
+            assert failing_member.ejection_count == 0
+            assert failing_member.recovery_start is None
+
+
+def test_load_balancer_weighted_ejects_after_minimum_samples_failures():
+    strategy = LoadBalancerWeighted([object()], minimum_samples=5)
+    member = strategy.members[0]
+
+    for _ in range(4):
+        member._update_error_rate(1.0)
+
+    assert not strategy._is_ejected(member, monotonic())
+
+    member._update_error_rate(1.0)
+
+    assert member.error_rate == 1.0
+    assert strategy._is_ejected(member, monotonic())
+
+
+async def test_load_balancer_weighted_prefers_low_latency(unused_tcp_port_factory):
+    clients = []
+    faults = {0: (0.1, False), 1: (0, False), 2: (0, False)}
+    handler = fault_injecting_handler(faults)
+
+    async with AsyncExitStack() as stack:
+        for i in range(3):
+            _, client = await stack.enter_async_context(
+                pipe_factory_tcp(unused_tcp_port_factory(),
+                                 server_arguments={
+                                     'handler_factory': IdentifiedHandlerFactory(i, handler).factory},
+                                 auto_connect_client=False))
+            clients.append(client)
+
+        strategy = LoadBalancerWeighted(clients)
+
+        async with LoadBalancerRSocket(strategy) as load_balancer_client:
+            server_ids = []
+
+            for _ in range(10):
+                results = await asyncio.gather(*[load_balancer_client.request_response(Payload(b'request'))
+                                                 for _ in range(6)])
+                server_ids.extend(payload.data.decode()[-1] for payload in results)
+
+            assert server_ids.count('0') < len(server_ids) / 6
+
+
+@asynccontextmanager
+async def lazy_tcp_servers(ports: List[int], connection_delay=0.0):
+    """Start servers on the given ports, and return client factories which open their connection when connected."""
+
+    servers = []
+    services = []
+    connect_state = {'connecting': 0, 'max_connecting': 0}
+
+    def client_factory(port: int):
+        async def transport_provider():
+            connect_state['connecting'] += 1
+            connect_state['max_connecting'] = max(connect_state['max_connecting'], connect_state['connecting'])
+            await asyncio.sleep(connection_delay)
+            connection = await asyncio.open_connection('localhost', port)
+            connect_state['connecting'] -= 1
+            yield TransportTCP(*connection)
+
+        return lambda: RSocketClient(transport_provider())
+
+    for server_id, port in enumerate(ports):
+        def session(*connection, handler_factory=IdentifiedHandlerFactory(server_id, Handler).factory):
+            servers.append(RSocketServer(TransportTCP(*connection), handler_factory=handler_factory))
+
+        services.append(await asyncio.start_server(session, 'localhost', port))
+
+    try:
+        yield {port: client_factory(port) for port in ports}, servers, connect_state
+    finally:
+        for server in servers:
+            await server.close()
+
+        for service in services:
+            service.close()
+
+
+async def test_load_balancer_dynamic_pool_connects_lazily_and_closes_idle(unused_tcp_port_factory):
+    ports = [unused_tcp_port_factory() for _ in range(4)]
+
+    async with lazy_tcp_servers(ports) as (factories, servers, _):
+        strategy = LoadBalancerDynamicPool(factories,
+                                           idle_timeout=timedelta(milliseconds=200),
+                                           idle_check_interval=timedelta(milliseconds=50))
+
+        async with LoadBalancerRSocket(strategy) as load_balancer_client:
+            assert not any(member.is_connected() for member in strategy.members)
+
+            response = await load_balancer_client.request_response(Payload(b'request'))
+
+            assert response.data.startswith(b'data: request server')
+            assert len(servers) == 1
+
+            stream_results = await AwaitableRSocket(load_balancer_client).request_stream(Payload(b'stream'))
+
+            assert stream_results[0].data.startswith(b'data: stream server')
+
+            await asyncio.sleep(0.5)
+
+            assert not any(member.is_connected() for member in strategy.members)
+
+            response = await load_balancer_client.request_response(Payload(b'again'))
+
+            assert response.data.startswith(b'data: again server')
+
+
+async def test_load_balancer_dynamic_pool_membership_changes(unused_tcp_port_factory):
+    ports = [unused_tcp_port_factory() for _ in range(3)]
+
+    async with lazy_tcp_servers(ports) as (factories, servers, _):
+        membership_updates = asyncio.Queue()
+
+        async def discovery():
+            while True:
+                yield await membership_updates.get()
+
+        strategy = LoadBalancerDynamicPool(discovery=discovery(),
+                                           idle_check_interval=timedelta(milliseconds=50))
+
+        async with LoadBalancerRSocket(strategy) as load_balancer_client:
+            with pytest.raises(RSocketNoAvailableTransport):
+                load_balancer_client.request_response(Payload(b'request'))
+
+            membership_updates.put_nowait({ports[0]: factories[ports[0]]})
+            await asyncio.sleep(0.01)
+
+            response = await load_balancer_client.request_response(Payload(b'request'))
+            assert response.data == b'data: request server 0'
+
+            removed_member = strategy.members[0]
+            membership_updates.put_nowait({ports[1]: factories[ports[1]], ports[2]: factories[ports[2]]})
+            await asyncio.sleep(0.01)
+
+            assert sorted(member.key for member in strategy.members) == sorted(ports[1:])
+
+            responses = await asyncio.gather(*[load_balancer_client.request_response(Payload(b'request'))
+                                               for _ in range(10)])
+
+            assert {response.data[-1:] for response in responses} <= {b'1', b'2'}
+
+            await asyncio.sleep(0.2)
+
+            assert not removed_member.is_connected()
+
+            strategy.remove_member(ports[1])
+            strategy.add_member(ports[0], factories[ports[0]])
+
+            assert sorted(member.key for member in strategy.members) == sorted([ports[0], ports[2]])
+
+
+async def test_load_balancer_dynamic_pool_limits_concurrent_connects(unused_tcp_port_factory):
+    ports = [unused_tcp_port_factory() for _ in range(6)]
+
+    async with lazy_tcp_servers(ports, connection_delay=0.05) as (factories, servers, connect_state):
+        strategy = LoadBalancerDynamicPool(factories, max_concurrent_connects=2)
+
+        async with LoadBalancerRSocket(strategy):
+            await asyncio.gather(*[member.connect() for member in strategy.members])
+
+            assert all(member.is_connected() for member in strategy.members)
+            assert connect_state['max_connecting'] == 2
+
+
+def test_load_balancer_dynamic_pool_select_checks_bounded_sample_of_members():
+    def unavailable_pool(size: int) -> Tuple[LoadBalancerDynamicPool, list]:
+        pool = LoadBalancerDynamicPool({index: RSocketClient for index in range(size)})
+        checked = []
+
+        for member in pool.members:
+            member.is_available = lambda member=member: checked.append(member) and False
+
+        return pool, checked
+
+    strategy, checked_members = unavailable_pool(200)
+
+    with pytest.raises(RSocketNoAvailableTransport):
+        strategy.select()
+
+    assert 0 < len(checked_members) <= SELECTION_SAMPLE_SIZE
+
+    small_strategy, _ = unavailable_pool(3)
+    available_member = small_strategy.members[1]
+    available_member.is_available = lambda: True
+
+    assert all(small_strategy.select() is available_member for _ in range(50))
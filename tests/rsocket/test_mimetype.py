@@ -1,6 +1,7 @@
 import pytest
 
 from rsocket.exceptions import RSocketUnknownMimetype, RSocketMimetypeTooLong
+from rsocket.extensions.authentication_types import WellKnownAuthenticationTypes
 from rsocket.extensions.mimetypes import WellKnownMimeTypes
 from rsocket.helpers import serialize_well_known_encoding
 
@@ -15,3 +16,21 @@ def test_mimetype_raise_exception_on_unknown_type():
 def test_serialize_well_known_encoding_too_long():
     with pytest.raises(RSocketMimetypeTooLong):
         serialize_well_known_encoding(b'1' * 1000, WellKnownMimeTypes.get_by_name)
+
+
+@pytest.mark.parametrize('well_known_types', (
+        WellKnownMimeTypes,
+        WellKnownAuthenticationTypes,
+))
+def test_well_known_type_lookup_by_id_and_name(well_known_types):
+    for value in well_known_types:
+        assert well_known_types.require_by_id(value.value.id) is value.value
+        assert well_known_types.get_by_name(value.value.name) is value.value
+        assert well_known_types.get_by_name(bytearray(value.value.name)) is value.value
+
+    assert well_known_types.get_by_name(b'unknown/type') is None
+
+
+def test_mimetype_raise_exception_on_unassigned_id():
+    with pytest.raises(RSocketUnknownMimetype):
+        WellKnownMimeTypes.require_by_id(0x50)
@@ -2,7 +2,11 @@ from asyncio import Future
 
 import pytest
 
+from rsocket.exceptions import RSocketValueError
+from rsocket.extensions.composite_metadata import CompositeMetadata
+from rsocket.frame import FrameType
 from rsocket.helpers import create_future
+from rsocket.payload import Payload
 from rsocket.routing.request_router import RequestRouter
 
 
@@ -17,3 +21,106 @@ async def test_request_router_exception_on_duplicate_route_with_same_type():
         @router.response('path1')
         async def request_response2(payload, composite_metadata) -> Future:
             return create_future()
+
+
+async def test_request_router_binds_arguments_by_signature():
+    router = RequestRouter(lambda cls, payload: (cls, payload.data))
+
+    @router.response('mapped')
+    async def mapped(payload: dict, composite_metadata):
+        return payload, composite_metadata
+
+    @router.response('payload')
+    async def payload_only(payload: Payload):
+        return payload
+
+    @router.response('no.arguments')
+    async def no_arguments():
+        return 'result'
+
+    payload = Payload(b'data')
+    composite_metadata = CompositeMetadata()
+
+    assert await router.route(FrameType.REQUEST_RESPONSE, 'mapped', payload, composite_metadata) == (
+        (dict, b'data'), composite_metadata)
+    assert await router.route(FrameType.REQUEST_RESPONSE, 'payload', payload, composite_metadata) is payload
+    assert await router.route(FrameType.REQUEST_RESPONSE, 'no.arguments', payload, composite_metadata) == 'result'
+    assert await router.route(FrameType.REQUEST_RESPONSE, 'unknown', payload, composite_metadata) is None
+
+
+async def test_request_router_template_routes():
+    router = RequestRouter()
+
+    @router.response('user.{user_id}.orders')
+    async def user_orders(user_id):
+        return 'orders', user_id
+
+    @router.response('user.admin.orders')
+    async def admin_orders():
+        return 'admin'
+
+    @router.response('user.{user_id}.orders.{order_id}')
+    async def user_order(payload, user_id, order_id):
+        return payload.data, user_id, order_id
+
+    @router.response('metrics.*')
+    async def metric():
+        return 'metric'
+
+    @router.response('events.**')
+    async def events():
+        return 'events'
+
+    async def route(path):
+        return await router.route(FrameType.REQUEST_RESPONSE, path, Payload(b'data'), CompositeMetadata())
+
+    assert await route('user.12.orders') == ('orders', '12')
+    assert await route('user.admin.orders') == 'admin'
+    assert await route('user.12.orders.34') == (b'data', '12', '34')
+    assert await route('metrics.cpu') == 'metric'
+    assert await route('events') == 'events'
+    assert await route('events.a.b') == 'events'
+    assert await route('metrics.cpu.load') is None
+    assert await route('user.12') is None
+
+
+def test_request_router_invalid_or_duplicate_template_routes():
+    router = RequestRouter()
+
+    @router.response('user.{user_id}')
+    async def user():
+        pass
+
+    with pytest.raises(KeyError):
+        @router.response('user.{name}')
+        async def user_by_name():
+            pass
+
+    with pytest.raises(ValueError):
+        @router.response('user.id{user_id}')
+        async def invalid_segment():
+            pass
+
+    with pytest.raises(ValueError):
+        @router.response('user.**.orders')
+        async def invalid_remainder():
+            pass
+
+
+def test_request_router_rejects_reserved_or_duplicate_route_variables():
+    router = RequestRouter()
+
+    with pytest.raises(RSocketValueError):
+        @router.response('user.{payload}')
+        async def payload_variable(payload: Payload):
+            pass
+
+    with pytest.raises(RSocketValueError):
+        @router.stream('user.{composite_metadata}')
+        async def composite_metadata_variable():
+            pass
+
+    with pytest.raises(RSocketValueError):
+        @router.response('user.{user_id}.{user_id}')
+        async def duplicate_variable(user_id):
+            pass
@@ -15,6 +15,7 @@ from rsocket.payload import Payload
 from rsocket.request_handler import BaseRequestHandler
 from rsocket.rsocket_client import RSocketClient
 from rsocket.rsocket_server import RSocketServer
+from rsocket.streams.backpressureapi import WritableSubscriber
 from rsocket.streams.stream_from_async_generator import StreamFromAsyncGenerator
 from rsocket.streams.stream_from_generator import StreamFromGenerator
 
@@ -285,3 +286,84 @@ async def test_request_stream_concurrent_request_n(pipe: Tuple[RSocketServer, RS
 
     for i in range(10):
         assert received_messages[i].data == 'Feed Item: {}'.format(i).encode()
+
+
+async def test_request_streams_with_fair_send_scheduling(lazy_pipe_tcp):
+    class Handler(BaseRequestHandler):
+        async def request_stream(self, payload: Payload) -> Publisher:
+            size = int(payload.data)
+
+            def generator():
+                for index in range(20):
+                    yield Payload(b'x' * size), index == 19
+
+            return StreamFromGenerator(generator)
+
+    async with lazy_pipe_tcp(
+            server_arguments={'handler_factory': Handler, 'fair_send_scheduling': True}) as (server, client):
+        results = await asyncio.gather(AwaitableRSocket(client).request_stream(Payload(b'100000')),
+                                       AwaitableRSocket(client).request_stream(Payload(b'10')))
+
+        assert [len(payload.data) for payload in results[0]] == [100000] * 20
+        assert [len(payload.data) for payload in results[1]] == [10] * 20
+
+
+async def test_request_stream_waits_for_writable_subscriber():
+    writable = asyncio.Event()
+    received = []
+
+    class Subscriber(DefaultSubscriber, WritableSubscriber):
+        async def wait_writable(self):
+            await writable.wait()
+
+        def on_next(self, value, is_complete=False):
+            received.append(value.data)
+
+    def generator():
+        for index in range(3):
+            yield Payload(str(index).encode()), index == 2
+
+    stream = StreamFromGenerator(generator)
+    subscriber = Subscriber()
+    stream.subscribe(subscriber)
+    subscriber.subscription.request(3)
+
+    await asyncio.sleep(0.1)
+
+    assert received == []
+
+    writable.set()
+    await asyncio.sleep(0.1)
+
+    assert received == [b'0', b'1', b'2']
+
+
+@pytest.mark.parametrize('stream_class', (StreamFromGenerator, StreamFromAsyncGenerator))
+async def test_stream_from_generator_sends_only_requested_items(stream_class):
+    received = []
+
+    class Subscriber(DefaultSubscriber):
+        def on_next(self, value, is_complete=False):
+            received.append((value.data, is_complete))
+
+    def generator():
+        for index in range(5):
+            yield Payload(str(index).encode()), False
+
+    async def async_generator():
+        for item in generator():
+            yield item
+
+    stream = stream_class(generator if stream_class is StreamFromGenerator else async_generator)
+    subscriber = Subscriber()
+    stream.subscribe(subscriber)
+
+    subscriber.subscription.request(3)
+    await asyncio.sleep(0.05)
+
+    assert received == [(b'0', False), (b'1', False), (b'2', False)]
+
+    subscriber.subscription.request(10)
+    await asyncio.sleep(0.05)
+
+    assert received[3:] == [(b'3', False), (b'4', False), (None, True)]
@@ -0,0 +1,188 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from reactivestreams.publisher import Publisher
+from reactivestreams.subscriber import DefaultSubscriber
+from reactivestreams.subscription import DefaultSubscription
+from rsocket.awaitable.awaitable_rsocket import AwaitableRSocket
+from rsocket.exceptions import RSocketRequestTimeout
+from rsocket.extensions.helpers import composite, request_timeout, find_request_timeout, route
+from rsocket.extensions.mimetypes import WellKnownMimeTypes
+from rsocket.helpers import create_future
+from rsocket.load_balancer.load_balancer_rsocket import LoadBalancerRSocket
+from rsocket.load_balancer.round_robin import LoadBalancerRoundRobin
+from rsocket.payload import Payload
+from rsocket.request_handler import BaseRequestHandler
+from rsocket.streams.stream_from_async_generator import StreamFromAsyncGenerator
+from tests.rsocket.helpers import future_from_payload
+from tests.tools.fixtures_tcp import pipe_factory_tcp
+
+
+class PendingResponseHandler(BaseRequestHandler):
+    def __init__(self, socket):
+        super().__init__(socket)
+        self.response = create_future()
+        self.timeout = None
+
+    async def request_response(self, payload: Payload):
+        self.timeout = find_request_timeout(self._parse_composite_metadata(payload.metadata))
+        return self.response
+
+
+async def test_request_response_timeout_cancels_request(pipe):
+    server, client = pipe
+    handler = server._handler = PendingResponseHandler(server)
+
+    with pytest.raises(RSocketRequestTimeout):
+        await client.request_response(Payload(b'request'), timeout=timedelta(milliseconds=100))
+
+    await asyncio.sleep(0.1)
+
+    assert handler.response.cancelled()
+    assert client.active_stream_count() == 0
+    assert server.active_stream_count() == 0
+
+
+async def test_request_response_within_timeout(pipe):
+    class Handler(BaseRequestHandler):
+        async def request_response(self, payload: Payload):
+            return future_from_payload(payload)
+
+    server, client = pipe
+    server._handler = Handler(server)
+
+    response = await client.request_response(Payload(b'request'), timeout=timedelta(seconds=1))
+
+    assert response.data == b'data: request'
+    assert len(client._stream_timeouts) == 0
+
+
+async def test_request_stream_timeout(pipe):
+    class Handler(BaseRequestHandler):
+        async def request_stream(self, payload: Payload) -> Publisher:
+            async def generator():
+                for index in range(100):
+                    yield Payload(b'item %d' % index), index == 99
+
+            return StreamFromAsyncGenerator(generator, delay_between_messages=timedelta(milliseconds=50))
+
+    server, client = pipe
+    server._handler = Handler(server)
+
+    with pytest.raises(RSocketRequestTimeout):
+        await AwaitableRSocket(client).request_stream(Payload(b'request'), timeout=timedelta(milliseconds=200))
+
+    await asyncio.sleep(0.1)
+
+    assert server.active_stream_count() == 0
+
+
+async def test_responder_drops_request_after_propagated_timeout(unused_tcp_port):
+    async with pipe_factory_tcp(unused_tcp_port, client_arguments={
+        'metadata_encoding': WellKnownMimeTypes.MESSAGE_RSOCKET_COMPOSITE_METADATA
+    }) as (server, client):
+        handler = server._handler = PendingResponseHandler(server)
+
+        request = client.request_response(Payload(b'request', composite(request_timeout(timedelta(milliseconds=100)))))
+        await asyncio.sleep(0.3)
+
+        assert handler.timeout == timedelta(milliseconds=100)
+        assert handler.response.cancelled()
+        assert server.active_stream_count() == 0
+
+        request.cancel()
+        await asyncio.sleep(0.1)
+
+
+async def test_responder_timeout_before_publisher_subscribes(unused_tcp_port):
+    class RecordingSubscription(DefaultSubscription):
+        cancelled = False
+
+        def cancel(self):
+            self.cancelled = True
+
+    late_subscription = RecordingSubscription()
+    subscribed = asyncio.Event()
+
+    class LatePublisher(Publisher):
+        def subscribe(self, subscriber):
+            asyncio.get_event_loop().call_later(0.3, self._subscribe_late, subscriber)
+
+        def _subscribe_late(self, subscriber):
+            subscriber.on_subscribe(late_subscription)
+            subscribed.set()
+
+    class Handler(BaseRequestHandler):
+        async def request_stream(self, payload: Payload) -> Publisher:
+            return LatePublisher()
+
+    async with pipe_factory_tcp(unused_tcp_port, client_arguments={
+        'metadata_encoding': WellKnownMimeTypes.MESSAGE_RSOCKET_COMPOSITE_METADATA
+    }) as (server, client):
+        server._handler = Handler(server)
+        subscriber = DefaultSubscriber()
+
+        client.request_stream(Payload(b'request', composite(request_timeout(timedelta(milliseconds=100))))).subscribe(
+            subscriber)
+        await asyncio.sleep(0.2)
+
+        assert server.active_stream_count() == 0
+
+        await asyncio.wait_for(subscribed.wait(), 1)
+
+        assert late_subscription.cancelled
+
+        subscriber.subscription.cancel()
+        await asyncio.sleep(0.1)
+
+
+async def test_request_timeout_propagated_with_composite_metadata(unused_tcp_port):
+    async with pipe_factory_tcp(unused_tcp_port, client_arguments={
+        'metadata_encoding': WellKnownMimeTypes.MESSAGE_RSOCKET_COMPOSITE_METADATA
+    }) as (server, client):
+        handler = server._handler = PendingResponseHandler(server)
+
+        request = client.request_response(Payload(b'request'), timeout=timedelta(seconds=10))
+        await asyncio.sleep(0.1)
+
+        assert handler.timeout == timedelta(seconds=10)
+
+        request.cancel()
+        await asyncio.sleep(0.1)
+
+        assert handler.response.cancelled()
+
+
+async def test_request_timeout_appended_to_memoryview_metadata(unused_tcp_port):
+    async with pipe_factory_tcp(unused_tcp_port, client_arguments={
+        'metadata_encoding': WellKnownMimeTypes.MESSAGE_RSOCKET_COMPOSITE_METADATA
+    }) as (server, client):
+        handler = server._handler = PendingResponseHandler(server)
+        metadata = memoryview(composite(route('pending')))
+
+        request = client.request_response(Payload(b'request', metadata), timeout=timedelta(seconds=10))
+        await asyncio.sleep(0.1)
+
+        assert handler.timeout == timedelta(seconds=10)
+
+        request.cancel()
+        await asyncio.sleep(0.1)
+
+
+async def test_load_balancer_without_timeout_supports_rsocket_without_timeout_option():
+    class LegacyRSocket:
+        async def connect(self):
+            pass
+
+        async def close(self):
+            pass
+
+        def request_response(self, payload: Payload):
+            return create_future(payload)
+
+    async with LoadBalancerRSocket(LoadBalancerRoundRobin([LegacyRSocket()])) as load_balancer:
+        response = await load_balancer.request_response(Payload(b'request'))
+
+    assert response.data == b'request'
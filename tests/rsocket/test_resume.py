@@ -0,0 +1,237 @@
+import asyncio
+from asyncio import Event
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from typing import List
+
+import pytest
+
+from reactivestreams.publisher import Publisher
+from rsocket.awaitable.awaitable_rsocket import AwaitableRSocket
+from rsocket.error_codes import ErrorCode
+from rsocket.exceptions import RSocketProtocolError
+from rsocket.frame import KeepAliveFrame, ErrorFrame, PayloadFrame
+from rsocket.frame_builders import to_payload_frame, to_setup_frame, to_resume_frame, to_request_response_frame
+from rsocket.helpers import single_transport_provider
+from rsocket.payload import Payload
+from rsocket.request_handler import BaseRequestHandler
+from rsocket.resume import ResumeBuffer, SessionStore
+from rsocket.rsocket_client import RSocketClient
+from rsocket.rsocket_server import RSocketServer
+from rsocket.streams.stream_from_async_generator import StreamFromAsyncGenerator
+from rsocket.transports.tcp import TransportTCP
+from tests.rsocket.helpers import future_from_payload, force_closing_connection
+
+
+def test_resume_buffer_positions():
+    buffer = ResumeBuffer()
+    frames = [to_payload_frame(1, Payload(b'%d' % i)) for i in range(3)]
+    connection_frame = KeepAliveFrame()
+
+    buffer.frames_sent(frames + [connection_frame])
+
+    frame_length = frames[0].length
+    assert buffer.sent_position == 3 * frame_length
+    assert buffer.first_available_position == 0
+
+    buffer.release(frame_length)
+
+    assert buffer.first_available_position == frame_length
+    assert buffer.frames_after(2 * frame_length) == frames[2:]
+    assert buffer.frames_after(0) is None
+    assert buffer.frames_after(4 * frame_length) is None
+
+    buffer.frame_received(connection_frame)
+    buffer.frame_received(frames[0])
+
+    assert buffer.received_position == frame_length
+
+
+def test_resume_buffer_drops_oldest_frames_when_full():
+    frames = [to_payload_frame(1, Payload(b'x' * 100)) for _ in range(10)]
+
+    for frame in frames:
+        frame.serialize()
+
+    buffer = ResumeBuffer(maximum_size=frames[0].length * 4)
+    buffer.frames_sent(frames)
+
+    assert buffer.retained_size == frames[0].length * 4
+    assert buffer.frames_after(buffer.first_available_position) == frames[6:]
+    assert buffer.frames_after(0) is None
+
+
+class StreamHandler(BaseRequestHandler):
+    halfway = Event()
+    completed = Event()
+
+    async def request_response(self, payload: Payload):
+        return future_from_payload(payload)
+
+    async def request_stream(self, payload: Payload) -> Publisher:
+        async def generator():
+            for index in range(20):
+                if index == 5:
+                    self.halfway.set()
+
+                yield Payload(b'item %d' % index), index == 19
+
+        return StreamFromAsyncGenerator(generator,
+                                        delay_between_messages=timedelta(milliseconds=10),
+                                        on_complete=self.completed.set)
+
+
+class ReconnectingHandler(BaseRequestHandler):
+    async def on_connection_lost(self, rsocket, exception: Exception):
+        await rsocket.reconnect()
+
+
+@asynccontextmanager
+async def resumable_connection(port: int, session_store: SessionStore):
+    servers: List[RSocketServer] = []
+    client_transports: List[TransportTCP] = []
+
+    def session(*connection):
+        servers.append(RSocketServer(TransportTCP(*connection),
+                                     handler_factory=StreamHandler,
+                                     session_store=session_store))
+
+    async def transport_provider():
+        while True:
+            transport = TransportTCP(*await asyncio.open_connection('localhost', port))
+            client_transports.append(transport)
+            yield transport
+
+    service = await asyncio.start_server(session, 'localhost', port)
+    StreamHandler.halfway = Event()
+    StreamHandler.completed = Event()
+
+    try:
+        async with RSocketClient(transport_provider(),
+                                 handler_factory=ReconnectingHandler,
+                                 resume_token=b'session-1') as client:
+            yield client, servers, client_transports
+    finally:
+        for server in servers:
+            await server.close()
+
+        service.close()
+
+
+async def test_stream_continues_after_resume(unused_tcp_port):
+    session_store = SessionStore()
+
+    async with resumable_connection(unused_tcp_port, session_store) as (client, servers, client_transports):
+        stream = asyncio.create_task(AwaitableRSocket(client).request_stream(Payload(b'request')))
+
+        await StreamHandler.halfway.wait()
+        await force_closing_connection(client_transports[0])
+
+        received = await asyncio.wait_for(stream, 5)
+        response = await client.request_response(Payload(b'after resume'))
+
+        assert [payload.data for payload in received] == [b'item %d' % index for index in range(20)]
+        assert response.data == b'data: after resume'
+        assert len(client_transports) == 2
+        assert len(session_store) == 1
+
+        await StreamHandler.completed.wait()
+
+
+@pytest.mark.allow_error_log(regex_filter='Protocol error')
+async def test_new_session_after_rejected_resume(unused_tcp_port):
+    session_store = SessionStore()
+
+    async with resumable_connection(unused_tcp_port, session_store) as (client, servers, client_transports):
+        stream = asyncio.create_task(AwaitableRSocket(client).request_stream(Payload(b'request')))
+
+        await StreamHandler.halfway.wait()
+        await servers[0].close()  # the session is gone, as after a server restart
+
+        with pytest.raises(RSocketProtocolError) as exc_info:
+            await asyncio.wait_for(stream, 5)
+
+        response = await client.request_response(Payload(b'new session'))
+
+        assert exc_info.value.error_code == ErrorCode.CONNECTION_ERROR
+        assert response.data == b'data: new session'
+        assert len(client_transports) == 2
+
+        await StreamHandler.completed.wait()  # the closed session's responder is not canceled
+
+
+async def test_lost_session_expires(unused_tcp_port):
+    session_store = SessionStore(session_timeout=timedelta(milliseconds=100))
+    server_connection_lost = Event()
+
+    class ServerHandler(StreamHandler):
+        async def on_connection_lost(self, rsocket, exception: Exception):
+            server_connection_lost.set()
+            await rsocket.close()
+
+    def session(*connection):
+        RSocketServer(TransportTCP(*connection), handler_factory=ServerHandler, session_store=session_store)
+
+    service = await asyncio.start_server(session, 'localhost', unused_tcp_port)
+    connection = await asyncio.open_connection('localhost', unused_tcp_port)
+
+    try:
+        client = RSocketClient(single_transport_provider(TransportTCP(*connection)), resume_token=b'session-1')
+        await client.connect()
+        await client.request_response(Payload(b'request'))
+
+        assert len(session_store) == 1
+
+        await client.close()
+        await asyncio.wait_for(server_connection_lost.wait(), 5)
+
+        assert len(session_store) == 0
+    finally:
+        service.close()
+
+
+@pytest.mark.allow_error_log(regex_filter='Protocol error')
+async def test_new_session_with_same_token_after_resume_position_rejected(unused_tcp_port):
+    session_store = SessionStore()
+    servers: List[RSocketServer] = []
+
+    def session(*connection):
+        servers.append(RSocketServer(TransportTCP(*connection),
+                                     handler_factory=StreamHandler,
+                                     session_store=session_store))
+
+    def setup_frame():
+        return to_setup_frame(None, b'application/json', b'application/json',
+                              timedelta(seconds=10), timedelta(minutes=1), resume_token=b'session-1')
+
+    service = await asyncio.start_server(session, 'localhost', unused_tcp_port)
+
+    try:
+        first_transport = TransportTCP(*await asyncio.open_connection('localhost', unused_tcp_port))
+        await first_transport.send_frame(setup_frame())
+        await first_transport.send_frame(to_request_response_frame(1, Payload(b'request')))
+        await asyncio.wait_for(first_transport.next_frames(), 2)
+        await first_transport.close()
+
+        transport = TransportTCP(*await asyncio.open_connection('localhost', unused_tcp_port))
+        await transport.send_frame(to_resume_frame(b'session-1', 1000, 0))
+        frames = await asyncio.wait_for(transport.next_frames(), 2)
+
+        assert isinstance(frames[0], ErrorFrame)
+        assert frames[0].error_code == ErrorCode.REJECTED_RESUME
+        assert len(session_store) == 0
+
+        await transport.send_frame(setup_frame())
+        await transport.send_frame(to_request_response_frame(1, Payload(b'new session')))
+        frames = await asyncio.wait_for(transport.next_frames(), 2)
+
+        assert isinstance(frames[0], PayloadFrame)
+        assert frames[0].data == b'data: new session'
+        assert session_store.get(b'session-1') is servers[1]
+
+        await transport.close()
+    finally:
+        for server in servers:
+            await server.close()
+
+        service.close()
@@ -0,0 +1,116 @@
+import asyncio
+
+from rsocket.frame import CancelFrame, RequestNFrame, RequestStreamFrame, ErrorFrame, MetadataPushFrame
+from rsocket.frame_builders import to_keepalive_frame, to_payload_frame
+from rsocket.payload import Payload
+from rsocket.send_queue import SendQueue
+
+
+def test_send_queue_orders_frames_by_priority_class():
+    queue = SendQueue()
+
+    payload = to_payload_frame(1, Payload(b'data'))
+    metadata_push = MetadataPushFrame()
+    stream_error = ErrorFrame()
+    stream_error.stream_id = 1
+    request = RequestStreamFrame()
+    request.stream_id = 3
+    request_n = RequestNFrame()
+    request_n.stream_id = 3
+    keepalive = to_keepalive_frame(b'')
+    connection_error = ErrorFrame()
+    cancel = CancelFrame()
+    cancel.stream_id = 3
+
+    for frame in (payload, metadata_push, stream_error, request, request_n, keepalive, connection_error, cancel):
+        queue.put_nowait(frame)
+
+    assert len(queue) == 8
+
+    frames = queue.get_all_nowait()
+
+    assert frames == [keepalive, connection_error,
+                      request, request_n, cancel,
+                      payload, metadata_push, stream_error]
+    assert queue.empty()
+
+
+async def test_send_queue_put_first_and_wait_for_frames():
+    queue = SendQueue()
+    keepalive = to_keepalive_frame(b'')
+    priority_frame = to_keepalive_frame(b'first')
+
+    pending_get = asyncio.create_task(queue.get_all())
+    await asyncio.sleep(0)
+
+    assert not pending_get.done()
+
+    queue.put_nowait(keepalive)
+    queue.put_first_nowait(priority_frame)
+
+    assert await pending_get == [priority_frame, keepalive]
+    assert queue.empty()
+
+
+def test_fair_send_queue_interleaves_streams_by_quantum():
+    queue = SendQueue(fair_scheduling=True, quantum=100)
+
+    bulk_frames = [to_payload_frame(1, Payload(b'x' * 44)) for _ in range(6)]
+    small_frame = to_payload_frame(3, Payload(b'y'))
+    request_n = RequestNFrame()
+    request_n.stream_id = 1
+
+    for frame in bulk_frames:
+        queue.put_nowait(frame)
+
+    queue.put_nowait(small_frame)
+    queue.put_nowait(request_n)
+
+    assert queue.get_all_nowait() == [request_n] + bulk_frames[:2] + [small_frame]
+    assert queue.get_all_nowait() == bulk_frames[2:4]
+    assert queue.get_all_nowait() == bulk_frames[4:]
+    assert queue.empty()
+
+
+def test_fair_send_queue_sends_frames_larger_than_quantum():
+    queue = SendQueue(fair_scheduling=True, quantum=100)
+
+    large_frame = to_payload_frame(1, Payload(b'x' * 250))
+    small_frames = [to_payload_frame(3, Payload(b'y' * 44)) for _ in range(8)]
+
+    queue.put_nowait(large_frame)
+
+    for frame in small_frames:
+        queue.put_nowait(frame)
+
+    assert queue.get_all_nowait() == small_frames[:2]
+    assert queue.get_all_nowait() == small_frames[2:4]
+    assert queue.get_all_nowait() == [large_frame] + small_frames[4:6]
+    assert queue.get_all_nowait() == small_frames[6:]
+    assert queue.empty()
+
+
+async def test_send_queue_writable_watermarks():
+    queue = SendQueue(high_watermark=250, low_watermark=100)
+    frames = [to_payload_frame(1, Payload(b'x' * 44)) for _ in range(6)]
+
+    for frame in frames[:5]:
+        queue.put_nowait(frame)
+
+    assert queue.queued_bytes == 250
+    assert queue.is_writable()
+
+    queue.put_nowait(frames[5])
+
+    assert not queue.is_writable()
+
+    waiter = asyncio.create_task(queue.wait_writable())
+    await asyncio.sleep(0)
+
+    assert not waiter.done()
+
+    queue.get_all_nowait()
+    await waiter
+
+    assert queue.is_writable()
+    assert queue.queued_bytes == 0
@@ -77,3 +77,43 @@ def test_stream_in_use():
         control.assert_stream_id_available(1)
 
     assert exc_info.value.stream_id == 1
+
+
+def test_stream_control_reuses_released_stream_ids_after_wrap_around():
+    control = StreamControl(1)
+    control._maximum_stream_id = 0x7F
+    dummy_stream = object()
+
+    for i in range(64):
+        control.register_stream(control.allocate_stream(), dummy_stream)
+
+    assert control.active_stream_count == 64
+    assert control.allocated_stream_count == 64
+    assert control.allocation_attempts == 64
+
+    with pytest.raises(RSocketStreamAllocationFailure):
+        control.allocate_stream()
+
+    assert control.allocation_attempts == 64
+
+    for stream_id in (9, 3, 77):
+        control.finish_stream(stream_id)
+
+    assert control.active_stream_count == 61
+
+    allocated = []
+    for i in range(3):
+        allocated.append(control.allocate_stream())
+        control.register_stream(allocated[-1], dummy_stream)
+
+    assert allocated == [9, 3, 77]
+    assert control.allocation_attempts == 67
+
+
+def test_stream_control_does_not_reuse_stream_ids_before_wrap_around():
+    control = StreamControl(2)
+
+    first_stream_id = control.allocate_stream()
+    control.finish_stream(first_stream_id)
+
+    assert control.allocate_stream() == first_stream_id + 2
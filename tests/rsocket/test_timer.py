@@ -0,0 +1,123 @@
+import asyncio
+from datetime import timedelta
+
+from rsocket.frame_builders import to_setup_frame
+from rsocket.request_handler import BaseRequestHandler
+from rsocket.rsocket_server import RSocketServer
+from rsocket.timer import TimerQueue
+from rsocket.transports.tcp import TransportTCP
+
+
+async def test_timers_fire_in_deadline_order():
+    timers = TimerQueue()
+    fired = []
+    now = timers.now()
+
+    timers.call_at(now + 0.03, lambda: fired.append(3))
+    timers.call_at(now + 0.01, lambda: fired.append(1))
+    timers.call_at(now + 0.02, lambda: fired.append(2))
+
+    await asyncio.sleep(0.05)
+
+    assert fired == [1, 2, 3]
+    assert len(timers) == 0
+
+
+async def test_canceled_timer_does_not_fire():
+    timers = TimerQueue()
+    fired = []
+
+    timer = timers.call_later(0.01, lambda: fired.append(1))
+    timers.call_later(0.02, lambda: fired.append(2))
+    timer.cancel()
+
+    assert len(timers) == 1
+
+    await asyncio.sleep(0.04)
+
+    assert fired == [2]
+    assert not timer.is_active()
+
+
+async def test_canceled_timers_are_compacted():
+    timers = TimerQueue()
+
+    for timer in [timers.call_later(60, lambda: None) for _ in range(1000)]:
+        timer.cancel()
+
+    assert len(timers) == 0
+    assert len(timers._heap) < 1000
+
+    timers.cancel_all()
+
+
+async def test_timer_added_from_callback():
+    timers = TimerQueue()
+    fired = []
+
+    def first():
+        fired.append(1)
+        timers.call_later(0.01, lambda: fired.append(3))
+
+    timers.call_later(0.01, first)
+    timers.call_later(0.015, lambda: fired.append(2))
+
+    await asyncio.sleep(0.05)
+
+    assert fired == [1, 2, 3]
+
+
+async def test_server_closes_connection_without_keepalive(unused_tcp_port):
+    keepalive_timeout = asyncio.Event()
+
+    class Handler(BaseRequestHandler):
+        async def on_keepalive_timeout(self, time_since_last_keepalive: timedelta, rsocket):
+            keepalive_timeout.set()
+
+    servers = []
+
+    def session(*connection):
+        servers.append(RSocketServer(TransportTCP(*connection),
+                                     handler_factory=Handler,
+                                     max_lifetime_period=timedelta(milliseconds=200)))
+
+    service = await asyncio.start_server(session, 'localhost', unused_tcp_port)
+
+    try:
+        transport = TransportTCP(*await asyncio.open_connection('localhost', unused_tcp_port))
+        await transport.send_frame(to_setup_frame(None, b'application/json', b'application/json',
+                                                  timedelta(milliseconds=100), timedelta(milliseconds=200)))
+
+        frames = await asyncio.wait_for(transport.next_frames(), 2)
+
+        assert frames is None
+        assert keepalive_timeout.is_set()
+        assert servers[0].is_connection_lost()
+    finally:
+        service.close()
+
+
+async def test_server_honors_client_keepalive_period(unused_tcp_port):
+    servers = []
+
+    def session(*connection):
+        servers.append(RSocketServer(TransportTCP(*connection),
+                                     max_lifetime_period=timedelta(milliseconds=200)))
+
+    service = await asyncio.start_server(session, 'localhost', unused_tcp_port)
+
+    try:
+        transport = TransportTCP(*await asyncio.open_connection('localhost', unused_tcp_port))
+        await transport.send_frame(to_setup_frame(None, b'application/json', b'application/json',
+                                                  timedelta(seconds=10), timedelta(minutes=1)))
+
+        await asyncio.sleep(0.5)
+
+        assert not servers[0].is_connection_lost()
+
+        await transport.close()
+    finally:
+        for server in servers:
+            await server.close()
+
+        service.close()
@@ -1,11 +1,13 @@
 import asyncio
 from asyncio import Future
+from datetime import timedelta
 from typing import Tuple
 
 import pytest
 from rx import operators
 
 from reactivestreams.publisher import Publisher
+from rsocket.exceptions import RSocketRequestTimeout
 from rsocket.helpers import create_future, DefaultPublisherSubscription
 from rsocket.payload import Payload
 from rsocket.request_handler import BaseRequestHandler
@@ -77,3 +79,24 @@ async def test_rx_support_request_response_cancel_on_timeout(pipe: Tuple[RSocket
         ), 2)
 
     assert not response_sent
+
+
+async def test_rx_support_request_response_timeout_option(pipe: Tuple[RSocketServer, RSocketClient]):
+    server, client = pipe
+    response = create_future()
+
+    class Handler(BaseRequestHandler):
+
+        async def request_response(self, payload: Payload) -> Future:
+            return response
+
+    server.set_handler_using_factory(Handler)
+
+    rx_client = RxRSocket(client)
+
+    with pytest.raises(RSocketRequestTimeout):
+        await rx_client.request_response(Payload(b'request text'), timeout=timedelta(milliseconds=100))
+
+    await asyncio.sleep(0.1)
+
+    assert response.cancelled()
@@ -8,6 +8,7 @@ from rsocket.helpers import single_transport_provider
 from rsocket.rsocket_client import RSocketClient
 from rsocket.rsocket_server import RSocketServer
 from rsocket.transports.tcp import TransportTCP
+from rsocket.transports.tcp_buffered import rsocket_serve, rsocket_connect
 from tests.rsocket.helpers import assert_no_open_streams
 
 
@@ -65,3 +66,30 @@ async def pipe_factory_tcp(unused_tcp_port, client_arguments=None, server_argume
         assert_no_open_streams(client, server)
     finally:
         await finish()
+
+
+@asynccontextmanager
+async def pipe_factory_tcp_buffered(unused_tcp_port, client_arguments=None, server_arguments=None):
+    server: Optional[RSocketServer] = None
+    wait_for_server = Event()
+
+    def store_server(new_server):
+        nonlocal server
+        server = new_server
+        wait_for_server.set()
+
+    service = await rsocket_serve(host='localhost',
+                                  port=unused_tcp_port,
+                                  on_server_create=store_server,
+                                  **(server_arguments or {}))
+
+    async with rsocket_connect('localhost', unused_tcp_port) as transport:
+        async with RSocketClient(single_transport_provider(transport),
+                                 **(client_arguments or {})) as client:
+            await wait_for_server.wait()
+            yield server, client
+
+    await server.close()
+    assert_no_open_streams(client, server)
+
+    service.close()